@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+from game_hub.db import configure_sqlite
 
 
 class CatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "game"
+
+    def ready(self):
+        from game import checks, signals  # noqa: F401
+
+        connection_created.connect(configure_sqlite)
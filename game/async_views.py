@@ -0,0 +1,175 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import AccessMixin
+from django.contrib.auth.views import redirect_to_login
+from django.core.paginator import InvalidPage, Paginator
+from django.http import Http404
+from django.shortcuts import aget_object_or_404, redirect
+
+from game import counters
+from game.forms import RatingForm
+from game.models import PlayerRecommendation, Rating, SimilarGame
+from game.pagination import acount, aload_page
+from game.views import (
+    GameDetailView,
+    GameListView,
+    IndexView,
+    PersonalPageView,
+    game_status_links,
+)
+
+# Django runs async ORM calls on one thread per request, so gather() lets
+# independent lookups share a single hop instead of running in parallel.
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(
+                request.get_full_path(),
+                self.get_login_url(),
+                self.get_redirect_field_name(),
+            )
+        request.user = user
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncIndexView(IndexView):
+    async def get(self, request, *args, **kwargs):
+        self.counts = await counters.aget_counts()
+        return self.render_to_response(self.get_context_data(**kwargs))
+
+    def get_counts(self):
+        return self.counts
+
+
+class AsyncGameListView(GameListView):
+    async def get(self, request, *args, **kwargs):
+        not_modified = await sync_to_async(self.conditional_response)(request)
+        if not_modified is not None:
+            return not_modified
+        # The facet form validates against reference data, which may load
+        # from the database, so the queryset and context are built off the
+        # event loop.
+        self.object_list = await sync_to_async(self.get_queryset)()
+        page_size = self.get_paginate_by(self.object_list)
+        (
+            self.pagination,
+            self.filter_choices,
+            self.facet_counts,
+        ) = await asyncio.gather(
+            self.apaginate_queryset(self.object_list, page_size),
+            sync_to_async(super().get_filter_choices)(),
+            sync_to_async(super().get_facet_counts)(),
+        )
+        context = await sync_to_async(self.get_context_data)()
+        return self.add_validators(self.render_to_response(context))
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if self.uses_cursor():
+            return await sync_to_async(super().paginate_queryset)(
+                queryset, page_size
+            )
+        paginator = await acount(Paginator(queryset, page_size))
+        page_number = self.request.GET.get(self.page_kwarg) or 1
+        if page_number == "last":
+            page_number = paginator.num_pages
+        try:
+            page = await aload_page(paginator.page(page_number))
+        except InvalidPage as error:
+            raise Http404(f"Invalid page ({page_number}): {error}")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.pagination
+
+    def get_filter_choices(self):
+        return self.filter_choices
+
+    def get_facet_counts(self):
+        return self.facet_counts
+
+
+class AsyncGameDetailView(AsyncLoginRequiredMixin, GameDetailView):
+    async def get(self, request, *args, **kwargs):
+        not_modified = await sync_to_async(self.conditional_response)(request)
+        if not_modified is not None:
+            return not_modified
+        self.object = await aget_object_or_404(
+            self.get_queryset(), pk=self.kwargs["pk"]
+        )
+        *self.player_state, self.similar_games = await asyncio.gather(
+            Rating.objects.filter(
+                game=self.object, player=request.user
+            ).afirst(),
+            game_status_links(
+                request.user, self.object.pk, "wishlist_games"
+            ).aexists(),
+            game_status_links(
+                request.user, self.object.pk, "completed_games"
+            ).aexists(),
+            self.aget_similar_games(),
+        )
+        return self.add_validators(
+            self.render_to_response(self.get_context_data())
+        )
+
+    async def post(self, request, *args, **kwargs):
+        form = RatingForm(request.POST)
+        game = await aget_object_or_404(
+            self.get_queryset(), pk=self.kwargs["pk"]
+        )
+        if form.is_valid():
+            await sync_to_async(self.save_rating)(
+                game, form.cleaned_data["score"]
+            )
+            return redirect("game:game-detail", pk=game.pk)
+        return await self.get(request, *args, **kwargs)
+
+    async def aget_similar_games(self):
+        return [
+            entry
+            async for entry in SimilarGame.objects.filter(game=self.object)
+            .select_related("similar")
+            .order_by("rank")
+        ]
+
+    def get_player_state(self):
+        return self.player_state
+
+    def get_similar_games(self):
+        return self.similar_games
+
+
+class AsyncPersonalPageView(AsyncLoginRequiredMixin, PersonalPageView):
+    async def get(self, request, *args, **kwargs):
+        *self.pages, self.recommendations = await asyncio.gather(
+            self.apage(request.user.wishlist_games.all(), "wishlist_page"),
+            self.apage(request.user.completed_games.all(), "completed_page"),
+            self.aget_recommendations(),
+        )
+        return self.render_to_response(self.get_context_data(**kwargs))
+
+    async def apage(self, queryset, page_kwarg):
+        paginator = await acount(Paginator(queryset, 5))
+        return await aload_page(
+            paginator.get_page(self.request.GET.get(page_kwarg))
+        )
+
+    async def aget_recommendations(self):
+        return [
+            entry
+            async for entry in PlayerRecommendation.objects.filter(
+                player_id=self.request.user.pk
+            )
+            .select_related("game")
+            .order_by("rank")
+        ]
+
+    def get_pages(self):
+        return self.pages
+
+    def get_recommendations(self):
+        return self.recommendations
@@ -0,0 +1,199 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from difflib import SequenceMatcher
+from threading import Lock
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from game.cache_versions import get_version, increment_version
+from game.models import Game
+
+VERSION_NAMESPACE = "titles"
+MIN_FUZZY_LENGTH = 3
+FUZZY_RATIO = 0.75
+
+_cache = {}
+_lock = Lock()
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+def _remove_sorted(items, item):
+    position = bisect_left(items, item)
+    if items[position:position + 1] == [item]:
+        del items[position]
+
+
+class TitleIndex:
+    # Sorted lists searched with bisect: a prefix is a contiguous range, so
+    # a lookup costs O(log n + limit) whatever the catalog size.
+    def __init__(self, games, version=None):
+        self.version = version
+        self.titles = {}
+        self.starts = []
+        self.words = []
+        self.vocabulary = Counter()
+        for game_id, title in games:
+            self._index(game_id, title, sort=False)
+        self.starts.sort()
+        self.words.sort()
+        self.sorted_words = sorted(self.vocabulary)
+
+    def _keys(self, title):
+        normalized = normalize(title)
+        # Later word starts, so "souls" also finds "Dark Souls".
+        return normalized, [
+            normalized[match.start():]
+            for match in re.finditer(r"(?<= )\w", normalized)
+        ]
+
+    def _index(self, game_id, title, sort=True):
+        self.titles[game_id] = title
+        normalized, words = self._keys(title)
+        add = insort if sort else list.append
+        add(self.starts, (normalized, game_id))
+        for word in words:
+            add(self.words, (word, game_id))
+        for word in normalized.split():
+            if sort and not self.vocabulary[word]:
+                insort(self.sorted_words, word)
+            self.vocabulary[word] += 1
+
+    def add(self, game_id, title):
+        self.remove(game_id)
+        self._index(game_id, title)
+
+    def remove(self, game_id):
+        title = self.titles.pop(game_id, None)
+        if title is None:
+            return
+        normalized, words = self._keys(title)
+        _remove_sorted(self.starts, (normalized, game_id))
+        for word in words:
+            _remove_sorted(self.words, (word, game_id))
+        for word in normalized.split():
+            self.vocabulary[word] -= 1
+            if not self.vocabulary[word]:
+                del self.vocabulary[word]
+                _remove_sorted(self.sorted_words, word)
+
+    def _prefixed(self, keys, prefix):
+        position = bisect_left(keys, (prefix,))
+        while position < len(keys) and keys[position][0].startswith(prefix):
+            yield keys[position][1]
+            position += 1
+
+    def _lookup(self, prefix, limit, found):
+        # Titles starting with the query come before later word matches.
+        for keys in (self.starts, self.words):
+            for game_id in self._prefixed(keys, prefix):
+                if len(found) >= limit:
+                    return
+                found.setdefault(game_id, None)
+
+    def complete(self, query, limit=10):
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        found = {}
+        self._lookup(prefix, limit, found)
+        if len(found) < limit:
+            corrected = self.correct(prefix)
+            if corrected != prefix:
+                self._lookup(corrected, limit, found)
+        return [(game_id, self.titles[game_id]) for game_id in found]
+
+    def correct(self, prefix):
+        # Swaps each unknown word for the closest vocabulary word sharing
+        # its first letter; typos rarely hit the first letter.
+        words = prefix.split()
+        for position, word in enumerate(words):
+            if len(word) < MIN_FUZZY_LENGTH:
+                continue
+            if not self._known(word):
+                words[position] = self._closest(word)
+        return " ".join(words)
+
+    def _known(self, word):
+        position = bisect_left(self.sorted_words, word)
+        if position == len(self.sorted_words):
+            return False
+        return self.sorted_words[position].startswith(word)
+
+    def _closest(self, word):
+        position = bisect_left(self.sorted_words, word[0])
+        best, best_ratio = word, FUZZY_RATIO
+        while position < len(self.sorted_words):
+            candidate = self.sorted_words[position]
+            if candidate[0] != word[0]:
+                break
+            # Compare with the candidate cut to the typed length, so a
+            # partial word still matches its completion.
+            matcher = SequenceMatcher(None, word, candidate[:len(word) + 1])
+            if matcher.real_quick_ratio() >= best_ratio:
+                ratio = matcher.ratio()
+                if ratio > best_ratio:
+                    best, best_ratio = candidate[:len(word) + 1], ratio
+            position += 1
+        return best
+
+
+def _load(version):
+    return TitleIndex(
+        Game.objects.using(DEFAULT_DB_ALIAS).values_list("id", "title"),
+        version,
+    )
+
+
+def get_index():
+    version = get_version(VERSION_NAMESPACE)
+    with _lock:
+        index = _cache.get("index")
+        if index is not None and index.version == version:
+            return index
+
+    index = _load(version)
+    with _lock:
+        _cache["index"] = index
+    return index
+
+
+def _change(change):
+    # Bumped once now and once after commit, like bump_version. The writing
+    # process patches its own index only when both bumps directly follow
+    # the version it holds; otherwise another change came in between and
+    # the index is reloaded. Every other process sees the bump and reloads.
+    bumped = increment_version(VERSION_NAMESPACE)
+
+    def apply():
+        version = increment_version(VERSION_NAMESPACE)
+        with _lock:
+            index = _cache.get("index")
+            if index is None:
+                return
+            if index.version + 1 == bumped and bumped + 1 == version:
+                change(index)
+                index.version = version
+            else:
+                del _cache["index"]
+
+    transaction.on_commit(apply)
+
+
+def update_title(game_id, title):
+    _change(lambda index: index.add(game_id, title))
+
+
+def remove_title(game_id):
+    _change(lambda index: index.remove(game_id))
+
+
+def clear():
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,37 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+# Versions live in the default cache, so bumps only reach other workers
+# when CACHES points at a shared backend (see the game.W001 check).
+
+
+def _version_key(namespace):
+    return f"version:{namespace}"
+
+
+def get_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never restarts at a
+        # value some worker still holds cached data for.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def increment_version(namespace):
+    try:
+        return cache.incr(_version_key(namespace))
+    except ValueError:
+        return get_version(namespace)
+
+
+def bump_version(namespace):
+    # Bump once right away and once more after commit, so a worker that
+    # refilled its cache from pre-commit data does not keep it.
+    increment_version(namespace)
+    transaction.on_commit(lambda: increment_version(namespace))
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+
+@register(deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    # Cached reference data, id arrays, facets, titles and pages are dropped
+    # by bumping a version in the default cache; other workers only see the
+    # bump when that cache is shared.
+    if settings.DEBUG or not isinstance(caches["default"], LocMemCache):
+        return []
+    return [
+        Warning(
+            "The default cache is per-process, so cache invalidation does "
+            "not reach other workers.",
+            hint="Set CACHE_BACKEND=sqlite or run a single worker.",
+            id="game.W001",
+        )
+    ]
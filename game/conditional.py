@@ -0,0 +1,76 @@
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    # Views return the cheap values their page is built from; when the
+    # browser already holds a page for the same values it gets a 304 before
+    # the page queries run or the template renders.
+    etag = None
+    last_modified = None
+
+    def get_validators(self):
+        raise NotImplementedError
+
+    def get_user_salt(self):
+        # Pages carry the user's name and a CSRF token.
+        return self.request.user.pk, self.request.META.get("CSRF_COOKIE")
+
+    def conditional_response(self, request):
+        self.etag = self.last_modified = None
+        if request.method not in ("GET", "HEAD"):
+            return None
+        validators = self.get_validators()
+        if validators is None:
+            return None
+        timestamps = [
+            value for value in validators if isinstance(value, datetime)
+        ]
+        # A date cannot stand for version counters or flags, and a client
+        # sending only If-Modified-Since would never see them change.
+        if timestamps and all(
+            value is None or isinstance(value, datetime)
+            for value in validators
+        ):
+            self.last_modified = int(max(timestamps).timestamp())
+        digest = hashlib.md5(
+            repr((validators, self.get_user_salt())).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        # Weak, as the masked CSRF token differs between renders.
+        self.etag = f'W/"{digest}"'
+        response = get_conditional_response(
+            request, etag=self.etag, last_modified=self.last_modified
+        )
+        if response is not None:
+            self.add_validators(response)
+        return response
+
+    def add_validators(self, response):
+        if self.etag is None:
+            return response
+        response.headers.setdefault("ETag", self.etag)
+        if self.last_modified is not None:
+            response.headers.setdefault(
+                "Last-Modified", http_date(self.last_modified)
+            )
+        # Always revalidate, so a browser never shows a page it cached
+        # before the data changed.
+        patch_cache_control(response, no_cache=True)
+        if self.request.user.is_authenticated:
+            patch_cache_control(response, private=True)
+        patch_vary_headers(response, ["Cookie"])
+        return response
+
+    def get(self, request, *args, **kwargs):
+        response = self.conditional_response(request)
+        if response is not None:
+            return response
+        return self.add_validators(super().get(request, *args, **kwargs))
@@ -0,0 +1,53 @@
+from asgiref.sync import sync_to_async
+from django.db.models import F
+
+from game.models import Game, Genre, Player, Publisher, SiteCounter
+
+COUNTED_MODELS = {
+    "players": Player,
+    "games": Game,
+    "publishers": Publisher,
+    "genres": Genre,
+}
+
+_NAMES = {model: name for name, model in COUNTED_MODELS.items()}
+
+
+def adjust(model, delta):
+    name = _NAMES[model]
+    updated = SiteCounter.objects.filter(name=name).update(
+        value=F("value") + delta
+    )
+    if not updated:
+        reconcile([name])
+
+
+def reconcile(names=None):
+    counts = {}
+    for name in names or COUNTED_MODELS:
+        counts[name] = COUNTED_MODELS[name].objects.count()
+        SiteCounter.objects.update_or_create(
+            name=name, defaults={"value": counts[name]}
+        )
+    return counts
+
+
+def get_counts():
+    counts = dict(SiteCounter.objects.values_list("name", "value"))
+    missing = [name for name in COUNTED_MODELS if name not in counts]
+    if missing:
+        counts.update(reconcile(missing))
+    return counts
+
+
+async def aget_counts():
+    counts = {
+        name: value
+        async for name, value in SiteCounter.objects.values_list(
+            "name", "value"
+        )
+    }
+    missing = [name for name in COUNTED_MODELS if name not in counts]
+    if missing:
+        counts.update(await sync_to_async(reconcile)(missing))
+    return counts
@@ -0,0 +1,125 @@
+from threading import Lock
+
+import numpy as np
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from game.cache_versions import get_version
+from game.models import Game
+from game.similarity import as_array
+
+VERSION_NAMESPACE = "facets"
+FACETS = ("genre", "publisher", "platform", "year")
+
+_cache = {}
+_lock = Lock()
+
+
+def apply_filters(queryset, filters):
+    for condition in filters.values():
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+class FacetIndex:
+    # Column arrays of the whole catalog, kept per process and rebuilt when
+    # a game changes; counting a facet is then a mask and np.unique instead
+    # of a grouped query.
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        # One transaction, so both reads come from the same snapshot.
+        with transaction.atomic(using=using):
+            games = as_array(
+                Game.objects.using(using).order_by("id"),
+                ["id", "genre_id", "publisher_id", "release_year"],
+            )
+            links = as_array(
+                Game.platform.through.objects.using(using).all(),
+                ["game_id", "platform_id"],
+            )
+        # A link to a missing game would land on a neighbouring row.
+        links = links[np.isin(links[:, 0], games[:, 0])]
+        self.ids = games[:, 0]
+        self.columns = {
+            "genre": games[:, 1],
+            "publisher": games[:, 2],
+            "year": games[:, 3],
+        }
+        self.link_rows = np.searchsorted(self.ids, links[:, 0])
+        self.link_platforms = links[:, 1]
+
+    def masks(self, selection):
+        masks = {}
+        for name in ("genre", "publisher"):
+            if selection.get(name):
+                masks[name] = np.isin(self.columns[name], selection[name])
+        if selection.get("platform"):
+            mask = np.zeros(len(self.ids), dtype=bool)
+            matching = np.isin(self.link_platforms, selection["platform"])
+            mask[self.link_rows[matching]] = True
+            masks["platform"] = mask
+        years = self.columns["year"]
+        year_mask = np.ones(len(self.ids), dtype=bool)
+        if selection.get("year_from") is not None:
+            year_mask &= years >= selection["year_from"]
+        if selection.get("year_to") is not None:
+            year_mask &= years <= selection["year_to"]
+        if not year_mask.all():
+            masks["year"] = year_mask
+        return masks
+
+    def counts(self, selection, game_ids=None):
+        if game_ids is None:
+            base = np.ones(len(self.ids), dtype=bool)
+        else:
+            base = np.isin(self.ids, np.fromiter(game_ids, dtype=np.int64))
+        masks = self.masks(selection)
+        counts = {}
+        # Each facet is counted with every filter but its own, so its
+        # options show how many games picking them would match.
+        for name in FACETS:
+            mask = base.copy()
+            for other, other_mask in masks.items():
+                if other != name:
+                    mask &= other_mask
+            if name == "platform":
+                values = self.link_platforms[mask[self.link_rows]]
+            else:
+                values = self.columns[name][mask]
+            keys, totals = np.unique(values, return_counts=True)
+            counts[name] = dict(zip(keys.tolist(), totals.tolist()))
+        return counts
+
+
+def get_index():
+    version = get_version(VERSION_NAMESPACE)
+    with _lock:
+        cached = _cache.get("index")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    index = FacetIndex()
+    with _lock:
+        _cache["index"] = (version, index)
+    return index
+
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+
+def decades(year_counts):
+    buckets = {}
+    for year, count in year_counts.items():
+        start = year - year % 10
+        buckets[start] = buckets.get(start, 0) + count
+    return [
+        (start, start + 9, count) for start, count in sorted(buckets.items())
+    ]
+
+
+def options(objects, counts, selected):
+    return [
+        (obj, counts.get(obj.pk, 0), obj.pk in selected)
+        for obj in objects
+        if counts.get(obj.pk) or obj.pk in selected
+    ]
@@ -2,7 +2,9 @@ from datetime import timedelta
 
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
+from django.forms.models import ModelChoiceIterator
 from django.forms import DateInput
+from django.db.models import Q
 from django.utils import timezone
 
 from game.models import (
@@ -13,6 +15,8 @@ from game.models import (
     Publisher,
     Rating,
 )
+from game import reference_data
+from game.search import search_games
 
 
 class RatingForm(forms.ModelForm):
@@ -24,8 +28,33 @@ class RatingForm(forms.ModelForm):
         }
 
 
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    def objects(self):
+        return reference_data.get_for_model(self.queryset.model)
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.objects():
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(self.objects()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.objects())
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
 class GameCreateForm(forms.ModelForm):
-    platform = forms.ModelMultipleChoiceField(
+    platform = CachedModelMultipleChoiceField(
         queryset=Platform.objects.all(),
         widget=forms.CheckboxSelectMultiple,
     )
@@ -42,6 +71,10 @@ class GameCreateForm(forms.ModelForm):
             "image",
             "link",
         )
+        field_classes = {
+            "genre": CachedModelChoiceField,
+            "publisher": CachedModelChoiceField,
+        }
 
 
 class GameSearchForm(forms.Form):
@@ -52,6 +85,60 @@ class GameSearchForm(forms.Form):
         widget=forms.TextInput(attrs={"placeholder": "Search by title"}),
     )
 
+    def search(self, queryset):
+        if not self.is_valid():
+            return queryset
+        return search_games(queryset, self.cleaned_data["title"])
+
+
+def reference_choices(name):
+    return lambda: [(obj.pk, str(obj)) for obj in reference_data.get(name)]
+
+
+class GameFacetForm(forms.Form):
+    genre = forms.TypedMultipleChoiceField(
+        choices=reference_choices("genres"), coerce=int, required=False
+    )
+    publisher = forms.TypedMultipleChoiceField(
+        choices=reference_choices("publishers"), coerce=int, required=False
+    )
+    platform = forms.TypedMultipleChoiceField(
+        choices=reference_choices("platforms"), coerce=int, required=False
+    )
+    year_from = forms.IntegerField(required=False, min_value=0)
+    year_to = forms.IntegerField(required=False, min_value=0)
+
+    def selection(self):
+        # Invalid values are dropped one field at a time rather than
+        # discarding the whole filter.
+        self.is_valid()
+        return self.cleaned_data
+
+    def selected(self, name):
+        return self.selection().get(name) or []
+
+    def facet_filters(self):
+        data = self.selection()
+        filters = {}
+        if data.get("genre"):
+            filters["genre"] = Q(genre_id__in=data["genre"])
+        if data.get("publisher"):
+            filters["publisher"] = Q(publisher_id__in=data["publisher"])
+        if data.get("platform"):
+            filters["platform"] = Q(
+                id__in=Game.platform.through.objects.filter(
+                    platform_id__in=data["platform"]
+                ).values("game_id")
+            )
+        year = Q()
+        if data.get("year_from") is not None:
+            year &= Q(release_year__gte=data["year_from"])
+        if data.get("year_to") is not None:
+            year &= Q(release_year__lte=data["year_to"])
+        if year:
+            filters["year"] = year
+        return filters
+
 
 class PlayerRegistrationForm(UserCreationForm):
     email = forms.EmailField(required=False)
@@ -0,0 +1,93 @@
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import Lock
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models.functions import Now
+from PIL import Image, ImageOps
+
+from game import page_cache
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS,
+                thread_name_prefix="image-variants",
+            )
+        return _executor
+
+
+def variant_name(name, width):
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, "variants", f"{stem}-{width}w.webp")
+
+
+def generate_variants(field_file):
+    with field_file.open("rb") as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+    has_alpha = image.mode in ("RGBA", "LA", "P")
+    image = image.convert("RGBA" if has_alpha else "RGB")
+
+    variants = {}
+    for width in settings.IMAGE_VARIANT_WIDTHS:
+        if variants and width > image.width:
+            break
+        resized = image.copy()
+        resized.thumbnail((width, image.height))
+        buffer = BytesIO()
+        resized.save(buffer, "WEBP", quality=settings.IMAGE_VARIANT_QUALITY)
+        name = variant_name(field_file.name, width)
+        field_file.storage.delete(name)
+        variants[str(width)] = field_file.storage.save(
+            name, ContentFile(buffer.getvalue())
+        )
+    return variants
+
+
+def process_image(model_label, pk):
+    model = apps.get_model(model_label)
+    try:
+        obj = model.objects.filter(pk=pk).only("image").first()
+        if obj is None or not obj.image:
+            return
+        variants = generate_variants(obj.image)
+        # Skip the write if the image was replaced while we were working.
+        updated = model.objects.filter(pk=pk, image=obj.image.name).update(
+            image_variants=variants, updated_at=Now()
+        )
+        if updated:
+            page_cache.bump_generation(model)
+    except Exception:
+        logger.exception(
+            "Could not build image variants for %s %s", model_label, pk
+        )
+
+
+def process_image_job(model_label, pk):
+    try:
+        process_image(model_label, pk)
+    finally:
+        connection.close()
+
+
+def schedule_variants(instance):
+    model_label = instance._meta.label
+    pk = instance.pk
+    transaction.on_commit(
+        lambda: get_executor().submit(process_image_job, model_label, pk)
+    )
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from threading import Lock
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from game.cache_versions import bump_version, get_version
+from game.models import Game, Rating, SiteCounter
+
+MAX_SCORE = 10
+VERSION_NAMESPACE = "trending_epoch"
+EPOCH_COUNTER = "trending_epoch"
+# Far below the ~1000 half-lives after which 2 ** half-lives overflows.
+REBASE_HALF_LIVES = 64
+
+_epoch = {}
+_lock = Lock()
+
+
+def half_life():
+    return timedelta(days=settings.TRENDING_HALF_LIFE_DAYS)
+
+
+def get_epoch():
+    # Stored in the database, as every worker must weight activity against
+    # the same epoch.
+    version = get_version(VERSION_NAMESPACE)
+    with _lock:
+        if _epoch.get("version") == version:
+            return _epoch["value"]
+    counter, _ = SiteCounter.objects.get_or_create(
+        name=EPOCH_COUNTER,
+        defaults={"value": int(settings.TRENDING_EPOCH.timestamp())},
+    )
+    epoch = datetime.fromtimestamp(counter.value, dt_timezone.utc)
+    with _lock:
+        _epoch.update(version=version, value=epoch)
+    return epoch
+
+
+def trending_growth(now=None, epoch=None):
+    # Instead of decaying every stored score, new activity is weighted up by
+    # 2 ** (half-lives since the epoch). Ordering is unchanged and a rating
+    # only touches its own game.
+    elapsed = (now or timezone.now()) - (epoch or get_epoch())
+    return 2.0 ** (elapsed / half_life())
+
+
+def trending_weight(score, now=None, epoch=None):
+    return score / MAX_SCORE * trending_growth(now, epoch)
+
+
+def rebase_trending(now=None):
+    # Moves the epoch forward by whole half-lives and scales every stored
+    # score down by the same factor, so weights stay small.
+    epoch = get_epoch()
+    half_lives = int(((now or timezone.now()) - epoch) / half_life())
+    if half_lives < REBASE_HALF_LIVES:
+        return 0
+    rebased = epoch + half_lives * half_life()
+    with transaction.atomic():
+        # Only one worker wins when several rebase at once.
+        moved = SiteCounter.objects.filter(
+            name=EPOCH_COUNTER, value=int(epoch.timestamp())
+        ).update(value=int(rebased.timestamp()))
+        if moved:
+            Game.objects.update(
+                trending_score=F("trending_score") * 2.0 ** -half_lives
+            )
+    bump_version(VERSION_NAMESPACE)
+    return half_lives if moved else 0
+
+
+def rebuild_trending(games):
+    # A rating counts from the time it was last changed.
+    epoch = get_epoch()
+    scores = dict.fromkeys(games.values_list("pk", flat=True), 0.0)
+    ratings = Rating.objects.filter(game__in=list(scores)).values_list(
+        "game_id", "score", "updated_at"
+    )
+    for game_id, score, updated_at in ratings:
+        scores[game_id] += trending_weight(score, updated_at, epoch)
+    Game.objects.bulk_update(
+        [Game(pk=pk, trending_score=score) for pk, score in scores.items()],
+        ["trending_score"],
+    )
+    return len(scores)
+
+
+def leaderboards(games):
+    size = settings.LEADERBOARD_SIZE
+    return {
+        "top_rated_games": list(games.top_rated()[:size]),
+        "trending_games": list(games.trending()[:size]),
+    }
@@ -0,0 +1,157 @@
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import reverse
+
+from game.management.commands.benchmark_views import percentile
+from game.models import Game, Player
+
+SERVERS = {
+    "wsgi": lambda port, options: [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "game_hub.wsgi:application",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(options["workers"]),
+        "--threads",
+        str(options["concurrency"]),
+        "--log-level",
+        "warning",
+    ],
+    "asgi": lambda port, options: [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "game_hub.asgi:application",
+        "--port",
+        str(port),
+        "--workers",
+        str(options["workers"]),
+        "--log-level",
+        "warning",
+    ],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def fetch(port, path, cookie):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    start = time.perf_counter()
+    try:
+        connection.request("GET", path, headers={"Cookie": cookie})
+        response = connection.getresponse()
+        response.read()
+        return response.status, (time.perf_counter() - start) * 1000
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput of the read-heavy pages under gunicorn (WSGI, "
+        "sync views) and uvicorn (ASGI, async views)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--workers", type=int, default=1)
+        parser.add_argument("--username", default="benchmark")
+
+    def handle(self, *args, **options):
+        if settings.DEBUG:
+            self.stderr.write(
+                "DEBUG is on, so debug_toolbar skews the timings. "
+                "Run with DJANGO_DEBUG=False for comparable results."
+            )
+        game = Game.objects.order_by("pk").first()
+        if game is None:
+            raise CommandError("No games found; run generate_catalog first.")
+        paths = [
+            reverse("game:index"),
+            reverse("game:game-list"),
+            reverse("game:game-detail", kwargs={"pk": game.pk}),
+            reverse("game:personal-page"),
+        ]
+        cookie = self.session_cookie(options["username"])
+
+        self.stdout.write(
+            f"{'server':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'errors':>8}"
+        )
+        for name, command in SERVERS.items():
+            result = self.run_server(name, command, paths, cookie, options)
+            self.stdout.write(
+                f"{name:<8}{result['rps']:>10.1f}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}{result['errors']:>8}"
+            )
+
+    def session_cookie(self, username):
+        user, _ = Player.objects.get_or_create(username=username)
+        client = Client()
+        client.force_login(user)
+        session = client.cookies[settings.SESSION_COOKIE_NAME].value
+        return f"{settings.SESSION_COOKIE_NAME}={session}"
+
+    def run_server(self, name, command, paths, cookie, options):
+        port = free_port()
+        env = dict(
+            os.environ,
+            ASYNC_VIEWS=str(name == "asgi"),
+            SERVER_TIMING_ENABLED="False",
+        )
+        server = subprocess.Popen(
+            command(port, options), env=env, cwd=settings.BASE_DIR
+        )
+        try:
+            if not wait_for_port(port):
+                raise CommandError(f"{name} server did not start")
+            for path in paths:
+                fetch(port, path, cookie)
+            jobs = [
+                paths[number % len(paths)]
+                for number in range(options["requests"])
+            ]
+            with ThreadPoolExecutor(options["concurrency"]) as pool:
+                start = time.perf_counter()
+                results = list(
+                    pool.map(lambda path: fetch(port, path, cookie), jobs)
+                )
+                elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+        timings = [timing for _, timing in results]
+        return {
+            "rps": len(results) / elapsed,
+            "p50_ms": percentile(timings, 0.5),
+            "p95_ms": percentile(timings, 0.95),
+            "errors": sum(status != 200 for status, _ in results),
+        }
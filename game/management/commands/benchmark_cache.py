@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import tempfile
+import time
+
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from django.core.management.commands.createcachetable import (
+    Command as CreateCacheTableCommand,
+)
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+
+from game_hub.cache import SQLiteCache
+
+TABLE = "benchmark_cache"
+COUNTER = "benchmark:counter"
+
+# Filled before forking, so workers inherit the backends instead of
+# pickling them.
+_backends = {}
+
+
+def run_counter(label, increments):
+    backend = _backends[label]
+    connections.close_all()
+    start = time.perf_counter()
+    for _ in range(increments):
+        backend.incr(COUNTER)
+    elapsed = time.perf_counter() - start
+    connections.close_all()
+    return elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the LocMem, database and shared SQLite cache backends on "
+        "single operations and on a counter incremented by several workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--operations", type=int, default=2000)
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument("--value-size", type=int, default=2000)
+        parser.add_argument("--batch", type=int, default=24)
+
+    def handle(self, *args, **options):
+        params = {"OPTIONS": {"MAX_ENTRIES": options["operations"] * 2}}
+        with tempfile.TemporaryDirectory() as directory:
+            backends = _backends
+            backends |= {
+                "locmem": LocMemCache("benchmark", params),
+                "database": DatabaseCache(TABLE, params),
+                "sqlite": SQLiteCache(
+                    os.path.join(directory, "cache.sqlite3"), params
+                ),
+            }
+            create_table = CreateCacheTableCommand()
+            create_table.verbosity = 0
+            create_table.create_table(DEFAULT_DB_ALIAS, TABLE, dry_run=False)
+            try:
+                self.stdout.write(
+                    f"{'backend':<10}{'set':>10}{'get':>10}{'miss':>10}"
+                    f"{'get_many':>10}{'incr':>10}   (us per call)"
+                )
+                for label, backend in backends.items():
+                    self.time_operations(label, backend, options)
+                self.stdout.write(
+                    f"\n{options['processes']} workers incrementing one "
+                    "counter:"
+                )
+                for label, backend in backends.items():
+                    self.time_counter(label, backend, options)
+            finally:
+                backends.clear()
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"DROP TABLE {connection.ops.quote_name(TABLE)}"
+                    )
+
+    def time_operations(self, label, backend, options):
+        operations = options["operations"]
+        value = "x" * options["value_size"]
+        keys = [f"benchmark:{number}" for number in range(operations)]
+        batches = [
+            keys[start:start + options["batch"]]
+            for start in range(0, operations, options["batch"])
+        ]
+        backend.set(COUNTER, 0)
+        timings = [
+            self.per_call(lambda: [backend.set(key, value) for key in keys]),
+            self.per_call(lambda: [backend.get(key) for key in keys]),
+            self.per_call(
+                lambda: [backend.get(f"missing:{key}") for key in keys]
+            ),
+            self.per_call(
+                lambda: [backend.get_many(batch) for batch in batches],
+                len(batches),
+            ),
+            self.per_call(lambda: [backend.incr(COUNTER) for _ in keys]),
+        ]
+        self.stdout.write(
+            f"{label:<10}" + "".join(f"{timing:>10.1f}" for timing in timings)
+        )
+        backend.clear()
+
+    def per_call(self, run, calls=None):
+        start = time.perf_counter()
+        results = run()
+        elapsed = time.perf_counter() - start
+        return elapsed / (calls or len(results)) * 1_000_000
+
+    def time_counter(self, label, backend, options):
+        processes = options["processes"]
+        increments = options["operations"] // processes
+        backend.set(COUNTER, 0)
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            elapsed = max(
+                pool.starmap(
+                    run_counter, [(label, increments)] * processes
+                )
+            )
+        self.stdout.write(
+            f"{label:<10}{backend.get(COUNTER):>8} of "
+            f"{increments * processes} increments seen by this process"
+            f"{elapsed:>10.2f} s"
+        )
+        backend.clear()
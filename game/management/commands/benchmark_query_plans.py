@@ -0,0 +1,119 @@
+import statistics
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, Sum
+
+from game.models import Game, Publisher, Rating
+
+INDEXED_MODELS = (Game, Publisher, Rating)
+
+
+def sample_queries():
+    game = Game.objects.order_by("pk").first()
+    if game is None:
+        return None
+    country = Publisher.objects.values_list("country", flat=True).first()
+    games = Game.objects.select_related("genre", "publisher")
+    return {
+        "game list": games.order_by("title", "id")[:6],
+        "game list by genre": games.filter(genre_id=game.genre_id).order_by(
+            "title", "id"
+        )[:6],
+        "game list by publisher": games.filter(
+            publisher_id=game.publisher_id
+        ).order_by("title", "id")[:6],
+        "games by release year": Game.objects.filter(
+            release_year=game.release_year
+        ).order_by("title")[:6],
+        "publishers by country": Publisher.objects.filter(
+            country=country
+        ).order_by("name"),
+        "top rated": Game.objects.top_rated()[:10],
+        "top rated by genre": Game.objects.filter(
+            genre_id=game.genre_id
+        ).top_rated()[:10],
+        "trending": Game.objects.trending()[:10],
+        "rating aggregate": Rating.objects.filter(game_id=game.pk)
+        .values("game")
+        .annotate(total=Sum("score"), votes=Count("id"))
+        .order_by(),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Show query plans and timings for the list/filter queries with and "
+        "without the composite indexes. Drops and re-creates the indexes of "
+        "the configured database, so only run it against a scratch copy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--allow-index-drop",
+            action="store_true",
+            help="Confirm the configured database is a scratch copy.",
+        )
+        parser.add_argument(
+            "--generate",
+            type=int,
+            metavar="GAMES",
+            help="Generate a synthetic catalog with this many games first.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["allow_index_drop"]:
+            raise CommandError(
+                "This drops and re-creates the indexes of "
+                f"{connection.settings_dict['NAME']}. Point the settings at "
+                "a scratch database and pass --allow-index-drop."
+            )
+        if options["generate"]:
+            games = options["generate"]
+            call_command(
+                "generate_catalog",
+                games=games,
+                publishers=max(games // 100, 10),
+                players=max(games // 2, 10),
+                ratings=games * 50,
+                stdout=self.stdout,
+            )
+        if sample_queries() is None:
+            raise CommandError(
+                "No games found; run generate_catalog or pass --generate."
+            )
+
+        self.report("with indexes", options["iterations"])
+        self.set_indexes(enabled=False)
+        try:
+            self.report("without indexes", options["iterations"])
+        finally:
+            self.set_indexes(enabled=True)
+
+    def set_indexes(self, enabled):
+        with connection.schema_editor() as editor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    if enabled:
+                        editor.add_index(model, index)
+                    else:
+                        editor.remove_index(model, index)
+        # SQLite keeps EXPLAIN statements prepared against the old schema.
+        connection.close()
+
+    def report(self, label, iterations):
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== {label} =="))
+        for name, queryset in sample_queries().items():
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(
+                f"{name}: median {statistics.median(timings):.2f} ms"
+            )
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f"    {line}")
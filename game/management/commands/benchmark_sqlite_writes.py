@@ -0,0 +1,124 @@
+import multiprocessing
+import random
+import sqlite3
+import time
+from contextlib import closing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections
+from django.test.utils import override_settings
+
+from game.models import Game, Player, Rating
+from game_hub.db import serialized_write
+
+PLAYER_PREFIX = "sqlite-writer-"
+# What a plain Django SQLite connection runs with.
+BASELINE_PRAGMAS = {"journal_mode": "delete", "synchronous": "full"}
+
+
+def run_writer(tuned, player_id, game_ids, writes, seed):
+    overrides = {"SQLITE_SERIALIZE_WRITES": tuned}
+    if not tuned:
+        overrides["SQLITE_PRAGMAS"] = BASELINE_PRAGMAS
+    rng = random.Random(seed)
+    written = locked = 0
+    with override_settings(**overrides):
+        connections.close_all()
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            (journal_mode,) = cursor.fetchone()
+        for _ in range(writes):
+            try:
+                with serialized_write():
+                    Rating.objects.update_or_create(
+                        player_id=player_id,
+                        game_id=rng.choice(game_ids),
+                        defaults={"score": rng.randint(1, 10)},
+                    )
+                written += 1
+            except OperationalError:
+                locked += 1
+        connections.close_all()
+    return written, locked, journal_mode
+
+
+def set_journal_mode(mode):
+    # The mode lives in the database file and only changes while no other
+    # connection is open, so it is switched here rather than by the workers.
+    connections.close_all()
+    mode = mode.lower()
+    path = connection.settings_dict["NAME"]
+    with closing(sqlite3.connect(path)) as database:
+        (current,) = database.execute(
+            f"PRAGMA journal_mode = {mode}"
+        ).fetchone()
+    if current != mode:
+        raise CommandError(
+            f"Could not switch {path} to journal_mode={mode} ({current}); "
+            "stop other processes using it first."
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rating write throughput from several processes with the "
+        "default SQLite setup and with WAL plus serialized writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument("--writes", type=int, default=200)
+        parser.add_argument("--games", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite" or connection.is_in_memory_db():
+            raise CommandError("This benchmark needs a file-based SQLite DB.")
+        game_ids = list(
+            Game.objects.order_by("pk").values_list("pk", flat=True)[
+                : options["games"]
+            ]
+        )
+        if not game_ids:
+            raise CommandError("No games found; run generate_catalog first.")
+        player_ids = [
+            Player.objects.get_or_create(username=f"{PLAYER_PREFIX}{number}")[
+                0
+            ].pk
+            for number in range(options["processes"])
+        ]
+
+        try:
+            for label, tuned in (("baseline", False), ("tuned", True)):
+                self.run(label, tuned, player_ids, game_ids, options)
+        finally:
+            # Ratings go with the players, and signals fix the aggregates.
+            Player.objects.filter(username__startswith=PLAYER_PREFIX).delete()
+            set_journal_mode(settings.SQLITE_PRAGMAS["journal_mode"])
+
+    def run(self, label, tuned, player_ids, game_ids, options):
+        jobs = [
+            (tuned, player_id, game_ids, options["writes"], seed)
+            for seed, player_id in enumerate(player_ids)
+        ]
+        pragmas = settings.SQLITE_PRAGMAS if tuned else BASELINE_PRAGMAS
+        journal_mode = pragmas["journal_mode"].lower()
+        set_journal_mode(journal_mode)
+        context = multiprocessing.get_context("fork")
+        with context.Pool(len(jobs)) as pool:
+            start = time.perf_counter()
+            results = pool.starmap(run_writer, jobs)
+            elapsed = time.perf_counter() - start
+        written = sum(result[0] for result in results)
+        locked = sum(result[1] for result in results)
+        modes = {result[2] for result in results}
+        if modes != {journal_mode}:
+            raise CommandError(
+                f"{label} workers ran with journal_mode "
+                f"{', '.join(sorted(modes))}."
+            )
+        self.stdout.write(
+            f"{label:<10}{written:>8} writes{locked:>8} locked"
+            f"{elapsed:>10.2f} s{written / elapsed:>10.1f} writes/s"
+            f"   journal_mode={journal_mode}"
+        )
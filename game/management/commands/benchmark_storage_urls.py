@@ -0,0 +1,90 @@
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand
+from storages.backends.s3 import S3StaticStorage
+
+from game.images import variant_name
+from game_hub.storage import (
+    MemoizedFileSystemStorage,
+    MemoizedS3StaticStorage,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the url() calls a game card makes (image plus srcset "
+        "variants) with plain and memoized storages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cards", type=int, default=1000)
+        parser.add_argument("--rounds", type=int, default=5)
+
+    def handle(self, *args, **options):
+        images = [
+            f"game_images/game{number}.jpg"
+            for number in range(options["cards"])
+        ]
+        cards = [
+            [image]
+            + [
+                variant_name(image, width)
+                for width in settings.IMAGE_VARIANT_WIDTHS
+            ]
+            for image in images
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            setups = {
+                "s3 custom domain": (
+                    S3StaticStorage,
+                    MemoizedS3StaticStorage,
+                    {
+                        "bucket_name": "benchmark",
+                        "custom_domain": "benchmark.s3.amazonaws.com",
+                    },
+                ),
+                "s3 bucket url": (
+                    S3StaticStorage,
+                    MemoizedS3StaticStorage,
+                    {
+                        "bucket_name": "benchmark",
+                        "custom_domain": None,
+                        "region_name": "us-east-1",
+                    },
+                ),
+                "local": (
+                    FileSystemStorage,
+                    MemoizedFileSystemStorage,
+                    {"location": directory, "base_url": "/media/"},
+                ),
+            }
+            self.stdout.write(
+                f"{'storage':<18}{'plain':>10}{'first':>10}{'memoized':>10}"
+                "   (us per card)"
+            )
+            for label, (plain, memoized, kwargs) in setups.items():
+                plain_storage = plain(**kwargs)
+                memoized_storage = memoized(**kwargs)
+                # Warm boto3's client and endpoint resolution first.
+                plain_storage.url(cards[0][0])
+                timings = [
+                    self.per_card(plain_storage, cards, options["rounds"]),
+                    self.per_card(memoized_storage, cards, 1),
+                    self.per_card(memoized_storage, cards, options["rounds"]),
+                ]
+                self.stdout.write(
+                    f"{label:<18}"
+                    + "".join(f"{timing:>10.2f}" for timing in timings)
+                )
+
+    def per_card(self, storage, cards, rounds):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for names in cards:
+                for name in names:
+                    storage.url(name)
+        elapsed = time.perf_counter() - start
+        return elapsed / (rounds * len(cards)) * 1_000_000
@@ -0,0 +1,137 @@
+import json
+import subprocess
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from game.models import Game, Genre, Player, Publisher
+from game.urls import app_name, urlpatterns
+
+# These toggle state on every request, so timing them would mutate data.
+SKIPPED_ROUTES = {"update-wishlist-status", "update-completed-status"}
+ROUTE_MODELS = {"game": Game, "genre": Genre, "publisher": Publisher}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = "Time every route in game/urls.py and report latency and queries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--username", default="benchmark")
+        parser.add_argument("--output", default="benchmark_results.json")
+        parser.add_argument(
+            "--compare", help="Earlier results file to print deltas against."
+        )
+
+    def handle(self, *args, **options):
+        if settings.DEBUG:
+            self.stderr.write(
+                "DEBUG is on, so debug_toolbar skews the timings. "
+                "Run with DJANGO_DEBUG=False for comparable results."
+            )
+        client = Client()
+        client.force_login(self.get_user(options["username"]))
+
+        results = {}
+        for pattern in urlpatterns:
+            if pattern.name in SKIPPED_ROUTES:
+                continue
+            url = self.build_url(pattern)
+            if url is None:
+                self.stderr.write(f"Skipping {pattern.name}: no sample data")
+                continue
+            results[pattern.name] = self.measure(
+                client, url, options["iterations"]
+            )
+
+        report = {
+            "commit": current_commit(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "iterations": options["iterations"],
+            "views": results,
+        }
+        Path(options["output"]).write_text(json.dumps(report, indent=2))
+
+        previous = {}
+        if options["compare"]:
+            previous = json.loads(Path(options["compare"]).read_text())
+            previous = previous["views"]
+        self.print_report(results, previous)
+        self.stdout.write(f"Results written to {options['output']}")
+
+    def get_user(self, username):
+        user, _ = Player.objects.get_or_create(username=username)
+        return user
+
+    def build_url(self, pattern):
+        kwargs = {}
+        for name in pattern.pattern.converters:
+            model = Game
+            if name == "pk":
+                model = ROUTE_MODELS.get(pattern.name.split("-")[0], Game)
+            pk = model.objects.order_by("pk").values_list(
+                "pk", flat=True
+            ).first()
+            if pk is None:
+                return None
+            kwargs[name] = pk
+        return reverse(f"{app_name}:{pattern.name}", kwargs=kwargs)
+
+    def measure(self, client, url, iterations):
+        client.get(url)
+        timings = []
+        status_code = queries = None
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - start) * 1000)
+            status_code = response.status_code
+            queries = len(captured.captured_queries)
+        return {
+            "url": url,
+            "status": status_code,
+            "p50_ms": round(percentile(timings, 0.5), 2),
+            "p95_ms": round(percentile(timings, 0.95), 2),
+            "queries": queries,
+        }
+
+    def print_report(self, results, previous):
+        self.stdout.write(
+            f"{'view':<28}{'status':>7}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'queries':>9}{'p50 delta':>11}"
+        )
+        for name, result in results.items():
+            delta = ""
+            if name in previous:
+                change = result["p50_ms"] - previous[name]["p50_ms"]
+                delta = f"{change:+.2f}"
+            self.stdout.write(
+                f"{name:<28}{result['status']:>7}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}{result['queries']:>9}"
+                f"{delta:>11}"
+            )
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from game.similarity import compute_similar_games
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute the top-K similar games of every game from ratings, "
+        "wishlists, completions and shared genre/publisher/platforms."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=10)
+        parser.add_argument("--dimensions", type=int, default=128)
+        parser.add_argument(
+            "--content-weight",
+            type=float,
+            default=0.3,
+            help="Share of the score that comes from genre/publisher/"
+            "platforms rather than player activity.",
+        )
+        parser.add_argument("--block-size", type=int, default=512)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        created = compute_similar_games(
+            top_k=options["top_k"],
+            dimensions=options["dimensions"],
+            content_weight=options["content_weight"],
+            block_size=options["block_size"],
+            seed=options["seed"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {created} similar games in "
+                f"{time.perf_counter() - start:.1f}s."
+            )
+        )
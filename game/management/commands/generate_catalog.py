@@ -0,0 +1,227 @@
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from game.models import (
+    Game,
+    Genre,
+    Platform,
+    Player,
+    Publisher,
+    Rating,
+)
+from game.signals import invalidate_all
+
+WORDS = (
+    "action adventure ancient battle castle dark dragon dungeon empire "
+    "galaxy hero island kingdom legend lost magic mech night ocean "
+    "puzzle quest racing rogue shadow space star strategy survival "
+    "tactics tower warrior wild world zombie"
+).split()
+COUNTRIES = (
+    "USA", "Japan", "Ukraine", "Poland", "France", "Germany", "Canada",
+    "Sweden", "United Kingdom", "South Korea", "China", "Finland",
+)
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class Command(BaseCommand):
+    help = "Generate a seeded synthetic catalog for benchmarking."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--prefix", default="Synthetic")
+        parser.add_argument("--genres", type=int, default=50)
+        parser.add_argument("--platforms", type=int, default=12)
+        parser.add_argument("--publishers", type=int, default=1000)
+        parser.add_argument("--games", type=int, default=100_000)
+        parser.add_argument("--players", type=int, default=50_000)
+        parser.add_argument("--ratings", type=int, default=5_000_000)
+        parser.add_argument("--wishlist-per-player", type=int, default=20)
+        parser.add_argument("--completed-per-player", type=int, default=10)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.prefix = options["prefix"]
+        self.chunk_size = options["chunk_size"]
+
+        genre_ids = self.create_genres(options["genres"])
+        platform_ids = self.create_platforms(options["platforms"])
+        publisher_ids = self.create_publishers(options["publishers"])
+        game_ids = self.create_games(
+            options["games"], genre_ids, publisher_ids, platform_ids
+        )
+        player_ids = self.create_players(options["players"])
+        self.create_ratings(options["ratings"], player_ids, game_ids)
+        self.create_game_lists(
+            "wishlist_games",
+            options["wishlist_per_player"],
+            player_ids,
+            game_ids,
+        )
+        self.create_game_lists(
+            "completed_games",
+            options["completed_per_player"],
+            player_ids,
+            game_ids,
+        )
+        self.refresh_derived_data()
+        self.stdout.write(self.style.SUCCESS("Synthetic catalog generated."))
+
+    def sentence(self, words):
+        return " ".join(self.rng.choice(WORDS) for _ in range(words))
+
+    def bulk_create(self, model, objects, **kwargs):
+        for chunk in chunked(objects, self.chunk_size):
+            model.objects.bulk_create(chunk, **kwargs)
+
+    def created_ids(self, queryset):
+        return list(queryset.order_by("pk").values_list("pk", flat=True))
+
+    def create_genres(self, count):
+        self.bulk_create(
+            Genre,
+            [
+                Genre(
+                    name=f"{self.prefix} Genre {i}",
+                    description=f"{self.prefix} genre {i}: "
+                    + self.sentence(8),
+                )
+                for i in range(count)
+            ],
+        )
+        return self.created_ids(
+            Genre.objects.filter(name__startswith=f"{self.prefix} Genre ")
+        )
+
+    def create_platforms(self, count):
+        self.bulk_create(
+            Platform,
+            [Platform(name=f"{self.prefix} Platform {i}") for i in range(count)],
+        )
+        return self.created_ids(
+            Platform.objects.filter(
+                name__startswith=f"{self.prefix} Platform "
+            )
+        )
+
+    def create_publishers(self, count):
+        self.bulk_create(
+            Publisher,
+            [
+                Publisher(
+                    name=f"{self.prefix} Publisher {i}",
+                    description=f"{self.prefix} publisher {i}: "
+                    + self.sentence(8),
+                    country=self.rng.choice(COUNTRIES),
+                    capitalization=round(self.rng.uniform(0, 999), 2),
+                )
+                for i in range(count)
+            ],
+        )
+        return self.created_ids(
+            Publisher.objects.filter(
+                name__startswith=f"{self.prefix} Publisher "
+            )
+        )
+
+    def create_games(self, count, genre_ids, publisher_ids, platform_ids):
+        self.bulk_create(
+            Game,
+            [
+                Game(
+                    title=f"{self.prefix} {self.sentence(2).title()} {i}",
+                    description=self.sentence(30),
+                    release_year=self.rng.randint(1980, 2024),
+                    genre_id=self.rng.choice(genre_ids),
+                    publisher_id=self.rng.choice(publisher_ids),
+                    image="game_images/default.jpg",
+                    link=f"https://example.com/{self.prefix.lower()}/{i}",
+                )
+                for i in range(count)
+            ],
+        )
+        game_ids = self.created_ids(
+            Game.objects.filter(
+                link__startswith=f"https://example.com/{self.prefix.lower()}/"
+            )
+        )
+        through = Game.platform.through
+        self.bulk_create(
+            through,
+            [
+                through(game_id=game_id, platform_id=platform_id)
+                for game_id in game_ids
+                for platform_id in self.rng.sample(
+                    platform_ids, min(len(platform_ids), 3)
+                )
+            ],
+            ignore_conflicts=True,
+        )
+        return game_ids
+
+    def create_players(self, count):
+        password = make_password("benchmark")
+        self.bulk_create(
+            Player,
+            [
+                Player(
+                    username=f"{self.prefix.lower()}_player_{i}",
+                    password=password,
+                )
+                for i in range(count)
+            ],
+        )
+        return self.created_ids(
+            Player.objects.filter(
+                username__startswith=f"{self.prefix.lower()}_player_"
+            )
+        )
+
+    def create_ratings(self, count, player_ids, game_ids):
+        if not player_ids or not game_ids:
+            return
+        for start in range(0, count, self.chunk_size):
+            size = min(self.chunk_size, count - start)
+            Rating.objects.bulk_create(
+                [
+                    Rating(
+                        player_id=self.rng.choice(player_ids),
+                        game_id=self.rng.choice(game_ids),
+                        score=self.rng.randint(1, 10),
+                    )
+                    for _ in range(size)
+                ],
+                ignore_conflicts=True,
+            )
+
+    def create_game_lists(self, field_name, per_player, player_ids, game_ids):
+        through = getattr(Player, field_name).through
+        sample_size = min(per_player, len(game_ids))
+        for players in chunked(player_ids, max(self.chunk_size // 10, 1)):
+            through.objects.bulk_create(
+                [
+                    through(player_id=player_id, game_id=game_id)
+                    for player_id in players
+                    for game_id in self.rng.sample(game_ids, sample_size)
+                ],
+                ignore_conflicts=True,
+            )
+
+    def refresh_derived_data(self):
+        # bulk_create sends no signals, so rebuild what they maintain.
+        call_command("reconcile_ratings", stdout=self.stdout)
+        call_command("rebuild_search_index", stdout=self.stdout)
+        call_command("reconcile_counters", stdout=self.stdout)
+        invalidate_all()
+        self.stdout.write(
+            "Run compute_similar_games and train_recommendations to cover "
+            "the new games and players."
+        )
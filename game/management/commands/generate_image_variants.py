@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from game import images
+from game.models import Game, Genre, Publisher
+
+
+class Command(BaseCommand):
+    help = "Build resized WebP variants for uploaded images."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild variants that already exist.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Worker threads; 1 processes images in this thread.",
+        )
+
+    def handle(self, *args, **options):
+        workers = max(options["workers"], 1)
+        pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for model in (Game, Genre, Publisher):
+                queryset = model.objects.exclude(image="").exclude(
+                    image__isnull=True
+                )
+                if not options["all"]:
+                    queryset = queryset.filter(image_variants={})
+                label = model._meta.label
+                ids = list(queryset.values_list("pk", flat=True))
+                if pool is None:
+                    for pk in ids:
+                        images.process_image(label, pk)
+                else:
+                    jobs = [
+                        pool.submit(images.process_image_job, label, pk)
+                        for pk in ids
+                    ]
+                    for job in jobs:
+                        job.result()
+                self.stdout.write(
+                    f"Processed {len(ids)} {model._meta.verbose_name_plural}."
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.stdout.write(self.style.SUCCESS("Image variants are up to date."))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game import search
+from game.models import Game
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all games in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        search.clear_index()
+        last_id = 0
+        indexed = 0
+        while True:
+            ids = list(
+                Game.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                search.index_game_range(ids[0], ids[-1])
+            indexed += len(ids)
+            last_id = ids[-1]
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} games for search.")
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from game import counters
+
+
+class Command(BaseCommand):
+    help = "Recount the site counters shown on the homepage."
+
+    def handle(self, *args, **options):
+        for name, value in counters.reconcile().items():
+            self.stdout.write(f"{name}: {value}")
+        self.stdout.write(self.style.SUCCESS("Site counters reconciled."))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game.leaderboards import rebase_trending, rebuild_trending
+from game.models import Game
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored rating aggregates and trending scores of "
+        "every game in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        rebase_trending()
+        last_id = 0
+        updated = 0
+        while True:
+            ids = list(
+                Game.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                games = Game.objects.filter(pk__in=ids).select_for_update()
+                updated += games.recalculate_ratings()
+                rebuild_trending(games)
+            last_id = ids[-1]
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled ratings for {updated} games.")
+        )
@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from game.recommendations import train_recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Train the ALS recommendation model on ratings, wishlists and "
+        "completions and store the top-N games of every player. Runs "
+        "incrementally for players whose activity changed unless --full "
+        "is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Retrain game factors from scratch instead of only "
+            "refreshing players marked stale.",
+        )
+        parser.add_argument("--factors", type=int, default=32)
+        parser.add_argument("--iterations", type=int, default=10)
+        parser.add_argument("--regularization", type=float, default=0.1)
+        parser.add_argument("--alpha", type=float, default=10.0)
+        parser.add_argument("--top-n", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running as a worker, training incrementally every "
+            "this many seconds.",
+        )
+
+    def handle(self, *args, **options):
+        full = options["full"]
+        while True:
+            start = time.perf_counter()
+            refreshed = train_recommendations(
+                factors=options["factors"],
+                iterations=options["iterations"],
+                regularization=options["regularization"],
+                alpha=options["alpha"],
+                top_n=options["top_n"],
+                seed=options["seed"],
+                full=full,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Refreshed recommendations of {refreshed} players in "
+                    f"{time.perf_counter() - start:.1f}s."
+                )
+            )
+            if not options["interval"]:
+                return
+            full = False
+            time.sleep(options["interval"])
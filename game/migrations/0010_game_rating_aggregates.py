@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2026-10-18 04:45
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_rating_aggregates(apps, schema_editor):
+    Game = apps.get_model("game", "Game")
+    Rating = apps.get_model("game", "Rating")
+    totals = (
+        Rating.objects.values("game")
+        .annotate(total=Sum("score"), votes=Count("id"))
+        .order_by()
+    )
+    for row in totals:
+        Game.objects.filter(pk=row["game"]).update(
+            rating_sum=row["total"],
+            rating_count=row["votes"],
+            rating_avg=row["total"] / row["votes"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0009_alter_game_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="rating_avg",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            fill_rating_aggregates, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:10
+
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE game_search USING fts5("
+    "title, description, genre, publisher, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    "INSERT INTO game_search (rowid, title, description, genre, publisher) "
+    "SELECT g.id, g.title, g.description, ge.name, p.name "
+    "FROM game_game g "
+    "LEFT JOIN game_genre ge ON ge.id = g.genre_id "
+    "LEFT JOIN game_publisher p ON p.id = g.publisher_id",
+]
+
+POSTGRES_FORWARD = [
+    "CREATE TABLE game_search ("
+    "game_id bigint PRIMARY KEY "
+    "REFERENCES game_game (id) ON DELETE CASCADE "
+    "DEFERRABLE INITIALLY DEFERRED, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX game_search_document_idx "
+    "ON game_search USING GIN (document)",
+    "INSERT INTO game_search (game_id, document) "
+    "SELECT g.id, "
+    "setweight(to_tsvector('simple', g.title), 'A') "
+    "|| setweight(to_tsvector('simple', "
+    "coalesce(ge.name, '') || ' ' || coalesce(p.name, '')), 'B') "
+    "|| setweight(to_tsvector('simple', g.description), 'C') "
+    "FROM game_game g "
+    "LEFT JOIN game_genre ge ON ge.id = g.genre_id "
+    "LEFT JOIN game_publisher p ON p.id = g.publisher_id",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {
+        "sqlite": SQLITE_FORWARD,
+        "postgresql": POSTGRES_FORWARD,
+    }.get(vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        schema_editor.execute("DROP TABLE game_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0010_game_rating_aggregates"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:06
+
+from django.db import migrations, models
+
+COUNTED_MODELS = {
+    "players": "Player",
+    "games": "Game",
+    "publishers": "Publisher",
+    "genres": "Genre",
+}
+
+
+def fill_site_counters(apps, schema_editor):
+    SiteCounter = apps.get_model("game", "SiteCounter")
+    SiteCounter.objects.bulk_create(
+        SiteCounter(
+            name=name,
+            value=apps.get_model("game", model_name).objects.count(),
+        )
+        for name, model_name in COUNTED_MODELS.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0012_image_variants"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SiteCounter",
+            fields=[
+                (
+                    "name",
+                    models.CharField(
+                        max_length=50, primary_key=True, serialize=False
+                    ),
+                ),
+                ("value", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(fill_site_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0013_site_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["genre", "title", "id"], name="game_genre_title_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["publisher", "title", "id"],
+                name="game_publisher_title_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["release_year"], name="game_release_year_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="publisher",
+            index=models.Index(
+                fields=["country", "name"], name="publisher_country_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rating",
+            index=models.Index(
+                fields=["game", "score"], name="rating_game_score_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0014_list_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SimilarGame",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField()),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="similar_games",
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "similar",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.game",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["game", "rank"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="similargame",
+            constraint=models.UniqueConstraint(
+                fields=("game", "rank"), name="similar_game_rank_unique"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0015_similar_games"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameFactors",
+            fields=[
+                (
+                    "game",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="game.game",
+                    ),
+                ),
+                ("factors", models.BinaryField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="PlayerFactors",
+            fields=[
+                (
+                    "player",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("factors", models.BinaryField(null=True)),
+                ("stale", models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="PlayerRecommendation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField()),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="game.game",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["player", "rank"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="playerrecommendation",
+            constraint=models.UniqueConstraint(
+                fields=("player", "rank"),
+                name="player_recommendation_rank_unique",
+            ),
+        ),
+    ]
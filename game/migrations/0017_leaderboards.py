@@ -0,0 +1,69 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:32
+
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+# The prior as it was when this migration was written; reconcile_ratings
+# applies the current settings.
+PRIOR_MEAN = 5.5
+PRIOR_VOTES = 10
+
+
+def fill_bayesian_averages(apps, schema_editor):
+    Game = apps.get_model("game", "Game")
+    Game.objects.using(schema_editor.connection.alias).update(
+        rating_bayes=(
+            Cast(F("rating_sum"), FloatField()) + PRIOR_VOTES * PRIOR_MEAN
+        )
+        / Cast(F("rating_count") + PRIOR_VOTES, FloatField())
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("game", "0016_recommendations"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="rating_bayes",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="trending_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["-rating_bayes", "id"], name="game_bayes_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["genre", "-rating_bayes", "id"],
+                name="game_genre_bayes_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["publisher", "-rating_bayes", "id"],
+                name="game_publisher_bayes_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(
+                fields=["-trending_score", "id"], name="game_trending_idx"
+            ),
+        ),
+        migrations.RunPython(
+            fill_bayesian_averages, migrations.RunPython.noop
+        ),
+    ]
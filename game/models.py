@@ -1,11 +1,115 @@
 from datetime import date
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models import Avg
+from django.db.models import Count, F, FloatField, Sum
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf, Now
 
 
-class Game(models.Model):
+class ImageVariantsModel(models.Model):
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+
+    # Maintained with queryset updates; a plain save() must not overwrite them.
+    DENORMALIZED_FIELDS = ("image_variants",)
+
+    class Meta:
+        abstract = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        image = self.__dict__.get("image")
+        self._loaded_image = getattr(image, "name", image)
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.DENORMALIZED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def image_srcset(self):
+        storage = self._meta.get_field("image").storage
+        return ", ".join(
+            f"{storage.url(name)} {width}w"
+            for width, name in sorted(
+                self.image_variants.items(), key=lambda item: int(item[0])
+            )
+        )
+
+
+def bayesian_average(rating_sum, rating_count):
+    # Pulls games with few votes towards the prior mean, so a single 10
+    # does not outrank a game rated 9 by hundreds of players.
+    prior_votes = settings.RATING_PRIOR_VOTES
+    return (
+        Cast(rating_sum, FloatField())
+        + prior_votes * settings.RATING_PRIOR_MEAN
+    ) / Cast(rating_count + prior_votes, FloatField())
+
+
+class GameQuerySet(models.QuerySet):
+    def apply_rating_delta(self, score_delta, count_delta, trending_delta=0):
+        rating_sum = F("rating_sum") + score_delta
+        rating_count = F("rating_count") + count_delta
+        return self.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating_avg=Coalesce(
+                Cast(rating_sum, FloatField()) / NullIf(rating_count, 0),
+                0.0,
+            ),
+            rating_bayes=bayesian_average(rating_sum, rating_count),
+            # A deleted rating takes back its full current weight, which can
+            # exceed what its raises added.
+            trending_score=Greatest(
+                F("trending_score") + trending_delta, 0.0
+            ),
+            updated_at=Now(),
+        )
+
+    def top_rated(self):
+        return self.filter(rating_count__gt=0).order_by("-rating_bayes", "id")
+
+    def trending(self):
+        return self.filter(trending_score__gt=0).order_by(
+            "-trending_score", "id"
+        )
+
+    def recalculate_ratings(self):
+        games = list(self.only("id").order_by())
+        totals = {
+            row["game"]: row
+            for row in Rating.objects.filter(game__in=games)
+            .values("game")
+            .annotate(total=Sum("score"), votes=Count("id"))
+            .order_by()
+        }
+        for game in games:
+            row = totals.get(game.pk, {"total": 0, "votes": 0})
+            game.rating_sum = row["total"]
+            game.rating_count = row["votes"]
+            game.rating_avg = (
+                row["total"] / row["votes"] if row["votes"] else 0
+            )
+        self.model.objects.bulk_update(
+            games, ["rating_sum", "rating_count", "rating_avg"]
+        )
+        self.model.objects.filter(
+            pk__in=[game.pk for game in games]
+        ).update(
+            rating_bayes=bayesian_average(
+                F("rating_sum"), F("rating_count")
+            ),
+            updated_at=Now(),
+        )
+        return len(games)
+
+
+class Game(ImageVariantsModel):
     title = models.CharField(max_length=100, unique=True)
     description = models.TextField()
     release_year = models.IntegerField()
@@ -23,15 +127,56 @@ class Game(models.Model):
         related_name="games",
         blank=True
     )
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_avg = models.FloatField(default=0)
+    rating_bayes = models.FloatField(default=0)
+    trending_score = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = GameQuerySet.as_manager()
+
+    DENORMALIZED_FIELDS = ImageVariantsModel.DENORMALIZED_FIELDS + (
+        "rating_sum",
+        "rating_count",
+        "rating_avg",
+        "rating_bayes",
+        "trending_score",
+    )
 
     class Meta:
         ordering = ["title"]
+        indexes = [
+            models.Index(
+                fields=["genre", "title", "id"], name="game_genre_title_idx"
+            ),
+            models.Index(
+                fields=["publisher", "title", "id"],
+                name="game_publisher_title_idx",
+            ),
+            models.Index(fields=["release_year"], name="game_release_year_idx"),
+            models.Index(
+                fields=["-rating_bayes", "id"], name="game_bayes_idx"
+            ),
+            models.Index(
+                fields=["genre", "-rating_bayes", "id"],
+                name="game_genre_bayes_idx",
+            ),
+            models.Index(
+                fields=["publisher", "-rating_bayes", "id"],
+                name="game_publisher_bayes_idx",
+            ),
+            models.Index(
+                fields=["-trending_score", "id"], name="game_trending_idx"
+            ),
+            models.Index(fields=["updated_at"], name="game_updated_at_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
     def get_average_rating(self):
-        return self.ratings.aggregate(average=Avg("score"))["average"] or 0
+        return self.rating_avg
 
 
 class Platform(models.Model):
@@ -49,15 +194,45 @@ class Rating(models.Model):
         related_name="ratings"
     )
     score = models.PositiveIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("player", "game")
+        indexes = [
+            models.Index(fields=["game", "score"], name="rating_game_score_idx"),
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded_score = self.__dict__.get("score")
 
     def __str__(self):
         return f"{self.player.username} - {self.game.title} - {self.score}"
 
 
-class Genre(models.Model):
+class SimilarGame(models.Model):
+    game = models.ForeignKey(
+        Game, on_delete=models.CASCADE, related_name="similar_games"
+    )
+    similar = models.ForeignKey(
+        Game, on_delete=models.CASCADE, related_name="+"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["game", "rank"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "rank"], name="similar_game_rank_unique"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.game_id} -> {self.similar_id} ({self.score:.3f})"
+
+
+class Genre(ImageVariantsModel):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(unique=True)
     image = models.ImageField(
@@ -65,12 +240,13 @@ class Genre(models.Model):
         blank=True,
         null=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
 
-class Publisher(models.Model):
+class Publisher(ImageVariantsModel):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(unique=True)
     country = models.CharField(max_length=100)
@@ -84,9 +260,15 @@ class Publisher(models.Model):
         blank=True,
         null=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(
+                fields=["country", "name"], name="publisher_country_name_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -117,3 +299,49 @@ class Player(AbstractUser):
     class Meta:
         verbose_name = "Player"
         verbose_name_plural = "Players"
+
+
+class SiteCounter(models.Model):
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+
+class GameFactors(models.Model):
+    game = models.OneToOneField(
+        Game, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+    factors = models.BinaryField()
+
+
+class PlayerFactors(models.Model):
+    player = models.OneToOneField(
+        Player, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+    factors = models.BinaryField(null=True)
+    stale = models.BooleanField(default=True)
+
+
+class PlayerRecommendation(models.Model):
+    player = models.ForeignKey(
+        Player, on_delete=models.CASCADE, related_name="recommendations"
+    )
+    game = models.ForeignKey(
+        Game, on_delete=models.CASCADE, related_name="+"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["player", "rank"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player", "rank"],
+                name="player_recommendation_rank_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.player_id} -> {self.game_id} ({self.score:.3f})"
@@ -0,0 +1,151 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from game.cache_versions import bump_version, get_version
+
+LOCK_SECONDS = 30
+
+
+def _namespace(model):
+    return f"pages:{model._meta.label_lower}"
+
+
+def bump_generation(model):
+    bump_version(_namespace(model))
+
+
+def generations(models):
+    return tuple(get_version(_namespace(model)) for model in models)
+
+
+def page_key(request):
+    # Parameter order and empty values do not change the page.
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, values in request.GET.lists()
+            for value in values
+            if value
+        )
+    )
+    digest = hashlib.md5(
+        f"{request.path}?{query}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"page:{digest}"
+
+
+def replay(request, entry):
+    response = HttpResponse(entry["content"], status=entry["status"])
+    for header, value in entry["headers"]:
+        response.headers[header] = value
+    return get_conditional_response(
+        request,
+        etag=response.get("ETag"),
+        last_modified=parse_http_date_safe(response.get("Last-Modified")),
+        response=response,
+    )
+
+
+class AnonymousPageCacheMixin:
+    # Models whose saves and deletes change the page; each has its own
+    # generation counter, so a stored page is stale once any of them moves.
+    page_cache_models = ()
+
+    def use_page_cache(self, request, user):
+        return (
+            settings.PAGE_CACHE_SECONDS > 0
+            and request.method in ("GET", "HEAD")
+            and not user.is_authenticated
+        )
+
+    def cached_response(self, request):
+        self.page_key = page_key(request)
+        self.page_generations = generations(self.page_cache_models)
+        self.page_lock = None
+        entry = cache.get(self.page_key)
+        if entry is None:
+            self.acquire_page_lock()
+            return None
+        if (
+            entry["generations"] == self.page_generations
+            and entry["expires"] > time.time()
+        ):
+            return replay(request, entry)
+        # Single flight: whoever takes the lock rebuilds the page while
+        # everyone else keeps serving the stale copy.
+        if self.acquire_page_lock():
+            return None
+        return replay(request, entry)
+
+    def acquire_page_lock(self):
+        lock = f"{self.page_key}:lock"
+        if cache.add(lock, True, timeout=LOCK_SECONDS):
+            self.page_lock = lock
+        return self.page_lock is not None
+
+    def release_page_lock(self):
+        if self.page_lock is not None:
+            cache.delete(self.page_lock)
+            self.page_lock = None
+
+    def store_page(self, response):
+        if response.status_code == 200 and not response.cookies:
+            cache.set(
+                self.page_key,
+                {
+                    "generations": self.page_generations,
+                    "expires": time.time() + settings.PAGE_CACHE_SECONDS,
+                    "status": response.status_code,
+                    "content": response.content,
+                    "headers": list(response.items()),
+                },
+                timeout=(
+                    settings.PAGE_CACHE_SECONDS
+                    + settings.PAGE_CACHE_STALE_SECONDS
+                ),
+            )
+        self.release_page_lock()
+        return response
+
+    def cache_response(self, response):
+        if callable(getattr(response, "render", None)):
+            response.add_post_render_callback(self.store_page)
+        else:
+            self.store_page(response)
+        return response
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        if not self.use_page_cache(request, request.user):
+            return super().dispatch(request, *args, **kwargs)
+        response = self.cached_response(request)
+        if response is not None:
+            return response
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+        except Exception:
+            self.release_page_lock()
+            raise
+        return self.cache_response(response)
+
+    async def adispatch(self, request, *args, **kwargs):
+        if not self.use_page_cache(request, await request.auser()):
+            return await super().dispatch(request, *args, **kwargs)
+        response = await sync_to_async(self.cached_response)(request)
+        if response is not None:
+            return response
+        try:
+            response = await super().dispatch(request, *args, **kwargs)
+        except Exception:
+            await sync_to_async(self.release_page_lock)()
+            raise
+        return await sync_to_async(self.cache_response)(response)
@@ -0,0 +1,110 @@
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+def encode_cursor(direction, values):
+    payload = json.dumps([direction, *values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, types):
+    if not token:
+        return None, None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, *values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError):
+        return None, None
+    # Tokens come from the query string, so anything but the shape we
+    # encode starts over from the first page.
+    if direction not in ("next", "prev") or len(values) != len(types):
+        return None, None
+    if any(type(value) is not kind for value, kind in zip(values, types)):
+        return None, None
+    return direction, values
+
+
+class CursorPage:
+    is_cursor = True
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page, ordering):
+        # ordering maps each sort field to the type its cursor value has.
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.types = tuple(ordering.values())
+
+    def _seek(self, values, lookup):
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            equal = dict(zip(self.ordering[:index], values[:index]))
+            condition |= Q(**equal, **{f"{field}__{lookup}": values[index]})
+        return condition
+
+    def _key(self, obj):
+        return [getattr(obj, field) for field in self.ordering]
+
+    def get_page(self, cursor):
+        direction, values = decode_cursor(cursor, self.types)
+        if direction == "prev":
+            rows = list(
+                self.queryset.filter(self._seek(values, "lt"))
+                .order_by(*(f"-{field}" for field in self.ordering))
+                [: self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            rows = rows[: self.per_page][::-1]
+            has_next = True
+        else:
+            queryset = self.queryset
+            if direction == "next":
+                queryset = queryset.filter(self._seek(values, "gt"))
+            rows = list(
+                queryset.order_by(*self.ordering)[: self.per_page + 1]
+            )
+            has_next = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            has_previous = direction == "next"
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor("next", self._key(rows[-1]))
+        if rows and has_previous:
+            previous_cursor = encode_cursor("prev", self._key(rows[0]))
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+
+async def acount(paginator):
+    # Paginator.count would run a blocking COUNT(*) on first access.
+    paginator.count = await paginator.object_list.acount()
+    return paginator
+
+
+async def aload_page(page):
+    page.object_list = [obj async for obj in page.object_list]
+    return page
@@ -0,0 +1,16 @@
+def query_budget(limit):
+    # A number of queries, or a dict of them by HTTP method when a view's
+    # writes cost far more than its reads.
+    def decorator(view):
+        view.query_budget = limit
+        return view
+
+    return decorator
+
+
+def get_query_budget(view_func, method="GET"):
+    view = getattr(view_func, "view_class", view_func)
+    budget = getattr(view, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get("GET" if method == "HEAD" else method)
+    return budget
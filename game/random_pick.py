@@ -0,0 +1,49 @@
+import random
+from array import array
+from collections import OrderedDict
+from threading import Lock
+
+from django.db import DEFAULT_DB_ALIAS
+
+from game.cache_versions import get_version
+from game.models import Game
+
+VERSION_NAMESPACE = "game"
+MAX_CACHED_FILTERS = 64
+
+_id_arrays = OrderedDict()
+_lock = Lock()
+
+
+def _load_game_ids(genre_id, platform_id):
+    queryset = Game.objects.using(DEFAULT_DB_ALIAS).order_by()
+    if genre_id:
+        queryset = queryset.filter(genre_id=genre_id)
+    if platform_id:
+        queryset = queryset.filter(platform__id=platform_id)
+    return array("q", queryset.values_list("pk", flat=True))
+
+
+def get_game_ids(genre_id=None, platform_id=None):
+    key = (genre_id, platform_id)
+    version = get_version(VERSION_NAMESPACE)
+    with _lock:
+        cached = _id_arrays.get(key)
+        if cached is not None and cached[0] == version:
+            _id_arrays.move_to_end(key)
+            return cached[1]
+
+    game_ids = _load_game_ids(genre_id, platform_id)
+    with _lock:
+        _id_arrays[key] = (version, game_ids)
+        _id_arrays.move_to_end(key)
+        while len(_id_arrays) > MAX_CACHED_FILTERS:
+            _id_arrays.popitem(last=False)
+    return game_ids
+
+
+def pick_random_game_id(genre_id=None, platform_id=None):
+    game_ids = get_game_ids(genre_id, platform_id)
+    if not game_ids:
+        return None
+    return random.choice(game_ids)
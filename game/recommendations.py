@@ -0,0 +1,279 @@
+import numpy as np
+from django.db import transaction
+
+from game.models import (
+    GameFactors,
+    Player,
+    PlayerFactors,
+    PlayerRecommendation,
+    Rating,
+)
+from game.similarity import COMPLETED_WEIGHT, WISHLIST_WEIGHT, as_array
+
+BATCH_SIZE = 1000
+# Games scored at once; a batch holds BATCH_SIZE x GAME_CHUNK_SIZE floats
+# (16 MB) however large the catalog is.
+GAME_CHUNK_SIZE = 2048
+
+
+def mark_stale(player_ids):
+    PlayerFactors.objects.bulk_create(
+        [PlayerFactors(player_id=player_id) for player_id in player_ids],
+        update_conflicts=True,
+        unique_fields=["player"],
+        update_fields=["stale"],
+    )
+
+
+def load_interactions(player_ids=None):
+    querysets = [
+        (Rating.objects.all(), None),
+        (Player.wishlist_games.through.objects.all(), WISHLIST_WEIGHT),
+        (Player.completed_games.through.objects.all(), COMPLETED_WEIGHT),
+    ]
+    players, games, weights = [], [], []
+    for queryset, weight in querysets:
+        if player_ids is not None:
+            queryset = queryset.filter(player_id__in=player_ids)
+        if weight is None:
+            rows = as_array(queryset, ["player_id", "game_id", "score"])
+            weights.append(rows[:, 2] / 10)
+        else:
+            rows = as_array(queryset, ["player_id", "game_id"])
+            weights.append(np.full(len(rows), weight))
+        players.append(rows[:, 0])
+        games.append(rows[:, 1])
+
+    # Sorted by player, then game, with repeated pairs summed.
+    pairs, inverse = np.unique(
+        np.stack([np.concatenate(players), np.concatenate(games)], axis=1),
+        axis=0,
+        return_inverse=True,
+    )
+    summed = np.bincount(
+        inverse.reshape(-1), weights=np.concatenate(weights)
+    )
+    return pairs[:, 0], pairs[:, 1], summed
+
+
+def load_game_factors():
+    entries = list(
+        GameFactors.objects.order_by("game_id").values_list(
+            "game_id", "factors"
+        )
+    )
+    if not entries:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0))
+    return (
+        np.array([game_id for game_id, _ in entries], dtype=np.int64),
+        np.vstack(
+            [np.frombuffer(data, dtype=np.float32) for _, data in entries]
+        ).astype(np.float64),
+    )
+
+
+def solve(fixed, rows, cols, confidence, n_rows, regularization):
+    # Implicit ALS (Hu, Koren & Volinsky): every interaction is a preference
+    # of 1 weighted by 1 + confidence, everything else a preference of 0.
+    gram = fixed.T @ fixed + regularization * np.eye(fixed.shape[1])
+    order = np.argsort(rows, kind="stable")
+    rows, cols, confidence = rows[order], cols[order], confidence[order]
+    starts = np.searchsorted(rows, np.arange(n_rows + 1))
+    solved = np.zeros((n_rows, fixed.shape[1]))
+    for row in range(n_rows):
+        span = slice(starts[row], starts[row + 1])
+        if span.start == span.stop:
+            continue
+        factors = fixed[cols[span]]
+        weights = confidence[span]
+        solved[row] = np.linalg.solve(
+            gram + (factors.T * weights) @ factors,
+            factors.T @ (1 + weights),
+        )
+    return solved
+
+
+def top_games(
+    player_factors, game_factors, rows, cols, top_n,
+    chunk_size=GAME_CHUNK_SIZE,
+):
+    top_n = min(top_n, len(game_factors))
+    best = np.zeros((len(player_factors), top_n), dtype=np.int64)
+    best_scores = np.full((len(player_factors), top_n), -np.inf)
+    for start in range(0, len(game_factors), chunk_size):
+        scores = player_factors @ game_factors[start:start + chunk_size].T
+        inside = (cols >= start) & (cols < start + chunk_size)
+        scores[rows[inside], cols[inside] - start] = -np.inf
+        # The running top-k competes with every game of the chunk; the
+        # first top_n columns are the games kept so far.
+        candidates = np.hstack([best_scores, scores])
+        keep = np.argpartition(candidates, -top_n, axis=1)[:, -top_n:]
+        best = np.where(
+            keep < top_n,
+            np.take_along_axis(best, np.minimum(keep, top_n - 1), axis=1),
+            keep - top_n + start,
+        )
+        best_scores = np.take_along_axis(candidates, keep, axis=1)
+    order = np.argsort(-best_scores, axis=1)
+    return (
+        np.take_along_axis(best, order, axis=1),
+        np.take_along_axis(best_scores, order, axis=1),
+    )
+
+
+def save_batch(
+    player_ids, player_factors, game_ids, game_factors, rows, cols, top_n
+):
+    active = np.zeros(len(player_ids), dtype=bool)
+    active[rows] = True
+    recommendations = []
+    if top_n > 0 and len(game_ids):
+        best, scores = top_games(
+            player_factors, game_factors, rows, cols, top_n
+        )
+        for row in np.flatnonzero(active):
+            recommendations.extend(
+                PlayerRecommendation(
+                    player_id=int(player_ids[row]),
+                    game_id=int(game_ids[game]),
+                    rank=rank,
+                    score=float(score),
+                )
+                for rank, (game, score) in enumerate(
+                    zip(best[row], scores[row]), start=1
+                )
+                if np.isfinite(score)
+            )
+
+    with transaction.atomic():
+        # Only the factors are written so a player marked stale while the
+        # batch trained is picked up again by the next run.
+        PlayerFactors.objects.bulk_create(
+            [
+                PlayerFactors(
+                    player_id=int(player_id),
+                    factors=(
+                        player_factors[row].astype(np.float32).tobytes()
+                        if active[row]
+                        else None
+                    ),
+                    stale=False,
+                )
+                for row, player_id in enumerate(player_ids)
+            ],
+            update_conflicts=True,
+            unique_fields=["player"],
+            update_fields=["factors"],
+        )
+        PlayerRecommendation.objects.filter(
+            player_id__in=[int(player_id) for player_id in player_ids]
+        ).delete()
+        PlayerRecommendation.objects.bulk_create(recommendations)
+
+
+def train_full(
+    factors, iterations, regularization, alpha, top_n, seed, batch_size
+):
+    PlayerFactors.objects.update(stale=False)
+    players, games, weights = load_interactions()
+    player_ids, rows = np.unique(players, return_inverse=True)
+    game_ids, cols = np.unique(games, return_inverse=True)
+    confidence = alpha * weights
+
+    rng = np.random.default_rng(seed)
+    game_factors = 0.01 * rng.standard_normal((len(game_ids), factors))
+    player_factors = np.zeros((len(player_ids), factors))
+    for _ in range(iterations):
+        player_factors = solve(
+            game_factors, rows, cols, confidence, len(player_ids),
+            regularization,
+        )
+        game_factors = solve(
+            player_factors, cols, rows, confidence, len(game_ids),
+            regularization,
+        )
+    if iterations:
+        player_factors = solve(
+            game_factors, rows, cols, confidence, len(player_ids),
+            regularization,
+        )
+
+    with transaction.atomic():
+        GameFactors.objects.all().delete()
+        GameFactors.objects.bulk_create(
+            [
+                GameFactors(
+                    game_id=int(game_id),
+                    factors=game_factors[col].astype(np.float32).tobytes(),
+                )
+                for col, game_id in enumerate(game_ids)
+            ],
+            batch_size=batch_size,
+        )
+        PlayerFactors.objects.update(factors=None)
+        PlayerRecommendation.objects.all().delete()
+        # Interactions are sorted by player, so each batch is one slice.
+        starts = np.searchsorted(rows, np.arange(len(player_ids) + 1))
+        for start in range(0, len(player_ids), batch_size):
+            stop = min(start + batch_size, len(player_ids))
+            span = slice(starts[start], starts[stop])
+            save_batch(
+                player_ids[start:stop],
+                player_factors[start:stop],
+                game_ids,
+                game_factors,
+                rows[span] - start,
+                cols[span],
+                top_n,
+            )
+    return len(player_ids)
+
+
+def train_incremental(
+    game_ids, game_factors, regularization, alpha, top_n, batch_size
+):
+    stale_ids = list(
+        PlayerFactors.objects.filter(stale=True)
+        .order_by("player_id")
+        .values_list("player_id", flat=True)
+    )
+    for start in range(0, len(stale_ids), batch_size):
+        batch = stale_ids[start:start + batch_size]
+        PlayerFactors.objects.filter(player_id__in=batch).update(stale=False)
+        players, games, weights = load_interactions(batch)
+        # Games added since the last full run have no factors yet and are
+        # ignored until then.
+        known = np.isin(games, game_ids)
+        player_ids = np.array(batch, dtype=np.int64)
+        rows = np.searchsorted(player_ids, players[known])
+        cols = np.searchsorted(game_ids, games[known])
+        player_factors = solve(
+            game_factors, rows, cols, alpha * weights[known], len(batch),
+            regularization,
+        )
+        save_batch(
+            player_ids, player_factors, game_ids, game_factors, rows, cols,
+            top_n,
+        )
+    return len(stale_ids)
+
+
+def train_recommendations(
+    factors=32,
+    iterations=10,
+    regularization=0.1,
+    alpha=10.0,
+    top_n=10,
+    seed=42,
+    full=False,
+    batch_size=BATCH_SIZE,
+):
+    game_ids, game_factors = load_game_factors()
+    if full or not len(game_ids) or game_factors.shape[1] != factors:
+        return train_full(
+            factors, iterations, regularization, alpha, top_n, seed,
+            batch_size,
+        )
+    return train_incremental(
+        game_ids, game_factors, regularization, alpha, top_n, batch_size
+    )
@@ -0,0 +1,86 @@
+from threading import Lock
+
+from django.db import DEFAULT_DB_ALIAS
+
+from game.cache_versions import get_version
+from game.models import Genre, Platform, Publisher
+
+VERSION_NAMESPACE = "reference"
+
+# Loaders read from the primary so a lagging replica cannot refill the
+# cache with stale rows under a freshly bumped version.
+_cache = {}
+_lock = Lock()
+
+
+def _load_genres():
+    return tuple(Genre.objects.using(DEFAULT_DB_ALIAS).only("id", "name"))
+
+
+def _load_publishers():
+    return tuple(Publisher.objects.using(DEFAULT_DB_ALIAS).only("id", "name"))
+
+
+def _load_platforms():
+    return tuple(Platform.objects.using(DEFAULT_DB_ALIAS))
+
+
+def _load_countries():
+    return tuple(
+        Publisher.objects.using(DEFAULT_DB_ALIAS)
+        .order_by("country")
+        .values_list("country", flat=True)
+        .distinct()
+    )
+
+
+_LOADERS = {
+    "genres": _load_genres,
+    "publishers": _load_publishers,
+    "platforms": _load_platforms,
+    "countries": _load_countries,
+}
+
+_MODEL_REFERENCES = {
+    Genre: "genres",
+    Publisher: "publishers",
+    Platform: "platforms",
+}
+
+
+def get(name):
+    version = get_version(VERSION_NAMESPACE)
+    with _lock:
+        cached = _cache.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    value = _LOADERS[name]()
+    with _lock:
+        _cache[name] = (version, value)
+    return value
+
+
+def get_for_model(model):
+    return get(_MODEL_REFERENCES[model])
+
+
+def get_genres():
+    return get("genres")
+
+
+def get_publishers():
+    return get("publishers")
+
+
+def get_platforms():
+    return get("platforms")
+
+
+def get_publisher_countries():
+    return get("countries")
+
+
+def clear():
+    with _lock:
+        _cache.clear()
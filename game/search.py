@@ -0,0 +1,157 @@
+import re
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+from game.models import Game, Genre, Publisher
+
+SEARCH_TABLE = "game_search"
+MAX_SEARCH_TERMS = 8
+
+# bm25() column weights for title, description, genre and publisher.
+SQLITE_RANK = f"bm25({SEARCH_TABLE}, 10.0, 1.0, 4.0, 4.0)"
+POSTGRES_DOCUMENT = (
+    "setweight(to_tsvector('simple', g.title), 'A')"
+    " || setweight(to_tsvector('simple',"
+    " coalesce(ge.name, '') || ' ' || coalesce(p.name, '')), 'B')"
+    " || setweight(to_tsvector('simple', g.description), 'C')"
+)
+
+
+def _source_sql(columns, condition):
+    return (
+        f"SELECT {columns} FROM {Game._meta.db_table} g"
+        f" LEFT JOIN {Genre._meta.db_table} ge ON ge.id = g.genre_id"
+        f" LEFT JOIN {Publisher._meta.db_table} p ON p.id = g.publisher_id"
+        f" WHERE {condition}"
+    )
+
+
+def _reindex(condition, params, using="default"):
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN"
+                f" (SELECT g.id FROM {Game._meta.db_table} g"
+                f" WHERE {condition})",
+                params,
+            )
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE}"
+                f" (rowid, title, description, genre, publisher) "
+                + _source_sql(
+                    "g.id, g.title, g.description, ge.name, p.name",
+                    condition,
+                ),
+                params,
+            )
+        elif connection.vendor == "postgresql":
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (game_id, document) "
+                + _source_sql(f"g.id, {POSTGRES_DOCUMENT}", condition)
+                + " ON CONFLICT (game_id)"
+                " DO UPDATE SET document = EXCLUDED.document",
+                params,
+            )
+
+
+def index_game(game_id, using="default"):
+    _reindex("g.id = %s", [game_id], using)
+
+
+def index_games_of_genre(genre_id, using="default"):
+    _reindex("g.genre_id = %s", [genre_id], using)
+
+
+def index_games_of_publisher(publisher_id, using="default"):
+    _reindex("g.publisher_id = %s", [publisher_id], using)
+
+
+def index_game_range(first_id, last_id, using="default"):
+    _reindex("g.id BETWEEN %s AND %s", [first_id, last_id], using)
+
+
+def _remove(condition, params, using="default"):
+    connection = connections[using]
+    if connection.vendor == "sqlite":
+        column = "rowid"
+    elif connection.vendor == "postgresql":
+        column = "game_id"
+    else:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE {column} IN ({condition})",
+            params,
+        )
+
+
+def remove_game(game_id, using="default"):
+    _remove("%s", [game_id], using)
+
+
+def remove_games_of_genre(genre_id, using="default"):
+    _remove(
+        f"SELECT id FROM {Game._meta.db_table} WHERE genre_id = %s",
+        [genre_id],
+        using,
+    )
+
+
+def remove_games_of_publisher(publisher_id, using="default"):
+    _remove(
+        f"SELECT id FROM {Game._meta.db_table} WHERE publisher_id = %s",
+        [publisher_id],
+        using,
+    )
+
+
+def clear_index(using="default"):
+    connection = connections[using]
+    if connection.vendor in ("sqlite", "postgresql"):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+
+
+def search_games(queryset, query):
+    terms = re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    game_id = f"{Game._meta.db_table}.id"
+    if vendor == "sqlite":
+        match = " ".join(f'"{term}"*' for term in terms)
+        matches = RawSQL(
+            f"SELECT rowid FROM {SEARCH_TABLE}"
+            f" WHERE {SEARCH_TABLE} MATCH %s",
+            (match,),
+        )
+        rank = RawSQL(
+            f"SELECT {SQLITE_RANK} FROM {SEARCH_TABLE}"
+            f" WHERE {SEARCH_TABLE} MATCH %s AND rowid = {game_id}",
+            (match,),
+        )
+        ordering = "search_rank"
+    elif vendor == "postgresql":
+        match = " & ".join(f"{term}:*" for term in terms)
+        matches = RawSQL(
+            f"SELECT game_id FROM {SEARCH_TABLE}"
+            " WHERE document @@ to_tsquery('simple', %s)",
+            (match,),
+        )
+        rank = RawSQL(
+            "SELECT ts_rank(document, to_tsquery('simple', %s))"
+            f" FROM {SEARCH_TABLE} WHERE game_id = {game_id}",
+            (match,),
+        )
+        ordering = "-search_rank"
+    else:
+        return queryset.filter(title__icontains=query)
+
+    return (
+        queryset.filter(pk__in=matches)
+        .annotate(search_rank=rank)
+        .order_by(ordering, "title")
+    )
@@ -0,0 +1,248 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.db.models.functions import Now
+from django.dispatch import receiver
+
+from game import (
+    autocomplete,
+    counters,
+    facets,
+    images,
+    page_cache,
+    random_pick,
+    recommendations,
+    reference_data,
+    search,
+    similarity,
+)
+from game.cache_versions import bump_version
+from game.leaderboards import rebase_trending, trending_weight
+from game.models import (
+    Game,
+    Genre,
+    Platform,
+    Player,
+    Publisher,
+    Rating,
+)
+
+
+def invalidate_all():
+    # Bulk loads send no signals, so bump everything the receivers below
+    # would have.
+    for namespace in (
+        random_pick.VERSION_NAMESPACE,
+        facets.VERSION_NAMESPACE,
+        reference_data.VERSION_NAMESPACE,
+        autocomplete.VERSION_NAMESPACE,
+        similarity.VERSION_NAMESPACE,
+    ):
+        bump_version(namespace)
+    for model in (Game, Genre, Platform, Player, Publisher, Rating):
+        page_cache.bump_generation(model)
+    recommendations.mark_stale(Player.objects.values_list("pk", flat=True))
+
+
+def deleted_through(origin, *models):
+    return getattr(origin, "model", type(origin)) in models
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+@receiver(m2m_changed, sender=Game.platform.through)
+def invalidate_game_ids(sender, action=None, **kwargs):
+    if action is None or action.startswith("post_"):
+        bump_version(random_pick.VERSION_NAMESPACE)
+        bump_version(facets.VERSION_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=Game.platform.through)
+def touch_games_on_platform_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # The link table has no timestamp, so the game carries the change.
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    game_ids = pk_set if reverse else [instance.pk]
+    if game_ids:
+        Game.objects.filter(pk__in=game_ids).update(updated_at=Now())
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Publisher)
+@receiver(post_delete, sender=Publisher)
+@receiver(post_save, sender=Platform)
+@receiver(post_delete, sender=Platform)
+def invalidate_reference_data(sender, **kwargs):
+    bump_version(reference_data.VERSION_NAMESPACE)
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Publisher)
+@receiver(post_delete, sender=Publisher)
+@receiver(post_save, sender=Platform)
+@receiver(post_delete, sender=Platform)
+@receiver(post_delete, sender=Player)
+def invalidate_cached_pages(sender, **kwargs):
+    page_cache.bump_generation(sender)
+
+
+@receiver(post_save, sender=Player)
+def invalidate_cached_pages_on_signup(sender, created, **kwargs):
+    # Logins save last_login; only new players change a cached page.
+    if created:
+        page_cache.bump_generation(sender)
+
+
+@receiver(m2m_changed, sender=Game.platform.through)
+def invalidate_cached_pages_on_platform_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        page_cache.bump_generation(Game)
+
+
+@receiver(post_save, sender=Player)
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Genre)
+@receiver(post_save, sender=Publisher)
+def count_created(sender, created, **kwargs):
+    if created:
+        counters.adjust(sender, 1)
+
+
+@receiver(post_delete, sender=Player)
+@receiver(post_delete, sender=Game)
+@receiver(post_delete, sender=Genre)
+@receiver(post_delete, sender=Publisher)
+def count_deleted(sender, origin=None, **kwargs):
+    # Games removed with their genre or publisher are counted in one go.
+    if sender is Game and deleted_through(origin, Genre, Publisher):
+        return
+    counters.adjust(sender, -1)
+
+
+@receiver(pre_delete, sender=Genre)
+@receiver(pre_delete, sender=Publisher)
+def count_cascaded_games(sender, instance, **kwargs):
+    games = instance.game_set.count()
+    if games:
+        counters.adjust(Game, -games)
+
+
+@receiver(post_save, sender=Rating)
+def update_game_rating_on_save(sender, instance, created, **kwargs):
+    games = Game.objects.filter(pk=instance.game_id)
+    rebase_trending()
+    if created:
+        games.apply_rating_delta(
+            instance.score, 1, trending_weight(instance.score)
+        )
+    elif instance._loaded_score is None:
+        games.recalculate_ratings()
+    elif instance.score != instance._loaded_score:
+        delta = instance.score - instance._loaded_score
+        # Only raised scores count as new momentum.
+        games.apply_rating_delta(delta, 0, trending_weight(max(delta, 0)))
+    instance._loaded_score = instance.score
+
+
+@receiver(post_delete, sender=Rating)
+def update_game_rating_on_delete(sender, instance, origin=None, **kwargs):
+    if deleted_through(origin, Game, Genre, Publisher):
+        # The rated game is being deleted in the same cascade.
+        return
+    score = instance._loaded_score
+    if score is None:
+        score = instance.score
+    Game.objects.filter(pk=instance.game_id).apply_rating_delta(
+        -score, -1, -trending_weight(score, instance.updated_at)
+    )
+
+
+@receiver(post_save, sender=Game)
+def index_game_for_search(sender, instance, using, **kwargs):
+    search.index_game(instance.pk, using)
+
+
+@receiver(post_delete, sender=Game)
+def remove_game_from_search(sender, instance, using, origin=None, **kwargs):
+    if deleted_through(origin, Game):
+        search.remove_game(instance.pk, using)
+
+
+@receiver(pre_delete, sender=Genre)
+def remove_genre_games_from_search(sender, instance, using, **kwargs):
+    search.remove_games_of_genre(instance.pk, using)
+
+
+@receiver(pre_delete, sender=Publisher)
+def remove_publisher_games_from_search(sender, instance, using, **kwargs):
+    search.remove_games_of_publisher(instance.pk, using)
+
+
+@receiver(post_save, sender=Genre)
+def reindex_genre_games(sender, instance, created, using, **kwargs):
+    if not created:
+        search.index_games_of_genre(instance.pk, using)
+
+
+@receiver(post_save, sender=Publisher)
+def reindex_publisher_games(sender, instance, created, using, **kwargs):
+    if not created:
+        search.index_games_of_publisher(instance.pk, using)
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Genre)
+@receiver(post_save, sender=Publisher)
+def rebuild_image_variants(sender, instance, created, raw, **kwargs):
+    if raw or (not created and instance.image.name == instance._loaded_image):
+        return
+    if not created:
+        sender.objects.filter(pk=instance.pk).update(image_variants={})
+        instance.image_variants = {}
+    instance._loaded_image = instance.image.name
+    if instance.image:
+        images.schedule_variants(instance)
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def mark_rater_stale(sender, instance, origin=None, **kwargs):
+    if not deleted_through(origin, Game, Genre, Publisher, Player):
+        recommendations.mark_stale([instance.player_id])
+
+
+@receiver(m2m_changed, sender=Player.wishlist_games.through)
+@receiver(m2m_changed, sender=Player.completed_games.through)
+def mark_collector_stale(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            recommendations.mark_stale([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        recommendations.mark_stale(pk_set)
+    elif action == "pre_clear":
+        recommendations.mark_stale(
+            sender.objects.filter(game_id=instance.pk).values_list(
+                "player_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=Game)
+def update_autocomplete_title(sender, instance, **kwargs):
+    autocomplete.update_title(instance.pk, instance.title)
+
+
+@receiver(post_delete, sender=Game)
+def remove_autocomplete_title(sender, instance, **kwargs):
+    autocomplete.remove_title(instance.pk)
@@ -0,0 +1,174 @@
+import numpy as np
+from django.db import transaction
+
+from game.cache_versions import bump_version
+from game.models import Game, Player, Rating, SimilarGame
+
+VERSION_NAMESPACE = "similar_games"
+WISHLIST_WEIGHT = 0.5
+COMPLETED_WEIGHT = 1.0
+GENRE_WEIGHT = 1.0
+PUBLISHER_WEIGHT = 0.6
+PLATFORM_WEIGHT = 0.3
+CHUNK_SIZE = 100_000
+
+
+def as_array(queryset, columns):
+    rows = list(queryset.values_list(*columns))
+    return np.array(rows, dtype=np.int64).reshape(-1, len(columns))
+
+
+def rows_of(ids, sorted_ids):
+    return np.searchsorted(sorted_ids, ids)
+
+
+def project(n_rows, rows, columns, weights, projection):
+    # Sums weight * projection[column] into each row, i.e. the product of a
+    # sparse (rows x columns) matrix with the dense random projection.
+    embedding = np.zeros((n_rows, projection.shape[1]), dtype=np.float32)
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        np.add.at(
+            embedding,
+            rows[chunk],
+            weights[chunk, None] * projection[columns[chunk]],
+        )
+    return embedding
+
+
+def normalize(embedding):
+    norms = np.linalg.norm(embedding, axis=1, keepdims=True)
+    return np.divide(
+        embedding, norms, out=np.zeros_like(embedding), where=norms > 0
+    )
+
+
+def interaction_embedding(game_ids, dimensions, rng):
+    player_ids = np.sort(as_array(Player.objects.all(), ["id"])[:, 0])
+    ratings = as_array(Rating.objects.all(), ["player_id", "game_id", "score"])
+    weights = [ratings[:, 2] / 10]
+    players = [ratings[:, 0]]
+    games = [ratings[:, 1]]
+    for field_name, weight in (
+        ("wishlist_games", WISHLIST_WEIGHT),
+        ("completed_games", COMPLETED_WEIGHT),
+    ):
+        links = as_array(
+            getattr(Player, field_name).through.objects.all(),
+            ["player_id", "game_id"],
+        )
+        players.append(links[:, 0])
+        games.append(links[:, 1])
+        weights.append(np.full(len(links), weight))
+
+    projection = rng.standard_normal(
+        (len(player_ids), dimensions), dtype=np.float32
+    )
+    return project(
+        len(game_ids),
+        rows_of(np.concatenate(games), game_ids),
+        rows_of(np.concatenate(players), player_ids),
+        np.concatenate(weights).astype(np.float32),
+        projection,
+    )
+
+
+def content_embedding(game_ids, games, dimensions, rng):
+    platforms = as_array(
+        Game.platform.through.objects.all(), ["game_id", "platform_id"]
+    )
+    rows = [np.arange(len(game_ids))] * 2 + [rows_of(platforms[:, 0], game_ids)]
+    values = [games[:, 1], games[:, 2], platforms[:, 1]]
+    weights = [GENRE_WEIGHT, PUBLISHER_WEIGHT, PLATFORM_WEIGHT]
+
+    # Genres, publishers and platforms each get their own column range.
+    columns, offset = [], 0
+    for value in values:
+        columns.append(value + offset)
+        offset += int(value.max(initial=0)) + 1
+    projection = rng.standard_normal((offset, dimensions), dtype=np.float32)
+    return project(
+        len(game_ids),
+        np.concatenate(rows),
+        np.concatenate(columns),
+        np.concatenate(
+            [np.full(len(row), w) for row, w in zip(rows, weights)]
+        ).astype(np.float32),
+        projection,
+    )
+
+
+def top_neighbours(embedding, top_k, block_size):
+    top_k = min(top_k, len(embedding) - 1)
+    for start in range(0, len(embedding), block_size):
+        block = embedding[start:start + block_size]
+        scores = block @ embedding.T
+        own = np.arange(len(block))
+        scores[own, own + start] = -np.inf
+        neighbours = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        neighbour_scores = np.take_along_axis(scores, neighbours, axis=1)
+        order = np.argsort(-neighbour_scores, axis=1)
+        yield (
+            start,
+            np.take_along_axis(neighbours, order, axis=1),
+            np.take_along_axis(neighbour_scores, order, axis=1),
+        )
+
+
+def compute_similar_games(
+    top_k=10,
+    dimensions=128,
+    content_weight=0.3,
+    block_size=512,
+    seed=42,
+    batch_size=5000,
+):
+    games = as_array(
+        Game.objects.order_by("id"), ["id", "genre_id", "publisher_id"]
+    )
+    game_ids = games[:, 0]
+    if len(game_ids) < 2 or top_k < 1:
+        SimilarGame.objects.all().delete()
+        bump_version(VERSION_NAMESPACE)
+        return 0
+
+    rng = np.random.default_rng(seed)
+    # Cosine similarity of the concatenation is the weighted sum of the
+    # interaction and content similarities.
+    embedding = np.hstack(
+        [
+            np.sqrt(1 - content_weight)
+            * normalize(interaction_embedding(game_ids, dimensions, rng)),
+            np.sqrt(content_weight)
+            * normalize(content_embedding(game_ids, games, dimensions, rng)),
+        ]
+    )
+
+    created = 0
+    with transaction.atomic():
+        SimilarGame.objects.all().delete()
+        pending = []
+        for start, neighbours, scores in top_neighbours(
+            embedding, top_k, block_size
+        ):
+            for offset, (row, row_scores) in enumerate(
+                zip(neighbours, scores)
+            ):
+                game_id = int(game_ids[start + offset])
+                pending.extend(
+                    SimilarGame(
+                        game_id=game_id,
+                        similar_id=int(game_ids[neighbour]),
+                        rank=rank,
+                        score=float(score),
+                    )
+                    for rank, (neighbour, score) in enumerate(
+                        zip(row, row_scores), start=1
+                    )
+                )
+            if len(pending) >= batch_size:
+                created += len(SimilarGame.objects.bulk_create(pending))
+                pending = []
+        created += len(SimilarGame.objects.bulk_create(pending))
+        bump_version(VERSION_NAMESPACE)
+    return created
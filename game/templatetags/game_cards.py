@@ -0,0 +1,31 @@
+from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+register = template.Library()
+
+
+def card_key(template_name, game):
+    # updated_at moves on every save, so a changed game gets a new key and
+    # its old card simply ages out.
+    return f"game_card:{template_name}:{game.pk}:{game.updated_at.timestamp()}"
+
+
+@register.simple_tag
+def game_cards(games, template_name):
+    games = list(games)
+    keys = [card_key(template_name, game) for game in games]
+    cards = cache.get_many(keys)
+    missing = {}
+    card_template = None
+    for key, game in zip(keys, games):
+        if key in cards or key in missing:
+            continue
+        card_template = card_template or get_template(template_name)
+        missing[key] = card_template.render({"game": game})
+    if missing:
+        cache.set_many(missing, settings.GAME_CARD_CACHE_SECONDS)
+        cards.update(missing)
+    return mark_safe("".join(cards[key] for key in keys))
@@ -1,5 +1,3 @@
-from urllib.parse import urlencode
-
 from django import template
 
 register = template.Library()
@@ -13,4 +11,4 @@ def query_transform(request, **kwargs):
             updated[key] = value
         else:
             updated.pop(key, 0)
-    return urlencode(updated)
+    return updated.urlencode()
@@ -1,23 +1,40 @@
+from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import path
 
-from game import views
-from game_hub import settings
+from game import async_views, views
+
+# Under ASGI the read-heavy pages use their async ORM variants.
+if settings.ASYNC_VIEWS:
+    index_view = async_views.AsyncIndexView.as_view()
+    game_list_view = async_views.AsyncGameListView.as_view()
+    game_detail_view = async_views.AsyncGameDetailView.as_view()
+    personal_page_view = async_views.AsyncPersonalPageView.as_view()
+else:
+    index_view = views.IndexView.as_view()
+    game_list_view = views.GameListView.as_view()
+    game_detail_view = views.GameDetailView.as_view()
+    personal_page_view = views.PersonalPageView.as_view()
 
 urlpatterns = [
     path(
         "",
-        views.IndexView.as_view(),
+        index_view,
         name="index"
     ),
     path(
         "games/",
-        views.GameListView.as_view(),
+        game_list_view,
         name="game-list"
     ),
+    path(
+        "games/autocomplete/",
+        views.game_autocomplete,
+        name="game-autocomplete"
+    ),
     path(
         "games/<int:pk>/",
-        views.GameDetailView.as_view(),
+        game_detail_view,
         name="game-detail"
     ),
     path(
@@ -102,7 +119,7 @@ urlpatterns = [
     ),
     path(
         "personal_page/",
-        views.PersonalPageView.as_view(),
+        personal_page_view,
         name="personal-page"
     ),
     path(
@@ -110,6 +127,11 @@ urlpatterns = [
         views.PlayerUpdateView.as_view(),
         name="player-update"
     ),
+    path(
+        "leaderboard/",
+        views.LeaderboardView.as_view(),
+        name="leaderboard"
+    ),
     path(
         "about/",
         views.AboutView.as_view(),
@@ -1,13 +1,29 @@
+from django.conf import settings
 from django.contrib.auth import login
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.paginator import Paginator
-from django.db.models import Avg, Count
+from django.db.models import Count, Exists, Max, OuterRef, Subquery
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
+from django.utils.cache import patch_cache_control
 from django.views import View, generic
 
+from game import (
+    autocomplete,
+    counters,
+    facets,
+    recommendations,
+    reference_data,
+    similarity,
+)
+from game.cache_versions import get_version
+from game.conditional import ConditionalGetMixin
+from game.leaderboards import leaderboards
+from game.page_cache import AnonymousPageCacheMixin
 from game.forms import (
     GameCreateForm,
+    GameFacetForm,
     GameSearchForm,
     GenreCreateForm,
     PlayerRegistrationForm,
@@ -18,102 +34,238 @@ from game.forms import (
 from game.models import (
     Game,
     Genre,
+    Platform,
     Player,
+    PlayerRecommendation,
     Publisher,
     Rating,
+    SimilarGame,
 )
+from game.pagination import KeysetPaginator
+from game.query_budget import query_budget
+from game.random_pick import pick_random_game_id
+from game_hub.db import serialized_write
 
 
-class IndexView(generic.TemplateView):
+class IndexView(AnonymousPageCacheMixin, generic.TemplateView):
     template_name = "game/index.html"
+    query_budget = 3
+    page_cache_models = (Player, Game, Genre, Publisher)
+
+    def get_counts(self):
+        return counters.get_counts()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        counts = self.get_counts()
 
-        context["num_players"] = Player.objects.count()
-        context["num_games"] = Game.objects.count()
-        context["num_publishers"] = Publisher.objects.count()
-        context["num_genres"] = Genre.objects.count()
+        context["num_players"] = counts["players"]
+        context["num_games"] = counts["games"]
+        context["num_publishers"] = counts["publishers"]
+        context["num_genres"] = counts["genres"]
         return context
 
 
-class GameListView(generic.ListView):
+class GameListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, generic.ListView
+):
     model = Game
     paginate_by = 6
     queryset = Game.objects.select_related("genre", "publisher")
+    query_budget = 12
+    page_cache_models = (Game, Genre, Publisher, Platform)
+
+    def get_validators(self):
+        latest = self.get_queryset().aggregate(Max("updated_at"))
+        # Saving or deleting any game bumps the facets version, which also
+        # covers deletes a max timestamp cannot see.
+        return (
+            latest["updated_at__max"],
+            get_version(facets.VERSION_NAMESPACE),
+            get_version(reference_data.VERSION_NAMESPACE),
+        )
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        title = self.request.GET.get("title", "")
-        genre_id = self.request.GET.get("genre")
-        publisher_id = self.request.GET.get("publisher")
+        self.search_form = GameSearchForm(self.request.GET)
+        self.facet_form = GameFacetForm(self.request.GET)
+        self.searched = self.search_form.search(queryset)
+        self.is_searched = self.searched is not queryset
+        self.filters = self.facet_form.facet_filters()
+        return facets.apply_filters(self.searched, self.filters)
+
+    def uses_cursor(self):
+        # Keyset pages follow title order, which would drop the search rank.
+        return (
+            settings.GAME_LIST_PAGINATION == "cursor" and not self.is_searched
+        )
 
-        if title:
-            queryset = queryset.filter(title__icontains=title)
-        if genre_id:
-            queryset = queryset.filter(genre__id=genre_id)
-        if publisher_id:
-            queryset = queryset.filter(publisher__id=publisher_id)
+    def paginate_queryset(self, queryset, page_size):
+        if not self.uses_cursor():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(
+            queryset, page_size, {"title": str, "id": int}
+        )
+        page = paginator.get_page(self.request.GET.get("cursor"))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_filter_choices(self):
+        return (
+            reference_data.get_genres(),
+            reference_data.get_publishers(),
+            reference_data.get_platforms(),
+        )
 
-        return queryset
+    def get_facet_counts(self):
+        game_ids = None
+        if self.is_searched:
+            game_ids = self.searched.order_by().values_list("id", flat=True)
+        return facets.get_index().counts(
+            self.facet_form.selection(), game_ids
+        )
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super().get_context_data(**kwargs)
-        title = self.request.GET.get("title", "")
-        genre_id = self.request.GET.get("genre")
-        publisher_id = self.request.GET.get("publisher")
-
-        context["search_form"] = GameSearchForm(initial={"title": title})
-        context["genres"] = Genre.objects.all()
-        context["publishers"] = Publisher.objects.all()
-        context["selected_genre"] = genre_id
-        context["selected_publisher"] = publisher_id
+        genres, publishers, platforms = self.get_filter_choices()
+        counts = self.get_facet_counts()
+        selected = self.facet_form.selected
+
+        context["search_form"] = self.search_form
+        context["facet_form"] = self.facet_form
+        context["genres"] = genres
+        context["publishers"] = publishers
+        context["genre_facets"] = facets.options(
+            genres, counts["genre"], selected("genre")
+        )
+        context["publisher_facets"] = facets.options(
+            publishers, counts["publisher"], selected("publisher")
+        )
+        context["platform_facets"] = facets.options(
+            platforms, counts["platform"], selected("platform")
+        )
+        context["year_facets"] = facets.decades(counts["year"])
+        context["is_filtered"] = bool(self.filters)
         return context
 
 
-class GameDetailView(LoginRequiredMixin, generic.DetailView):
+@query_budget(1)
+def game_autocomplete(request):
+    matches = autocomplete.get_index().complete(
+        request.GET.get("q", "")[:100], settings.AUTOCOMPLETE_LIMIT
+    )
+    response = JsonResponse(
+        {
+            "results": [
+                {
+                    "id": game_id,
+                    "title": title,
+                    "url": reverse("game:game-detail", args=[game_id]),
+                }
+                for game_id, title in matches
+            ]
+        }
+    )
+    patch_cache_control(response, max_age=settings.AUTOCOMPLETE_MAX_AGE)
+    return response
+
+
+class GameDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
     model = Game
     template_name = "game/game_detail.html"
     context_object_name = "game"
+    query_budget = {"GET": 9, "POST": 14}
+
+    def get_validators(self):
+        user = self.request.user
+        similar_updated_at = (
+            SimilarGame.objects.filter(game_id=OuterRef("pk"))
+            .values("game_id")
+            .annotate(latest=Max("similar__updated_at"))
+            .values("latest")
+        )
+        rating_updated_at = Rating.objects.filter(
+            game_id=OuterRef("pk"), player_id=user.pk
+        ).values("updated_at")
+        row = (
+            Game.objects.filter(pk=self.kwargs["pk"])
+            .annotate(
+                similar_updated_at=Subquery(similar_updated_at),
+                rating_updated_at=Subquery(rating_updated_at),
+                in_wishlist=Exists(
+                    game_status_links(user, OuterRef("pk"), "wishlist_games")
+                ),
+                in_completed=Exists(
+                    game_status_links(user, OuterRef("pk"), "completed_games")
+                ),
+            )
+            .values_list(
+                "updated_at",
+                "similar_updated_at",
+                "rating_updated_at",
+                "in_wishlist",
+                "in_completed",
+            )
+            .first()
+        )
+        if row is None:
+            return None
+        return (
+            *row,
+            get_version(similarity.VERSION_NAMESPACE),
+            get_version(reference_data.VERSION_NAMESPACE),
+        )
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        game = self.get_object()
-        average_rating = (
-            Rating.objects.filter(game=game).aggregate(
-                Avg("score"))["score__avg"] or 0
+    def get_player_state(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return None, False, False
+        return (
+            Rating.objects.filter(game=self.object, player=user).first(),
+            has_game_status(user, self.object.pk, "wishlist_games"),
+            has_game_status(user, self.object.pk, "completed_games"),
         )
-        user_rating = None
-        if self.request.user.is_authenticated:
-            user_rating = Rating.objects.filter(
-                game=game, player=self.request.user
-            ).first()
-
-        user_votes_count = (
-            Rating.objects.filter(game=game).values("player")
-            .distinct().count()
+
+    def get_similar_games(self):
+        return list(
+            SimilarGame.objects.filter(game=self.object)
+            .select_related("similar")
+            .order_by("rank")
         )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        game = self.object
+        user_rating, in_wishlist, in_completed = self.get_player_state()
         range_list = range(11)
         context.update(
             {
-                "average_rating": average_rating,
+                "average_rating": game.rating_avg,
                 "user_rating": user_rating,
                 "form": RatingForm(),
                 "range": range_list,
-                "user_votes_count": user_votes_count,
+                "user_votes_count": game.rating_count,
+                "in_wishlist": in_wishlist,
+                "in_completed": in_completed,
+                "similar_games": self.get_similar_games(),
             }
         )
         return context
 
+    def save_rating(self, game, score):
+        with serialized_write():
+            Rating.objects.update_or_create(
+                player=self.request.user,
+                game=game,
+                defaults={"score": score},
+            )
+
     def post(self, request, *args, **kwargs):
         form = RatingForm(request.POST)
         game = self.get_object()
         if form.is_valid():
-            rating, created = Rating.objects.update_or_create(
-                player=request.user,
-                game=game,
-                defaults={"score": form.cleaned_data["score"]},
-            )
+            self.save_rating(game, form.cleaned_data["score"])
             return redirect("game:game-detail", pk=game.pk)
         return self.get(request, *args, **kwargs)
 
@@ -122,11 +274,13 @@ class GameCreateView(LoginRequiredMixin, generic.CreateView):
     model = Game
     form_class = GameCreateForm
     success_url = reverse_lazy("game:game-list")
+    query_budget = {"GET": 2, "POST": 13}
 
 
 class GameUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Game
     form_class = GameCreateForm
+    query_budget = {"GET": 4, "POST": 15}
 
     def get_success_url(self):
         return reverse("game:game-detail", kwargs={"pk": self.object.pk})
@@ -135,12 +289,26 @@ class GameUpdateView(LoginRequiredMixin, generic.UpdateView):
 class GameDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = Game
     success_url = reverse_lazy("game:game-list")
+    query_budget = {"GET": 3, "POST": 15}
 
 
-class GenreListView(generic.ListView):
+class GenreListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, generic.ListView
+):
     model = Genre
     template_name = "game/genre_list.html"
     context_object_name = "genre_list"
+    query_budget = 4
+    page_cache_models = (Genre, Game)
+
+    def get_validators(self):
+        latest = Genre.objects.aggregate(Max("updated_at"))
+        # Game counts move whenever a game is saved or deleted.
+        return (
+            latest["updated_at__max"],
+            get_version(facets.VERSION_NAMESPACE),
+            get_version(reference_data.VERSION_NAMESPACE),
+        )
 
     def get_queryset(self):
         queryset = Genre.objects.annotate(num_games=Count("game"))
@@ -159,11 +327,13 @@ class GenreListView(generic.ListView):
 
 class GenreDetailView(LoginRequiredMixin, generic.DetailView):
     model = Genre
+    query_budget = 6
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         genre = self.object
         context["games"] = Game.objects.filter(genre_id=genre.pk)
+        context.update(leaderboards(Game.objects.filter(genre_id=genre.pk)))
         return context
 
 
@@ -172,12 +342,14 @@ class GenreCreateView(LoginRequiredMixin, generic.CreateView):
     form_class = GenreCreateForm
     template_name = "game/genre_create_form.html"
     success_url = reverse_lazy("game:genre-list")
+    query_budget = {"GET": 2, "POST": 6}
 
 
 class GenresUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Genre
     form_class = GenreCreateForm
     template_name = "game/genre_create_form.html"
+    query_budget = {"GET": 3, "POST": 8}
 
     def get_success_url(self):
         return reverse("game:genre-detail", kwargs={"pk": self.object.pk})
@@ -186,12 +358,24 @@ class GenresUpdateView(LoginRequiredMixin, generic.UpdateView):
 class GenreDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = Genre
     success_url = reverse_lazy("game:genre-list")
+    query_budget = {"GET": 3, "POST": 19}
 
 
-class PublisherListView(generic.ListView):
+class PublisherListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, generic.ListView
+):
     model = Publisher
     template_name = "game/publisher_list.html"
     context_object_name = "publisher_list"
+    query_budget = 5
+    page_cache_models = (Publisher,)
+
+    def get_validators(self):
+        latest = self.get_queryset().aggregate(Max("updated_at"))
+        return (
+            latest["updated_at__max"],
+            get_version(reference_data.VERSION_NAMESPACE),
+        )
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -208,9 +392,7 @@ class PublisherListView(generic.ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        countries = (Publisher.objects.values_list("country", flat=True)
-                     .distinct())
-        context["countries"] = list(set(countries))
+        context["countries"] = reference_data.get_publisher_countries()
         context["selected_country"] = self.request.GET.get("country", "")
         context["selected_ordering"] = self.request.GET.get("ordering", "")
         return context
@@ -218,10 +400,14 @@ class PublisherListView(generic.ListView):
 
 class PublisherDetailView(LoginRequiredMixin, generic.DetailView):
     model = Publisher
+    query_budget = 6
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["games"] = Game.objects.filter(publisher=self.object)
+        context.update(
+            leaderboards(Game.objects.filter(publisher=self.object))
+        )
         return context
 
 
@@ -230,12 +416,14 @@ class PublisherCreateView(LoginRequiredMixin, generic.CreateView):
     form_class = PublisherCreateForm
     template_name = "game/publisher_create_form.html"
     success_url = reverse_lazy("game:publisher-list")
+    query_budget = {"GET": 2, "POST": 6}
 
 
 class PublisherUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Publisher
     form_class = PublisherCreateForm
     template_name = "game/publisher_create_form.html"
+    query_budget = {"GET": 3, "POST": 8}
 
     def get_success_url(self):
         return reverse("game:publisher-detail", kwargs={"pk": self.object.pk})
@@ -244,12 +432,14 @@ class PublisherUpdateView(LoginRequiredMixin, generic.UpdateView):
 class PublisherDeleteView(LoginRequiredMixin, generic.DeleteView):
     model = Publisher
     success_url = reverse_lazy("game:publisher-list")
+    query_budget = {"GET": 3, "POST": 19}
 
 
 class RegistrationView(generic.CreateView):
     form_class = PlayerRegistrationForm
     template_name = "registration/register.html"
     success_url = reverse_lazy("game:personal-page")
+    query_budget = {"GET": 2, "POST": 9}
 
     def form_valid(self, form):
         user = form.save()
@@ -262,37 +452,52 @@ class PlayerUpdateView(LoginRequiredMixin, generic.UpdateView):
     form_class = PlayerUpdateForm
     template_name = "game/player_update.html"
     success_url = reverse_lazy("game:personal-page")
+    query_budget = {"GET": 2, "POST": 4}
 
     def get_object(self):
         return self.request.user
 
 
+def game_status_links(player, game_id, field_name):
+    through = getattr(Player, field_name).through
+    return through.objects.filter(player_id=player.pk, game_id=game_id)
+
+
+def has_game_status(player, game_id, field_name):
+    return game_status_links(player, game_id, field_name).exists()
+
+
 def update_game_status(request, game_id, field_name):
-    game = get_object_or_404(Game, id=game_id)
-    player = request.user
-    field = getattr(player, field_name)
-
-    if game in field.all():
-        field.remove(game)
-    else:
-        field.add(game)
+    with serialized_write():
+        removed, _ = game_status_links(
+            request.user, game_id, field_name
+        ).delete()
+        if not removed:
+            game = get_object_or_404(Game, id=game_id)
+            through = getattr(Player, field_name).through
+            through.objects.bulk_create(
+                [through(player_id=request.user.pk, game_id=game.pk)],
+                ignore_conflicts=True,
+            )
+        recommendations.mark_stale([request.user.pk])
     return redirect("game:game-detail", pk=game_id)
 
 
+@query_budget(8)
 def update_wishlist_status(request, game_id):
     return update_game_status(request, game_id, "wishlist_games")
 
 
+@query_budget(8)
 def update_completed_status(request, game_id):
     return update_game_status(request, game_id, "completed_games")
 
 
 class PersonalPageView(LoginRequiredMixin, generic.TemplateView):
     template_name = "game/personal_page.html"
+    query_budget = 7
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-
+    def get_pages(self):
         wishlist_games = self.request.user.wishlist_games.all()
         completed_games = self.request.user.completed_games.all()
 
@@ -306,6 +511,22 @@ class PersonalPageView(LoginRequiredMixin, generic.TemplateView):
         completed_page_obj = completed_paginator.get_page(
             completed_page_number
         )
+        return wishlist_page_obj, completed_page_obj
+
+    def get_recommendations(self):
+        return list(
+            PlayerRecommendation.objects.filter(
+                player_id=self.request.user.pk
+            )
+            .select_related("game")
+            .order_by("rank")
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        wishlist_page_obj, completed_page_obj = self.get_pages()
+        wishlist_paginator = wishlist_page_obj.paginator
+        completed_paginator = completed_page_obj.paginator
 
         context.update(
             {
@@ -313,19 +534,38 @@ class PersonalPageView(LoginRequiredMixin, generic.TemplateView):
                 "completed_games": completed_page_obj,
                 "is_wishlist_paginated": wishlist_paginator.num_pages > 1,
                 "is_completed_paginated": completed_paginator.num_pages > 1,
+                "recommendations": self.get_recommendations(),
             }
         )
 
         return context
 
 
-class AboutView(generic.TemplateView):
+class LeaderboardView(generic.TemplateView):
+    template_name = "game/leaderboard.html"
+    query_budget = 4
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(leaderboards(Game.objects.all()))
+        return context
+
+
+class AboutView(AnonymousPageCacheMixin, generic.TemplateView):
     template_name = "game/about.html"
+    query_budget = 2
 
 
 class RandomGameView(View):
+    query_budget = 2
+
     def get(self, request, *args, **kwargs):
-        random_game = Game.objects.order_by("?").first()
-        if random_game:
-            return redirect("game:game-detail", pk=random_game.pk)
+        genre_id = request.GET.get("genre", "")
+        platform_id = request.GET.get("platform", "")
+        random_game_id = pick_random_game_id(
+            genre_id=int(genre_id) if genre_id.isdigit() else None,
+            platform_id=int(platform_id) if platform_id.isdigit() else None,
+        )
+        if random_game_id:
+            return redirect("game:game-detail", pk=random_game_id)
         return redirect("game:game-list")
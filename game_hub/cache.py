@@ -0,0 +1,226 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_expires_idx ON cache (expires);
+CREATE INDEX IF NOT EXISTS cache_accessed_idx ON cache (accessed);
+"""
+
+
+class SQLiteCache(BaseCache):
+    # One SQLite file in WAL mode shared by every worker on the host: reads
+    # run concurrently and never wait for the single writer.
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.path = location
+        self.busy_timeout = int(options.get("BUSY_TIMEOUT_MS", 5000))
+        # Recency is only written back once per key in this window, so hot
+        # reads do not each turn into a write.
+        self.access_resolution = float(options.get("ACCESS_RESOLUTION", 60))
+        self.cull_every = int(options.get("CULL_EVERY", 100))
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            # Connections must not cross a fork.
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout / 1000,
+                isolation_level=None,
+            )
+            connection.execute("PRAGMA journal_mode = wal")
+            connection.execute("PRAGMA synchronous = normal")
+            connection.executescript(SCHEMA)
+            local.connection, local.pid = connection, os.getpid()
+        return local.connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connection()
+        # BEGIN IMMEDIATE takes the write lock before reading, so workers
+        # updating the same key never lose a write.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _write(self, sql, params=()):
+        with self._transaction() as connection:
+            return connection.execute(sql, params).rowcount
+
+    def _dumps(self, value):
+        return pickle.dumps(value, self.pickle_protocol)
+
+    def _fetch(self, keys):
+        now = time.time()
+        placeholders = ", ".join("?" * len(keys))
+        rows = self._connection().execute(
+            f"SELECT key, value, expires, accessed FROM cache "
+            f"WHERE key IN ({placeholders})",
+            keys,
+        )
+        found, touched = {}, []
+        for key, value, expires, accessed in rows:
+            if expires is not None and expires <= now:
+                continue
+            found[key] = pickle.loads(value)
+            if now - accessed > self.access_resolution:
+                touched.append((now, key))
+        if touched:
+            with self._transaction() as connection:
+                connection.executemany(
+                    "UPDATE cache SET accessed = ? WHERE key = ?", touched
+                )
+        return found
+
+    def _store(self, rows, mode="REPLACE"):
+        now = time.time()
+        with self._transaction() as connection:
+            stored = 0
+            for key, value, timeout in rows:
+                if mode == "IGNORE":
+                    # add() may overwrite a row that has already expired.
+                    connection.execute(
+                        "DELETE FROM cache WHERE key = ? AND expires <= ?",
+                        (key, now),
+                    )
+                stored += connection.execute(
+                    f"INSERT OR {mode} INTO cache "
+                    f"(key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                    (key, self._dumps(value), timeout, now),
+                ).rowcount
+        self._writes += len(rows)
+        if self._writes >= self.cull_every:
+            self._writes = 0
+            self._cull()
+        return stored
+
+    def _cull(self):
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM cache WHERE expires <= ?", (time.time(),)
+            )
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM cache"
+            ).fetchone()
+            if count > self._max_entries:
+                # Least recently used first.
+                connection.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                    "ORDER BY accessed LIMIT ?)",
+                    (count // self._cull_frequency or 1,),
+                )
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._fetch([key]).get(key, default)
+
+    def get_many(self, keys, version=None):
+        mapped = {
+            self.make_and_validate_key(key, version=version): key
+            for key in keys
+        }
+        if not mapped:
+            return {}
+        return {
+            mapped[key]: value
+            for key, value in self._fetch(list(mapped)).items()
+        }
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._connection().execute(
+            "SELECT 1 FROM cache WHERE key = ? "
+            "AND (expires IS NULL OR expires > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._store([(key, value, self.get_backend_timeout(timeout))])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        expires = self.get_backend_timeout(timeout)
+        self._store(
+            [
+                (self.make_and_validate_key(key, version), value, expires)
+                for key, value in data.items()
+            ]
+        )
+        return []
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(
+            self._store(
+                [(key, value, self.get_backend_timeout(timeout))], "IGNORE"
+            )
+        )
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(
+            self._write(
+                "UPDATE cache SET expires = ? WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (self.get_backend_timeout(timeout), key, time.time()),
+            )
+        )
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT value FROM cache WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Key '{key}' not found")
+            value = pickle.loads(row[0]) + delta
+            connection.execute(
+                "UPDATE cache SET value = ? WHERE key = ?",
+                (self._dumps(value), key),
+            )
+        return value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return bool(self._write("DELETE FROM cache WHERE key = ?", (key,)))
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version) for key in keys]
+        if keys:
+            placeholders = ", ".join("?" * len(keys))
+            self._write(
+                f"DELETE FROM cache WHERE key IN ({placeholders})", keys
+            )
+
+    def clear(self):
+        self._write("DELETE FROM cache")
+
+    def close(self, **kwargs):
+        # Connections are reused across requests; Django calls this after
+        # each one.
+        pass
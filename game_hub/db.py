@@ -0,0 +1,77 @@
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Stored in the database file, so set once per process rather than on
+# every connection.
+PERSISTENT_PRAGMAS = {"journal_mode"}
+
+_thread_lock = threading.Lock()
+_local = threading.local()
+_lock_files = {}
+_persisted = set()
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    # Run on the driver connection: connection setup is not one of the
+    # request's queries, so budgets and Server-Timing do not count it.
+    database = connection.connection
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        if name in PERSISTENT_PRAGMAS:
+            key = (connection.settings_dict["NAME"], name, value)
+            if key in _persisted:
+                continue
+            _persisted.add(key)
+        database.execute(f"PRAGMA {name} = {value}")
+
+
+def _lock_file(connection):
+    path = f"{connection.settings_dict['NAME']}.write-lock"
+    lock_file = _lock_files.get(path)
+    if lock_file is None:
+        lock_file = _lock_files[path] = open(path, "a")
+    return lock_file
+
+
+@contextmanager
+def _process_lock(connection):
+    if fcntl is None or connection.is_in_memory_db():
+        yield
+        return
+    lock_file = _lock_file(connection)
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def serialized_write(using=DEFAULT_DB_ALIAS):
+    connection = connections[using]
+    if connection.vendor != "sqlite" or not settings.SQLITE_SERIALIZE_WRITES:
+        with transaction.atomic(using=using):
+            yield
+        return
+    if getattr(_local, "holding", False):
+        with transaction.atomic(using=using):
+            yield
+        return
+    # SQLite allows one writer at a time. Queuing here is cheaper than
+    # upgrading a read transaction and failing with "database is locked".
+    with _thread_lock, _process_lock(connection):
+        _local.holding = True
+        try:
+            with transaction.atomic(using=using):
+                yield
+        finally:
+            _local.holding = False
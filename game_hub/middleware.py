@@ -0,0 +1,163 @@
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from game.query_budget import get_query_budget
+from game_hub.routers import replica_reads
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.queries += 1
+
+
+class HybridMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+
+@contextmanager
+def capture_queries(metrics):
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        yield
+
+
+class ServerTimingMiddleware(HybridMiddleware):
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.SERVER_TIMING_ENABLED:
+            return self.get_response(request)
+
+        metrics = request.metrics = RequestMetrics()
+        start = time.perf_counter()
+        with capture_queries(metrics):
+            response = self.get_response(request)
+        self.add_timings(request, response, metrics, start)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.SERVER_TIMING_ENABLED:
+            return await self.get_response(request)
+
+        metrics = request.metrics = RequestMetrics()
+        start = time.perf_counter()
+        with capture_queries(metrics):
+            response = await self.get_response(request)
+        self.add_timings(request, response, metrics, start)
+        return response
+
+    def add_timings(self, request, response, metrics, start):
+        total_time = time.perf_counter() - start
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={metrics.sql_time * 1000:.1f}'
+                f';desc="{metrics.queries} queries"',
+                f"tpl;dur={metrics.render_time * 1000:.1f}",
+                f"view;dur={(total_time - metrics.render_time) * 1000:.1f}",
+                f"total;dur={total_time * 1000:.1f}",
+            ]
+        )
+        self.check_budgets(request, metrics, total_time)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_query_budget(view_func, request.method)
+
+    def process_template_response(self, request, response):
+        metrics = getattr(request, "metrics", None)
+        if metrics is None:
+            return response
+        render = response.render
+
+        def timed_render():
+            start = time.perf_counter()
+            try:
+                return render()
+            finally:
+                metrics.render_time += time.perf_counter() - start
+
+        response.render = timed_render
+        return response
+
+    def check_budgets(self, request, metrics, total_time):
+        budgets = settings.REQUEST_BUDGETS
+        exceeded = []
+        if total_time * 1000 > budgets["total_ms"]:
+            exceeded.append(f"total {total_time * 1000:.1f}ms")
+        if metrics.sql_time * 1000 > budgets["sql_ms"]:
+            exceeded.append(f"sql {metrics.sql_time * 1000:.1f}ms")
+        if metrics.queries > budgets["queries"]:
+            exceeded.append(f"{metrics.queries} queries")
+        view_budget = getattr(request, "query_budget", None)
+        if (
+            settings.LOG_VIEW_QUERY_BUDGETS
+            and view_budget is not None
+            and metrics.queries > view_budget
+        ):
+            exceeded.append(
+                f"{metrics.queries} queries, view budget {view_budget}"
+            )
+        if exceeded:
+            logger.warning(
+                "Request over budget: %s %s (%s)",
+                request.method,
+                request.path,
+                ", ".join(exceeded),
+            )
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with replica_reads(self.use_replicas(request)) as state:
+            response = self.get_response(request)
+        return self.pin(response, state)
+
+    async def __acall__(self, request):
+        with replica_reads(self.use_replicas(request)) as state:
+            response = await self.get_response(request)
+        return self.pin(response, state)
+
+    def use_replicas(self, request):
+        pinned = settings.REPLICA_PIN_COOKIE in request.COOKIES
+        return request.method in self.SAFE_METHODS and not pinned
+
+    def pin(self, response, state):
+        if state.wrote:
+            # Keep this client on the primary until replicas have caught up.
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
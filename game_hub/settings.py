@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 import dj_database_url
@@ -52,6 +53,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "game_hub.middleware.ServerTimingMiddleware",
+    "game_hub.middleware.ReplicaRoutingMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -96,6 +99,66 @@ DATABASES["default"].update(db_from_env)
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
+# Comma-separated URLs of read replicas, exposed as replica1, replica2, ...
+REPLICA_DATABASES = []
+for number, url in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICA_URLS", "").split(",")),
+    start=1,
+):
+    alias = f"replica{number}"
+    DATABASES[alias] = dj_database_url.parse(url.strip(), conn_max_age=500)
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ["game_hub.routers.ReplicaRouter"]
+
+# Clients that wrote something read from the primary for this long
+REPLICA_PIN_COOKIE = "db_pin"
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 5))
+
+# "sqlite" shares one WAL-mode cache file between all workers on the host;
+# "locmem" keeps a separate cache in each process.
+CACHE_BACKEND = os.environ.get(
+    "CACHE_BACKEND", "locmem" if DEBUG else "sqlite"
+)
+if CACHE_BACKEND == "sqlite":
+    CACHES = {
+        "default": {
+            "BACKEND": "game_hub.cache.SQLiteCache",
+            "LOCATION": os.environ.get(
+                "CACHE_LOCATION", str(BASE_DIR / "cache.sqlite3")
+            ),
+            "OPTIONS": {
+                "MAX_ENTRIES": int(
+                    os.environ.get("CACHE_MAX_ENTRIES", 50_000)
+                ),
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Applied to every new SQLite connection by game_hub.db.configure_sqlite,
+# except journal_mode, which persists in the file and is set once per process
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "wal"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "normal"),
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    # Negative values are KiB, so this is a 20 MB page cache
+    "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -20000)),
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 128 * 1024 * 1024)),
+}
+
+# Run hot write paths one at a time across workers instead of letting
+# concurrent transactions fail with "database is locked"
+SQLITE_SERIALIZE_WRITES = (
+    os.environ.get("SQLITE_SERIALIZE_WRITES", "") != "False"
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -139,19 +202,44 @@ AWS_S3_FILE_OVERWRITE = False
 
 AWS_DEFAULT_ACL = None
 
-STORAGES = {
-    # Media files
-    "default": {
-        "BACKEND": "storages.backends.s3boto3.S3StaticStorage",
-    },
-    # Css and JS files
-    "staticfiles": {
-        "BACKEND": "storages.backends.s3boto3.S3StaticStorage",
-    },
-}
+# "s3" serves media and static files from AWS_STORAGE_BUCKET_NAME; "local"
+# keeps them under MEDIA_ROOT and STATIC_ROOT for offline deployments.
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "s3")
+
+# Serve MEDIA_ROOT through Django in "local" mode. Django's static view is
+# not meant for production, so outside DEBUG the front-end server should
+# serve MEDIA_ROOT at MEDIA_URL instead
+SERVE_MEDIA = os.environ.get("SERVE_MEDIA", str(DEBUG)) == "True"
 
-STATIC_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/static/"
-MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/media/"
+# Per-process number of file URLs the storages keep memoized
+STORAGE_URL_CACHE_SIZE = 10_000
+
+if STORAGE_BACKEND == "local":
+    STORAGES = {
+        "default": {
+            "BACKEND": "game_hub.storage.MemoizedFileSystemStorage",
+        },
+        "staticfiles": {
+            "BACKEND": "game_hub.storage.MemoizedStaticFilesStorage",
+        },
+    }
+
+    STATIC_URL = "/static/"
+    MEDIA_URL = "/media/"
+else:
+    STORAGES = {
+        # Media files
+        "default": {
+            "BACKEND": "game_hub.storage.MemoizedS3StaticStorage",
+        },
+        # Css and JS files
+        "staticfiles": {
+            "BACKEND": "game_hub.storage.MemoizedS3StaticStorage",
+        },
+    }
+
+    STATIC_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/static/"
+    MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/media/"
 
 STATIC_ROOT = "staticfiles/"
 
@@ -172,6 +260,68 @@ LOGOUT_REDIRECT_URL = "/"
 
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
+# The Server-Timing header tells any client how long queries and templates
+# take, so it is only on by default in development.
+SERVER_TIMING_ENABLED = (
+    os.environ.get("SERVER_TIMING_ENABLED", str(DEBUG)) == "True"
+)
+
+# Requests exceeding any of these are logged by ServerTimingMiddleware
+REQUEST_BUDGETS = {
+    "total_ms": float(os.environ.get("REQUEST_BUDGET_TOTAL_MS", 500)),
+    "sql_ms": float(os.environ.get("REQUEST_BUDGET_SQL_MS", 200)),
+    "queries": int(os.environ.get("REQUEST_BUDGET_QUERIES", 50)),
+}
+
+# Log requests that run more queries than their view's query_budget
+LOG_VIEW_QUERY_BUDGETS = (
+    os.environ.get("LOG_VIEW_QUERY_BUDGETS", "") != "False"
+)
+
+# Resized WebP copies built for uploaded game, genre and publisher images
+IMAGE_VARIANT_WIDTHS = (320, 640, 960)
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANT_WORKERS = int(os.environ.get("IMAGE_VARIANT_WORKERS", 2))
+
+# Serve the index, game list, game detail and personal pages with async
+# views; meant for ASGI deployments (see README)
+ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS", "") == "True"
+
+# Leaderboards rank games by a Bayesian average that starts every game at
+# RATING_PRIOR_VOTES votes of RATING_PRIOR_MEAN; run reconcile_ratings after
+# changing either
+RATING_PRIOR_MEAN = float(os.environ.get("RATING_PRIOR_MEAN", 5.5))
+RATING_PRIOR_VOTES = int(os.environ.get("RATING_PRIOR_VOTES", 10))
+
+# Trending scores halve every TRENDING_HALF_LIFE_DAYS. They are stored as
+# growth since an epoch that starts at TRENDING_EPOCH and is moved forward
+# every 64 half-lives
+TRENDING_HALF_LIFE_DAYS = float(
+    os.environ.get("TRENDING_HALF_LIFE_DAYS", 7)
+)
+TRENDING_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+LEADERBOARD_SIZE = 10
+
+# Title suggestions served from the in-process prefix index
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_AGE = 30
+
+# Anonymous pages are served from the cache for PAGE_CACHE_SECONDS (0 turns
+# the cache off); expired copies are kept PAGE_CACHE_STALE_SECONDS longer and
+# served while one worker rebuilds them.
+PAGE_CACHE_SECONDS = int(
+    os.environ.get("PAGE_CACHE_SECONDS", 0 if DEBUG else 60)
+)
+PAGE_CACHE_STALE_SECONDS = int(os.environ.get("PAGE_CACHE_STALE_SECONDS", 300))
+
+# Rendered game cards are keyed by game id and updated_at.
+GAME_CARD_CACHE_SECONDS = 60 * 60 * 24
+
+# "offset" uses page numbers, "cursor" uses keyset pagination without COUNT(*).
+# Searches always use page numbers so results keep their rank order.
+GAME_LIST_PAGINATION = os.environ.get("GAME_LIST_PAGINATION", "offset")
+
 INTERNAL_IPS = [
     "127.0.0.1",
     "localhost",
@@ -0,0 +1,64 @@
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import StaticFilesStorage
+from django.core.files.storage import FileSystemStorage
+from storages.backends.s3 import S3StaticStorage
+
+
+class MemoizedUrlMixin:
+    # Every card calls url() for its image and each srcset variant. A name
+    # maps to the same unsigned URL until its file is replaced, so the
+    # result is kept per process instead of rebuilt on every render.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._urls = {}
+        self._urls_lock = Lock()
+
+    @property
+    def memoize_urls(self):
+        # Signed URLs expire, so they are built fresh every time.
+        return not getattr(self, "querystring_auth", False)
+
+    def url(self, name, *args, **kwargs):
+        if args or kwargs or not self.memoize_urls:
+            return super().url(name, *args, **kwargs)
+        url = self._urls.get(name)
+        if url is None:
+            url = super().url(name)
+            with self._urls_lock:
+                if len(self._urls) >= settings.STORAGE_URL_CACHE_SIZE:
+                    self._urls.clear()
+                self._urls[name] = url
+        return url
+
+    def forget_url(self, name):
+        with self._urls_lock:
+            self._urls.pop(name, None)
+
+    def _clear_cached_properties(self, setting, **kwargs):
+        # Called by FileSystemStorage when MEDIA_URL or STATIC_URL change.
+        super()._clear_cached_properties(setting, **kwargs)
+        with self._urls_lock:
+            self._urls.clear()
+
+    def _save(self, name, content):
+        name = super()._save(name, content)
+        self.forget_url(name)
+        return name
+
+    def delete(self, name):
+        super().delete(name)
+        self.forget_url(name)
+
+
+class MemoizedS3StaticStorage(MemoizedUrlMixin, S3StaticStorage):
+    pass
+
+
+class MemoizedFileSystemStorage(MemoizedUrlMixin, FileSystemStorage):
+    pass
+
+
+class MemoizedStaticFilesStorage(MemoizedUrlMixin, StaticFilesStorage):
+    pass
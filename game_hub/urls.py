@@ -19,7 +19,8 @@ from debug_toolbar.toolbar import debug_toolbar_urls
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
+from django.views.static import serve
 
 urlpatterns = ([
     path("admin/", admin.site.urls),
@@ -27,3 +28,13 @@ urlpatterns = ([
     path("accounts/", include("django.contrib.auth.urls")),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
                + debug_toolbar_urls())
+
+if settings.STORAGE_BACKEND == "local" and settings.SERVE_MEDIA:
+    # Offline deployments have no bucket in front of uploaded images.
+    urlpatterns += [
+        re_path(
+            rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.*)$",
+            serve,
+            {"document_root": settings.MEDIA_ROOT},
+        ),
+    ]
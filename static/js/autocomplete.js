@@ -0,0 +1,40 @@
+document.querySelectorAll("[data-autocomplete-url]").forEach(form => {
+    const input = form.querySelector("input[name=title]");
+    const results = document.createElement("div");
+    let controller = null;
+
+    results.className = "list-group autocomplete-results";
+    input.setAttribute("autocomplete", "off");
+    input.closest(".search-box").appendChild(results);
+
+    input.addEventListener("input", function () {
+        const query = this.value.trim();
+        if (controller) {
+            controller.abort();
+        }
+        if (!query) {
+            results.replaceChildren();
+            return;
+        }
+        controller = new AbortController();
+        const url = `${form.dataset.autocompleteUrl}?q=${encodeURIComponent(query)}`;
+        fetch(url, {signal: controller.signal})
+            .then(response => response.json())
+            .then(data => {
+                results.replaceChildren(...data.results.map(result => {
+                    const link = document.createElement("a");
+                    link.className = "list-group-item list-group-item-action";
+                    link.href = result.url;
+                    link.textContent = result.title;
+                    return link;
+                }));
+            })
+            .catch(() => {});
+    });
+
+    document.addEventListener("click", event => {
+        if (!results.contains(event.target) && event.target !== input) {
+            results.replaceChildren();
+        }
+    });
+});
@@ -16,3 +16,9 @@ document.querySelectorAll(".card-img-top").forEach(image => {
         this.style.transition = "transform 0.3s";
     });
 });
+
+document.querySelectorAll(".facet-filters input[type=checkbox]").forEach(box => {
+    box.addEventListener("change", function () {
+        this.form.submit();
+    });
+});
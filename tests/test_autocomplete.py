@@ -0,0 +1,124 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from game import autocomplete
+from game.autocomplete import TitleIndex
+from game.cache_versions import increment_version
+from game.models import Game, Genre, Publisher
+
+
+class TitleIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = TitleIndex(
+            [
+                (1, "Dark Souls"),
+                (2, "Darkest Dungeon"),
+                (3, "Pokémon Red"),
+                (4, "Soul Calibur"),
+                (5, "The Legend of Zelda"),
+            ]
+        )
+
+    def titles(self, query):
+        return [title for _, title in self.index.complete(query)]
+
+    def test_title_prefixes_come_before_word_matches(self):
+        self.assertEqual(self.titles("sou"), ["Soul Calibur", "Dark Souls"])
+        self.assertEqual(self.titles("dark"), ["Dark Souls", "Darkest Dungeon"])
+
+    def test_matching_ignores_case_accents_and_punctuation(self):
+        self.assertEqual(self.titles("POKEMON"), ["Pokémon Red"])
+        self.assertEqual(self.titles("legend of"), ["The Legend of Zelda"])
+        self.assertEqual(self.titles("  !! "), [])
+
+    def test_fuzzy_fallback_corrects_typos(self):
+        self.assertEqual(self.titles("zedla"), ["The Legend of Zelda"])
+        self.assertEqual(self.titles("dark suols"), ["Dark Souls"])
+        self.assertEqual(self.titles("qwerty"), [])
+
+    def test_limit_caps_results(self):
+        self.assertEqual(len(self.index.complete("d", limit=1)), 1)
+
+    def test_add_and_remove_update_in_place(self):
+        self.index.add(6, "Zelda II")
+        self.index.add(1, "Demon's Souls")
+        self.index.remove(2)
+
+        self.assertEqual(self.titles("zel"), ["Zelda II", "The Legend of Zelda"])
+        self.assertEqual(self.titles("dark"), [])
+        self.assertEqual(self.titles("demon"), ["Demon's Souls"])
+
+
+class GameAutocompleteViewTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.game = self.create_game("Hollow Knight")
+        self.url = reverse("game:game-autocomplete")
+
+    def create_game(self, title):
+        return Game.objects.create(
+            title=title,
+            description=title,
+            release_year=2017,
+            genre=self.genre,
+            publisher=self.publisher,
+            image="game.jpg",
+            link=f"https://example.com/{title}",
+        )
+
+    def test_returns_matching_titles_with_links(self):
+        response = self.client.get(self.url, {"q": "holl"})
+
+        self.assertEqual(
+            response.json(),
+            {
+                "results": [
+                    {
+                        "id": self.game.pk,
+                        "title": "Hollow Knight",
+                        "url": reverse("game:game-detail", args=[self.game.pk]),
+                    }
+                ]
+            },
+        )
+        self.assertIn("max-age=", response["Cache-Control"])
+
+    @mock.patch("game.signals.images.schedule_variants")
+    def test_index_follows_saves_and_deletes(self, schedule_variants):
+        autocomplete.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            silk = self.create_game("Hollow Knight Silksong")
+            self.game.delete()
+
+        index = autocomplete.get_index()
+
+        self.assertEqual(index.complete("hollow"), [(silk.pk, "Hollow Knight Silksong")])
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"q": "hollow"})
+
+    @mock.patch("game.signals.images.schedule_variants")
+    def test_writer_patches_its_own_index(self, schedule_variants):
+        autocomplete.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            silk = self.create_game("Hollow Knight Silksong")
+
+        with self.assertNumQueries(0):
+            index = autocomplete.get_index()
+
+        self.assertIn((silk.pk, "Hollow Knight Silksong"), index.complete("hollow"))
+
+    @mock.patch("game.signals.images.schedule_variants")
+    def test_writer_reloads_when_another_worker_changed_titles(self, schedule_variants):
+        autocomplete.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_game("Hollow Knight Silksong")
+            # Another worker renames a game before this one commits.
+            increment_version(autocomplete.VERSION_NAMESPACE)
+
+        with self.assertNumQueries(1):
+            autocomplete.get_index()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from game.checks import check_shared_cache
+from game_hub.cache import SQLiteCache
+
+
+class SQLiteCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite3")
+        self.cache = self.create_cache()
+
+    def create_cache(self, **options):
+        return SQLiteCache(self.path, {"OPTIONS": options})
+
+    def test_values_are_shared_between_instances(self):
+        self.cache.set("game", {"title": "Celeste"})
+        self.cache.set_many({"a": 1, "b": [2]})
+
+        other = self.create_cache()
+
+        self.assertEqual(other.get("game"), {"title": "Celeste"})
+        self.assertEqual(other.get_many(["a", "b", "c"]), {"a": 1, "b": [2]})
+        self.assertIsNone(other.get("missing"))
+
+    def test_add_incr_touch_and_delete(self):
+        self.assertTrue(self.cache.add("counter", 1))
+        self.assertFalse(self.cache.add("counter", 5))
+
+        self.assertEqual(self.cache.incr("counter", 2), 3)
+        self.assertTrue(self.cache.touch("counter", 60))
+        self.assertTrue(self.cache.delete("counter"))
+        self.assertFalse(self.cache.has_key("counter"))
+        with self.assertRaises(ValueError):
+            self.cache.incr("counter")
+
+    def test_expired_entries_are_misses_and_can_be_added_again(self):
+        self.cache.set("page", "old", timeout=10)
+
+        with mock.patch("game_hub.cache.time.time", return_value=10**12):
+            self.assertIsNone(self.cache.get("page"))
+            self.assertTrue(self.cache.add("page", "new"))
+        self.assertEqual(self.cache.get("page"), "new")
+
+    def test_least_recently_used_entries_are_culled(self):
+        cache = self.create_cache(
+            MAX_ENTRIES=4, CULL_FREQUENCY=2, CULL_EVERY=1, ACCESS_RESOLUTION=0
+        )
+        clock = iter(range(1, 100))
+        with mock.patch("game_hub.cache.time.time", side_effect=lambda: next(clock)):
+            for number in range(4):
+                cache.set(f"key{number}", number, timeout=None)
+            cache.get("key0")
+            cache.set("key4", 4, timeout=None)
+
+        self.assertEqual(
+            sorted(cache.get_many([f"key{number}" for number in range(5)])),
+            ["key0", "key3", "key4"],
+        )
+
+
+class SharedCacheCheckTestCase(SimpleTestCase):
+    @override_settings(
+        DEBUG=False,
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    def test_warns_when_workers_do_not_share_the_cache(self):
+        self.assertEqual(
+            [warning.id for warning in check_shared_cache(None)], ["game.W001"]
+        )
+
+    def test_shared_cache_passes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            caches = {
+                "default": {
+                    "BACKEND": "game_hub.cache.SQLiteCache",
+                    "LOCATION": os.path.join(directory, "cache.sqlite3"),
+                }
+            }
+            with override_settings(DEBUG=False, CACHES=caches):
+                self.assertEqual(check_shared_cache(None), [])
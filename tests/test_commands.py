@@ -0,0 +1,158 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from game import (
+    autocomplete,
+    facets,
+    page_cache,
+    random_pick,
+    reference_data,
+    similarity,
+)
+from game.cache_versions import get_version
+from game.models import (
+    Game,
+    Genre,
+    Platform,
+    Player,
+    PlayerFactors,
+    Publisher,
+    Rating,
+)
+
+
+class GenerateCatalogCommandTestCase(TestCase):
+    def generate(self, **options):
+        call_command(
+            "generate_catalog",
+            genres=3,
+            platforms=4,
+            publishers=5,
+            games=30,
+            players=10,
+            ratings=100,
+            wishlist_per_player=2,
+            completed_per_player=1,
+            chunk_size=7,
+            stdout=StringIO(),
+            **options,
+        )
+
+    def test_generates_requested_catalog(self):
+        self.generate()
+        self.assertEqual(Genre.objects.count(), 3)
+        self.assertEqual(Platform.objects.count(), 4)
+        self.assertEqual(Publisher.objects.count(), 5)
+        self.assertEqual(Game.objects.count(), 30)
+        self.assertEqual(Player.objects.count(), 10)
+        self.assertTrue(0 < Rating.objects.count() <= 100)
+        self.assertEqual(Player.wishlist_games.through.objects.count(), 20)
+        self.assertEqual(Player.completed_games.through.objects.count(), 10)
+
+    def test_rating_aggregates_are_reconciled(self):
+        self.generate()
+        game = Game.objects.filter(rating_count__gt=0).first()
+        self.assertEqual(game.rating_count, game.ratings.count())
+
+    def test_running_workers_drop_their_cached_catalog(self):
+        namespaces = (
+            random_pick.VERSION_NAMESPACE,
+            facets.VERSION_NAMESPACE,
+            reference_data.VERSION_NAMESPACE,
+            autocomplete.VERSION_NAMESPACE,
+            similarity.VERSION_NAMESPACE,
+        )
+        models = (Game, Genre, Publisher, Platform, Player)
+        versions = [get_version(namespace) for namespace in namespaces]
+        pages = page_cache.generations(models)
+
+        self.generate()
+
+        for namespace, version in zip(namespaces, versions):
+            self.assertNotEqual(get_version(namespace), version, namespace)
+        for model, generation in zip(models, pages):
+            self.assertNotEqual(page_cache.generations((model,))[0], generation)
+        self.assertEqual(PlayerFactors.objects.filter(stale=True).count(), 10)
+
+    def test_same_seed_generates_same_titles(self):
+        self.generate(seed=7)
+        titles = list(Game.objects.values_list("title", flat=True))
+        Game.objects.all().delete()
+        Genre.objects.all().delete()
+        Platform.objects.all().delete()
+        Publisher.objects.all().delete()
+        Player.objects.all().delete()
+        self.generate(seed=7)
+        self.assertEqual(list(Game.objects.values_list("title", flat=True)), titles)
+
+
+class BenchmarkViewsCommandTestCase(TestCase):
+    def test_reports_latency_and_queries_per_route(self):
+        call_command(
+            "generate_catalog",
+            genres=2,
+            platforms=2,
+            publishers=2,
+            games=8,
+            players=3,
+            ratings=10,
+            stdout=StringIO(),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            call_command(
+                "benchmark_views", iterations=2, output=output, stdout=StringIO()
+            )
+            with open(output) as results_file:
+                results = json.load(results_file)
+
+        views = results["views"]
+        self.assertNotIn("update-wishlist-status", views)
+        self.assertEqual(views["game-list"]["status"], 200)
+        self.assertEqual(views["random-game"]["status"], 302)
+        for result in views.values():
+            self.assertGreaterEqual(result["p95_ms"], result["p50_ms"])
+            self.assertGreaterEqual(result["queries"], 0)
+
+
+class BenchmarkQueryPlansCommandTestCase(TransactionTestCase):
+    def index_names(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Game._meta.db_table
+            )
+        return {name for name, info in constraints.items() if info["index"]}
+
+    def test_compares_plans_and_restores_indexes(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_query_plans",
+            generate=30,
+            iterations=1,
+            allow_index_drop=True,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("== with indexes ==", output)
+        self.assertIn("== without indexes ==", output)
+        self.assertIn("game list by genre: median", output)
+        self.assertLessEqual(
+            {index.name for index in Game._meta.indexes}, self.index_names()
+        )
+
+    def test_refuses_to_drop_indexes_without_confirmation(self):
+        with self.assertRaisesMessage(CommandError, "--allow-index-drop"):
+            call_command("benchmark_query_plans", generate=30, stdout=StringIO())
+
+        self.assertFalse(Game.objects.exists())
+        self.assertLessEqual(
+            {index.name for index in Game._meta.indexes}, self.index_names()
+        )
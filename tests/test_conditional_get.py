@@ -0,0 +1,100 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import Game, Genre, Player, Publisher, Rating
+
+
+class ConditionalGetTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.game = self.create_game("Hollow Knight")
+        self.player = Player.objects.create(username="player", email="player@example.com")
+        self.list_url = reverse("game:game-list")
+        self.detail_url = reverse("game:game-detail", kwargs={"pk": self.game.pk})
+
+    def create_game(self, title):
+        return Game.objects.create(
+            title=title,
+            description=title,
+            release_year=2017,
+            genre=self.genre,
+            publisher=self.publisher,
+            image="game.jpg",
+            link=f"https://example.com/{title}",
+        )
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_is_not_modified_without_rendering(self):
+        etag = self.client.get(self.list_url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.revalidate(self.list_url, etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_list_changes_when_a_game_changes_or_goes(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        self.game.title = "Hollow Knight: Voidheart"
+        self.game.save()
+
+        updated = self.revalidate(self.list_url, etag)
+        self.create_game("Celeste").delete()
+
+        self.assertEqual(updated.status_code, 200)
+        self.assertEqual(self.revalidate(self.list_url, updated["ETag"]).status_code, 200)
+
+    def test_detail_follows_ratings_and_player_state(self):
+        self.client.force_login(self.player)
+        # The first page sets the CSRF cookie, which is part of the salt.
+        self.client.get(self.detail_url)
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.assertEqual(self.revalidate(self.detail_url, etag).status_code, 304)
+
+        Rating.objects.create(player=self.player, game=self.game, score=8)
+        rated = self.revalidate(self.detail_url, etag)
+        self.client.post(reverse("game:update-wishlist-status", args=[self.game.pk]))
+        wishlisted = self.revalidate(self.detail_url, rated["ETag"])
+
+        self.assertEqual(rated.status_code, 200)
+        self.assertEqual(wishlisted.status_code, 200)
+        self.assertTrue(wishlisted.context["in_wishlist"])
+
+    def test_etag_is_salted_per_user(self):
+        anonymous = self.client.get(self.list_url)["ETag"]
+        self.client.force_login(self.player)
+
+        response = self.revalidate(self.list_url, anonymous)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_genre_list_follows_game_counts(self):
+        url = reverse("game:genre-list")
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.revalidate(url, etag).status_code, 304)
+
+        self.create_game("Celeste")
+
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    def test_if_modified_since_alone_never_hides_count_or_delete_changes(self):
+        genres = reverse("game:genre-list")
+        since = "Tue, 01 Jan 2999 00:00:00 GMT"
+        self.client.get(genres)
+        self.create_game("Celeste")
+        created = self.client.get(genres, HTTP_IF_MODIFIED_SINCE=since)
+        self.client.get(self.list_url)
+        self.create_game("Gris").delete()
+        deleted = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=since)
+
+        self.assertEqual(created.status_code, 200)
+        self.assertEqual(created.context["genre_list"][0].num_games, 2)
+        self.assertEqual(deleted.status_code, 200)
+        self.assertFalse(deleted.has_header("Last-Modified"))
@@ -0,0 +1,67 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from game import counters
+from game.models import Game, Genre, Player, Publisher, SiteCounter
+
+
+class SiteCountersTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        for number in range(3):
+            Game.objects.create(
+                title=f"Game {number}",
+                description=f"Description {number}",
+                release_year=2020,
+                genre=self.genre,
+                publisher=self.publisher,
+                link=f"https://example.com/{number}",
+            )
+        Player.objects.create(username="player")
+
+    def test_counters_follow_creates(self):
+        self.assertEqual(
+            counters.get_counts(),
+            {"players": 1, "games": 3, "publishers": 1, "genres": 1},
+        )
+
+    def test_counters_follow_deletes(self):
+        Game.objects.first().delete()
+        Player.objects.all().delete()
+
+        counts = counters.get_counts()
+        self.assertEqual(counts["games"], 2)
+        self.assertEqual(counts["players"], 0)
+
+    def test_cascaded_games_are_subtracted(self):
+        self.genre.delete()
+
+        counts = counters.get_counts()
+        self.assertEqual(counts["genres"], 0)
+        self.assertEqual(counts["games"], 0)
+
+    def test_missing_counter_is_rebuilt(self):
+        SiteCounter.objects.filter(name="games").delete()
+
+        self.assertEqual(counters.get_counts()["games"], 3)
+        self.assertTrue(SiteCounter.objects.filter(name="games").exists())
+
+    def test_reconcile_counters_fixes_drift(self):
+        SiteCounter.objects.filter(name="games").update(value=100)
+
+        call_command("reconcile_counters", stdout=StringIO())
+
+        self.assertEqual(SiteCounter.objects.get(name="games").value, 3)
+
+    def test_index_reads_counters_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("game:index"))
+
+        self.assertEqual(response.context["num_games"], 3)
+        self.assertEqual(response.context["num_players"], 1)
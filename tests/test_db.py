@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import TestCase, override_settings
+
+from game.models import Genre
+from game_hub.db import configure_sqlite, serialized_write
+
+
+class SQLiteConfigurationTestCase(TestCase):
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_to_connections(self):
+        self.assertEqual(
+            self.pragma("busy_timeout"), settings.SQLITE_PRAGMAS["busy_timeout"]
+        )
+        self.assertEqual(
+            self.pragma("cache_size"), settings.SQLITE_PRAGMAS["cache_size"]
+        )
+
+    @override_settings(SQLITE_PRAGMAS={"busy_timeout": 1234})
+    def test_pragmas_come_from_settings(self):
+        configure_sqlite(sender=None, connection=connection)
+
+        self.assertEqual(self.pragma("busy_timeout"), 1234)
+
+    def test_connection_setup_is_not_counted_as_queries(self):
+        new = connections.create_connection(DEFAULT_DB_ALIAS)
+        self.addCleanup(new.close)
+        queries = []
+
+        def count(execute, sql, *args):
+            queries.append(sql)
+            return execute(sql, *args)
+
+        with new.execute_wrapper(count):
+            new.ensure_connection()
+
+        self.assertEqual(queries, [])
+        with new.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(
+                cursor.fetchone()[0], settings.SQLITE_PRAGMAS["busy_timeout"]
+            )
+
+
+class SerializedWriteTestCase(TestCase):
+    def test_rolls_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with serialized_write():
+                Genre.objects.create(name="Action", description="Action games")
+                raise ValueError
+
+        self.assertFalse(Genre.objects.exists())
+
+    def test_nested_writes_do_not_deadlock(self):
+        with serialized_write():
+            with serialized_write():
+                Genre.objects.create(name="Action", description="Action games")
+
+        self.assertTrue(Genre.objects.exists())
+
+    @override_settings(SQLITE_SERIALIZE_WRITES=False)
+    def test_runs_in_transaction_when_disabled(self):
+        with serialized_write():
+            self.assertTrue(connection.in_atomic_block)
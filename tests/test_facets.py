@@ -0,0 +1,112 @@
+from unittest import mock
+
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from game import facets
+from game.models import Game, Genre, Platform, Publisher
+from game.templatetags.query_transform import query_transform
+
+
+class GameListFacetsTestCase(TestCase):
+    def setUp(self):
+        self.action = Genre.objects.create(name="Action", description="Action games")
+        self.puzzle = Genre.objects.create(name="Puzzle", description="Puzzle games")
+        self.north = Publisher.objects.create(
+            name="North", description="North", country="USA", capitalization=1
+        )
+        self.south = Publisher.objects.create(
+            name="South", description="South", country="UK", capitalization=1
+        )
+        self.pc = Platform.objects.create(name="PC")
+        self.console = Platform.objects.create(name="Console")
+        for number, (genre, publisher, year, platforms) in enumerate(
+            (
+                (self.action, self.north, 1995, [self.pc]),
+                (self.action, self.south, 2005, [self.pc, self.console]),
+                (self.puzzle, self.north, 2008, [self.console]),
+                (self.puzzle, self.south, 2015, [self.pc]),
+                (self.action, self.north, 2019, []),
+            )
+        ):
+            game = Game.objects.create(
+                title=f"Game {number}",
+                description=f"Game {number}",
+                release_year=year,
+                genre=genre,
+                publisher=publisher,
+                image=f"game{number}.jpg",
+                link=f"https://example.com/{number}",
+            )
+            game.platform.set(platforms)
+        self.url = reverse("game:game-list")
+
+    def titles(self, response):
+        return [game.title for game in response.context["object_list"]]
+
+    def counts(self, response, facet):
+        return {
+            str(obj): count for obj, count, _ in response.context[f"{facet}_facets"]
+        }
+
+    def test_multi_select_matches_any_value_within_a_facet(self):
+        response = self.client.get(
+            self.url, {"publisher": [self.north.pk, self.south.pk], "genre": self.puzzle.pk}
+        )
+
+        self.assertEqual(self.titles(response), ["Game 2", "Game 3"])
+
+    def test_counts_ignore_the_facets_own_selection(self):
+        response = self.client.get(self.url, {"genre": self.action.pk})
+
+        self.assertEqual(self.counts(response, "genre"), {"Action": 3, "Puzzle": 2})
+        self.assertEqual(self.counts(response, "publisher"), {"North": 2, "South": 1})
+        self.assertEqual(self.counts(response, "platform"), {"PC": 2, "Console": 1})
+
+    def test_platform_and_year_range_filters(self):
+        response = self.client.get(
+            self.url, {"platform": self.pc.pk, "year_from": 2000, "year_to": 2016}
+        )
+
+        self.assertEqual(self.titles(response), ["Game 1", "Game 3"])
+        self.assertEqual(response.context["year_facets"], [(1990, 1999, 1), (2000, 2009, 1), (2010, 2019, 1)])
+
+    def test_title_search_narrows_counts(self):
+        response = self.client.get(self.url, {"title": "Game 3"})
+
+        self.assertEqual(self.counts(response, "genre"), {"Puzzle": 1})
+
+    def test_invalid_values_are_ignored(self):
+        response = self.client.get(self.url, {"genre": "999", "year_from": "soon"})
+
+        self.assertEqual(len(response.context["paginator"].object_list), 5)
+        self.assertFalse(response.context["is_filtered"])
+
+    def test_index_is_rebuilt_when_a_game_changes(self):
+        index = facets.get_index()
+        Game.objects.filter(title="Game 4").first().delete()
+
+        self.assertIsNot(facets.get_index(), index)
+        self.assertEqual(facets.get_index().counts({})["genre"], {self.action.pk: 2, self.puzzle.pk: 2})
+
+    def test_links_to_games_missing_from_the_index_are_dropped(self):
+        missing = Game.objects.get(title="Game 3")
+        as_array = facets.as_array
+
+        def without_missing_game(queryset, columns):
+            rows = as_array(queryset, columns)
+            if columns[0] == "id":
+                rows = rows[rows[:, 0] != missing.pk]
+            return rows
+
+        with mock.patch("game.facets.as_array", without_missing_game):
+            index = facets.FacetIndex()
+
+        self.assertEqual(
+            index.counts({})["platform"], {self.pc.pk: 2, self.console.pk: 2}
+        )
+
+    def test_query_transform_keeps_repeated_parameters(self):
+        request = RequestFactory().get("/games/", {"genre": ["1", "2"], "page": "3"})
+
+        self.assertEqual(query_transform(request, page=None), "genre=1&genre=2")
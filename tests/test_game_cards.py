@@ -0,0 +1,70 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import Game, Genre, Player, Publisher
+
+
+class GameCardsTagTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.games = [
+            Game.objects.create(
+                title=f"Game {number}",
+                description=f"Game {number}",
+                release_year=2020,
+                genre=self.genre,
+                publisher=self.publisher,
+                image=f"game{number}.jpg",
+                link=f"https://example.com/{number}",
+            )
+            for number in range(3)
+        ]
+        self.template = Template(
+            '{% load game_cards %}{% game_cards games "includes/game_link.html" %}'
+        )
+
+    def render(self):
+        return self.template.render(Context({"games": Game.objects.order_by("title")}))
+
+    def test_cards_keep_game_order_and_link_to_details(self):
+        html = self.render()
+
+        self.assertLess(html.index("Game 0"), html.index("Game 2"))
+        self.assertIn(reverse("game:game-detail", kwargs={"pk": self.games[1].pk}), html)
+
+    def test_cached_cards_are_not_rendered_again(self):
+        first = self.render()
+
+        with mock.patch("game.templatetags.game_cards.get_template") as get_template:
+            second = self.render()
+
+        get_template.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_saving_a_game_renders_only_its_card_again(self):
+        self.render()
+        game = self.games[1]
+        game.title = "Renamed"
+        game.save()
+
+        with mock.patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            html = self.render()
+
+        self.assertIn("Renamed", html)
+        self.assertNotIn("Game 1", html)
+        self.assertEqual(len(set_many.call_args.args[0]), 1)
+
+    def test_genre_detail_uses_cached_game_boxes(self):
+        self.client.force_login(Player.objects.create(username="player"))
+
+        response = self.client.get(reverse("game:genre-detail", kwargs={"pk": self.genre.pk}))
+
+        self.assertContains(response, "game-box", count=3)
@@ -0,0 +1,121 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from game.images import process_image, variant_name
+from game.models import Game, Genre, Publisher
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(name="cover.png", size=(1200, 800)):
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    MEDIA_URL="/media/",
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+    IMAGE_VARIANT_WIDTHS=(320, 640, 960),
+)
+class ImageVariantsTestCase(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher",
+            description="Publisher",
+            country="USA",
+            capitalization=1,
+        )
+
+    def create_game(self):
+        with mock.patch("game.signals.images.schedule_variants") as schedule:
+            game = Game.objects.create(
+                title="Game",
+                description="Game",
+                release_year=2023,
+                genre=self.genre,
+                publisher=self.publisher,
+                image=make_image(),
+                link="https://example.com",
+            )
+        schedule.assert_called_once_with(game)
+        return game
+
+    def test_variant_name(self):
+        self.assertEqual(
+            variant_name("games/cover.png", 320), "games/variants/cover-320w.webp"
+        )
+
+    def test_process_image_stores_variants(self):
+        game = self.create_game()
+        process_image("game.Game", game.pk)
+        game.refresh_from_db()
+
+        self.assertEqual(sorted(game.image_variants), ["320", "640", "960"])
+        storage = game.image.storage
+        with storage.open(game.image_variants["320"]) as variant:
+            self.assertEqual(Image.open(variant).size, (320, 213))
+        self.assertIn("320w", game.image_srcset())
+        self.assertIn(".webp 960w", game.image_srcset())
+
+    def test_variants_stop_at_source_width(self):
+        game = self.create_game()
+        game.image = make_image("small.png", (500, 500))
+        game.save()
+        process_image("game.Game", game.pk)
+        game.refresh_from_db()
+
+        self.assertEqual(list(game.image_variants), ["320"])
+
+    def test_replacing_image_resets_variants(self):
+        game = self.create_game()
+        process_image("game.Game", game.pk)
+        game.refresh_from_db()
+
+        game.image = make_image("other.png")
+        with mock.patch("game.signals.images.schedule_variants") as schedule:
+            game.save()
+
+        game.refresh_from_db()
+        self.assertEqual(game.image_variants, {})
+        schedule.assert_called_once_with(game)
+
+    def test_saving_unchanged_image_keeps_variants(self):
+        game = self.create_game()
+        process_image("game.Game", game.pk)
+        game.refresh_from_db()
+
+        game.title = "Renamed"
+        with mock.patch("game.signals.images.schedule_variants") as schedule:
+            game.save()
+
+        game.refresh_from_db()
+        self.assertNotEqual(game.image_variants, {})
+        schedule.assert_not_called()
+
+    def test_generate_image_variants_command(self):
+        game = self.create_game()
+
+        call_command("generate_image_variants", workers=1, stdout=StringIO())
+
+        game.refresh_from_db()
+        self.assertEqual(sorted(game.image_variants), ["320", "640", "960"])
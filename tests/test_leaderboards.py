@@ -0,0 +1,168 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from game.leaderboards import get_epoch, rebase_trending, trending_growth
+from game.models import Game, Genre, Player, Publisher, Rating
+
+
+@override_settings(RATING_PRIOR_MEAN=5.5, RATING_PRIOR_VOTES=10)
+class LeaderboardTestCase(TestCase):
+    def setUp(self):
+        # The trending epoch is memoized per cache version.
+        cache.clear()
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.other_genre = Genre.objects.create(name="Puzzle", description="Puzzle games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.games = {
+            title: Game.objects.create(
+                title=title,
+                description=title,
+                release_year=2020,
+                genre=genre,
+                publisher=self.publisher,
+                image=f"{title}.jpg",
+                link=f"https://example.com/{title}",
+            )
+            for title, genre in (
+                ("Lucky", self.genre),
+                ("Classic", self.genre),
+                ("Unrated", self.genre),
+                ("Blocks", self.other_genre),
+            )
+        }
+        self.players = [
+            Player.objects.create(username=f"player{number}", email=f"p{number}@example.com")
+            for number in range(20)
+        ]
+
+    def rate(self, title, score, players):
+        for player in players:
+            Rating.objects.create(player=player, game=self.games[title], score=score)
+
+    def test_bayesian_average_discounts_single_votes(self):
+        self.rate("Lucky", 10, self.players[:1])
+        self.rate("Classic", 9, self.players)
+
+        top = list(Game.objects.top_rated().values_list("title", flat=True))
+
+        self.assertEqual(top, ["Classic", "Lucky"])
+        lucky = Game.objects.get(title="Lucky")
+        self.assertAlmostEqual(lucky.rating_bayes, (10 + 55) / 11)
+        self.assertEqual(lucky.rating_avg, 10)
+
+    def test_bayesian_average_follows_updates_and_deletes(self):
+        self.rate("Lucky", 10, self.players[:2])
+        rating = Rating.objects.get(player=self.players[0], game=self.games["Lucky"])
+        rating.score = 4
+        rating.save()
+        Rating.objects.filter(player=self.players[1]).delete()
+
+        lucky = Game.objects.get(title="Lucky")
+        self.assertAlmostEqual(lucky.rating_bayes, (4 + 55) / 11)
+
+    def test_recalculate_ratings_refreshes_bayesian_average(self):
+        self.rate("Lucky", 8, self.players[:5])
+        Game.objects.update(rating_bayes=0)
+
+        Game.objects.recalculate_ratings()
+
+        self.assertAlmostEqual(Game.objects.get(title="Lucky").rating_bayes, (40 + 55) / 15)
+
+    def test_recent_ratings_outweigh_older_ones(self):
+        now = settings.TRENDING_EPOCH + timedelta(days=70)
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            self.rate("Classic", 10, self.players[:3])
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=now + timedelta(days=settings.TRENDING_HALF_LIFE_DAYS * 2),
+        ):
+            self.rate("Lucky", 10, self.players[:1])
+
+        trending = list(Game.objects.trending().values_list("title", flat=True))
+
+        # Three votes two half-lives ago count as 0.75 of a vote today.
+        self.assertEqual(trending, ["Lucky", "Classic"])
+
+    def test_trending_growth_doubles_every_half_life(self):
+        start = get_epoch()
+        later = start + timedelta(days=settings.TRENDING_HALF_LIFE_DAYS)
+
+        self.assertEqual(trending_growth(start), 1)
+        self.assertAlmostEqual(trending_growth(later), 2)
+
+    def test_deleted_ratings_leave_trending(self):
+        self.rate("Lucky", 10, self.players[:2])
+
+        Rating.objects.filter(game=self.games["Lucky"]).delete()
+
+        self.assertAlmostEqual(Game.objects.get(title="Lucky").trending_score, 0)
+
+    def test_deleting_a_raised_rating_never_leaves_a_negative_score(self):
+        now = settings.TRENDING_EPOCH + timedelta(days=70)
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            self.rate("Lucky", 3, self.players[:1])
+        rating = Rating.objects.get(game=self.games["Lucky"])
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=now + timedelta(days=settings.TRENDING_HALF_LIFE_DAYS),
+        ):
+            rating.score = 9
+            rating.save()
+            rating.delete()
+
+        self.assertEqual(Game.objects.get(title="Lucky").trending_score, 0)
+
+    def test_reconcile_ratings_rebuilds_trending(self):
+        self.rate("Lucky", 10, self.players[:2])
+        expected = Game.objects.get(title="Lucky").trending_score
+        Game.objects.update(trending_score=1e9)
+
+        call_command("reconcile_ratings", stdout=StringIO())
+
+        self.assertAlmostEqual(Game.objects.get(title="Lucky").trending_score, expected)
+        self.assertEqual(Game.objects.get(title="Unrated").trending_score, 0)
+
+    def test_rebasing_keeps_weights_finite_and_order_unchanged(self):
+        self.rate("Classic", 10, self.players[:3])
+        self.rate("Lucky", 10, self.players[:1])
+        epoch = get_epoch()
+        later = epoch + timedelta(days=settings.TRENDING_HALF_LIFE_DAYS * 70)
+
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            self.rate("Blocks", 10, self.players[:1])
+
+        self.assertEqual(get_epoch(), later)
+        self.assertEqual(rebase_trending(later), 0)
+        self.assertEqual(trending_growth(later), 1)
+        self.assertEqual(
+            list(Game.objects.trending().values_list("title", flat=True)),
+            ["Blocks", "Classic", "Lucky"],
+        )
+
+    def test_genre_detail_shows_genre_leaderboards(self):
+        self.rate("Classic", 9, self.players[:3])
+        self.rate("Blocks", 10, self.players[:3])
+        self.client.force_login(self.players[0])
+
+        response = self.client.get(reverse("game:genre-detail", kwargs={"pk": self.genre.pk}))
+
+        self.assertEqual([game.title for game in response.context["top_rated_games"]], ["Classic"])
+        self.assertEqual([game.title for game in response.context["trending_games"]], ["Classic"])
+
+    def test_leaderboard_page_is_public(self):
+        self.rate("Blocks", 7, self.players[:2])
+
+        response = self.client.get(reverse("game:leaderboard"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Blocks")
+        self.assertNotContains(response, "Unrated")
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from game.models import Genre
+from game.views import GenreListView
+
+
+@override_settings(SERVER_TIMING_ENABLED=True)
+class ServerTimingMiddlewareTestCase(TestCase):
+    def setUp(self):
+        Genre.objects.create(name="Action", description="Action games")
+        self.url = reverse("game:genre-list")
+
+    def test_server_timing_header_reports_metrics(self):
+        response = self.client.get(self.url)
+        metrics = dict(
+            entry.strip().split(";", 1)[0:2]
+            for entry in response["Server-Timing"].split(",")
+        )
+        self.assertEqual(set(metrics), {"db", "tpl", "view", "total"})
+        self.assertIn('desc="2 queries"', metrics["db"])
+
+    async def test_server_timing_under_asgi(self):
+        response = await self.async_client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="2 queries"', response["Server-Timing"])
+
+    @override_settings(
+        REQUEST_BUDGETS={"total_ms": 10_000, "sql_ms": 10_000, "queries": 0}
+    )
+    def test_request_over_budget_is_logged(self):
+        with self.assertLogs("game_hub.middleware", level="WARNING") as logs:
+            self.client.get(self.url)
+        self.assertIn(f"GET {self.url}", logs.output[0])
+        self.assertIn("2 queries", logs.output[0])
+
+    @override_settings(SERVER_TIMING_ENABLED=False)
+    def test_disabled_middleware_adds_no_header(self):
+        response = self.client.get(self.url)
+        self.assertNotIn("Server-Timing", response)
+
+    def test_view_over_its_query_budget_is_logged(self):
+        with mock.patch.object(GenreListView, "query_budget", 0):
+            with self.assertLogs("game_hub.middleware", level="WARNING") as logs:
+                self.client.get(self.url)
+        self.assertIn("view budget 0", logs.output[0])
+
+    @override_settings(LOG_VIEW_QUERY_BUDGETS=False)
+    def test_view_budget_logging_can_be_disabled(self):
+        with mock.patch.object(GenreListView, "query_budget", 0):
+            with self.assertNoLogs("game_hub.middleware", level="WARNING"):
+                self.client.get(self.url)
@@ -1,11 +1,16 @@
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 
 from game.models import (
     Game,
     Genre,
     Platform,
+    Player,
     Publisher,
+    Rating,
 )
 
 
@@ -50,3 +55,69 @@ class ModelsStrTestCase(TestCase):
 
     def test_player_str(self):
         self.assertEqual(str(self.player), "player")
+
+
+class GameRatingAggregatesTestCase(TestCase):
+    def setUp(self):
+        genre = Genre.objects.create(name="Action", description="Action games")
+        publisher = Publisher.objects.create(
+            name="Test Publisher",
+            description="Test Publisher",
+            country="USA",
+            capitalization=0.01,
+        )
+        self.game = Game.objects.create(
+            title="Game 1",
+            description="Description of Game 1",
+            release_year=2023,
+            genre=genre,
+            publisher=publisher,
+            image="test_image.jpg",
+            link="https://example.com/game1",
+        )
+        self.player1 = Player.objects.create(username="player1")
+        self.player2 = Player.objects.create(username="player2")
+
+    def assertAggregates(self, rating_sum, rating_count, rating_avg):
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.rating_sum, rating_sum)
+        self.assertEqual(self.game.rating_count, rating_count)
+        self.assertAlmostEqual(self.game.rating_avg, rating_avg)
+
+    def test_created_ratings_update_aggregates(self):
+        Rating.objects.create(player=self.player1, game=self.game, score=8)
+        Rating.objects.create(player=self.player2, game=self.game, score=5)
+        self.assertAggregates(13, 2, 6.5)
+        self.assertAlmostEqual(self.game.get_average_rating(), 6.5)
+
+    def test_update_or_create_applies_score_difference(self):
+        Rating.objects.create(player=self.player1, game=self.game, score=8)
+        Rating.objects.update_or_create(
+            player=self.player1, game=self.game, defaults={"score": 2}
+        )
+        self.assertAggregates(2, 1, 2)
+
+    def test_deleted_rating_is_subtracted(self):
+        Rating.objects.create(player=self.player1, game=self.game, score=8)
+        rating = Rating.objects.create(
+            player=self.player2, game=self.game, score=4
+        )
+        rating.delete()
+        self.assertAggregates(8, 1, 8)
+        Rating.objects.all().delete()
+        self.assertAggregates(0, 0, 0)
+
+    def test_reconcile_ratings_command_fixes_drift(self):
+        Rating.objects.create(player=self.player1, game=self.game, score=9)
+        Rating.objects.create(player=self.player2, game=self.game, score=6)
+        Game.objects.update(rating_sum=0, rating_count=0, rating_avg=0)
+        call_command("reconcile_ratings", batch_size=1, stdout=StringIO())
+        self.assertAggregates(15, 2, 7.5)
+
+    def test_saving_a_stale_game_keeps_rating_aggregates(self):
+        stale_game = Game.objects.get(pk=self.game.pk)
+        Rating.objects.create(player=self.player1, game=self.game, score=8)
+        stale_game.title = "Renamed"
+        stale_game.save()
+        self.assertAggregates(8, 1, 8)
+        self.assertEqual(self.game.title, "Renamed")
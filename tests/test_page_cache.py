@@ -0,0 +1,113 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from game.async_views import AsyncIndexView
+from game.models import Game, Genre, Player, Publisher
+from game.page_cache import page_key
+
+
+@override_settings(PAGE_CACHE_SECONDS=60, PAGE_CACHE_STALE_SECONDS=300)
+class AnonymousPageCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.create_game("Hollow Knight")
+        self.url = reverse("game:game-list")
+
+    def create_game(self, title):
+        return Game.objects.create(
+            title=title,
+            description=title,
+            release_year=2017,
+            genre=self.genre,
+            publisher=self.publisher,
+            image="game.jpg",
+            link=f"https://example.com/{title}",
+        )
+
+    def test_repeated_anonymous_request_runs_no_queries(self):
+        first = self.client.get(self.url, {"title": "hollow", "page": 1})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {"page": 1, "title": "hollow", "genre": ""})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_cached_page_answers_conditional_requests(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_model_changes_invalidate_pages(self):
+        self.client.get(self.url)
+        self.client.get(reverse("game:index"))
+
+        self.create_game("Celeste")
+
+        self.assertContains(self.client.get(self.url), "Celeste")
+        self.assertEqual(self.client.get(reverse("game:index")).context["num_games"], 2)
+
+    def test_players_logging_in_do_not_invalidate_pages(self):
+        player = Player.objects.create(username="player", email="player@example.com")
+        self.client.get(self.url)
+
+        player.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_logged_in_players_bypass_the_cache(self):
+        player = Player.objects.create(username="player", email="player@example.com")
+        self.client.get(self.url)
+        self.client.force_login(player)
+
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "player")
+        self.assertIsNotNone(response.context)
+
+    def test_expired_page_is_served_stale_while_another_worker_rebuilds(self):
+        self.client.get(self.url)
+        key = page_key(RequestFactory().get(self.url))
+        later = mock.patch("game.page_cache.time")
+        later.start().time.return_value = 10**12
+        self.addCleanup(later.stop)
+
+        cache.add(f"{key}:lock", True)
+        with self.assertNumQueries(0):
+            stale = self.client.get(self.url)
+        cache.delete(f"{key}:lock")
+        rebuilt = self.client.get(self.url)
+
+        self.assertEqual(stale.status_code, 200)
+        self.assertIsNone(stale.context)
+        self.assertIsNotNone(rebuilt.context)
+        self.assertIsNone(cache.get(f"{key}:lock"))
+
+    async def test_async_views_share_the_cache(self):
+        request = AsyncRequestFactory().get("/")
+
+        async def auser():
+            return AnonymousUser()
+
+        request.auser = auser
+        first = await AsyncIndexView.as_view()(request)
+        await sync_to_async(first.render)()
+
+        response = await AsyncIndexView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(hasattr(response, "context_data"))
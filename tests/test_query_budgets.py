@@ -0,0 +1,138 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import (
+    Game,
+    Genre,
+    Platform,
+    Player,
+    Publisher,
+    Rating,
+)
+from game.urls import urlpatterns
+from tests.utils import QueryBudgetTestMixin
+
+ROUTE_MODELS = {"game": Game, "genre": Genre, "publisher": Publisher}
+# Routes that change state are only exercised with POST.
+STATE_CHANGING_ROUTES = {"update-wishlist-status", "update-completed-status"}
+
+
+class QueryBudgetTestCase(QueryBudgetTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        platforms = [Platform.objects.create(name=f"Platform {i}") for i in range(6)]
+        genres = [
+            Genre.objects.create(name=f"Genre {i}", description=f"Genre {i}")
+            for i in range(5)
+        ]
+        publishers = [
+            Publisher.objects.create(
+                name=f"Publisher {i}",
+                description=f"Publisher {i}",
+                country=f"Country {i % 3}",
+                capitalization=Decimal("1.00"),
+                image="publisher.jpg",
+            )
+            for i in range(5)
+        ]
+        cls.games = []
+        for i in range(40):
+            game = Game.objects.create(
+                title=f"Game {i:02d}",
+                description=f"Description {i}",
+                release_year=2000 + i % 20,
+                genre=genres[i % 5],
+                publisher=publishers[i % 5],
+                link=f"https://example.com/game{i}",
+                image="image.jpg",
+            )
+            game.platform.set(platforms[i % 3:i % 3 + 3])
+            cls.games.append(game)
+        players = [Player.objects.create(username=f"player{i}") for i in range(20)]
+        for player_index, player in enumerate(players):
+            for game in cls.games[player_index:player_index + 10]:
+                Rating.objects.create(player=player, game=game, score=7)
+        cls.user = players[0]
+        cls.user.wishlist_games.set(cls.games[:30])
+        cls.user.completed_games.set(cls.games[10:35])
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def route_url(self, pattern):
+        kwargs = {}
+        for name in pattern.pattern.converters:
+            model = ROUTE_MODELS.get(pattern.name.split("-")[0], Game)
+            kwargs[name] = model.objects.order_by("pk").first().pk
+        return reverse(f"game:{pattern.name}", kwargs=kwargs)
+
+    def test_every_route_stays_within_its_budget(self):
+        for pattern in urlpatterns:
+            method = "post" if pattern.name in STATE_CHANGING_ROUTES else "get"
+            with self.subTest(route=pattern.name):
+                self.assertWithinQueryBudget(self.route_url(pattern), method=method)
+
+    def test_game_list_filters_stay_within_budget(self):
+        url = reverse("game:game-list")
+        self.assertWithinQueryBudget(url, data={"title": "game"})
+        self.assertWithinQueryBudget(url, data={"genre": self.games[0].genre_id})
+
+    def test_anonymous_pages_stay_within_budget(self):
+        self.client.logout()
+        for name in ("index", "game-list", "genre-list", "publisher-list"):
+            with self.subTest(route=name):
+                self.assertWithinQueryBudget(reverse(f"game:{name}"))
+
+    def test_write_paths_stay_within_budget(self):
+        game = self.games[20]
+        self.assertWithinQueryBudget(
+            reverse("game:game-detail", kwargs={"pk": game.pk}),
+            method="post",
+            data={"score": 9},
+        )
+        for name in ("update-wishlist-status", "update-completed-status"):
+            url = reverse(f"game:{name}", kwargs={"game_id": game.pk})
+            with self.subTest(route=name):
+                self.assertWithinQueryBudget(url, method="post")
+                self.assertWithinQueryBudget(url, method="post")
+
+    def test_edit_and_delete_paths_stay_within_budget(self):
+        game = self.games[5]
+        response = self.assertWithinQueryBudget(
+            reverse("game:game-update", kwargs={"pk": game.pk}),
+            method="post",
+            data={
+                "title": "Renamed game",
+                "description": game.description,
+                "platform": [platform.pk for platform in game.platform.all()],
+                "release_year": game.release_year,
+                "genre": game.genre_id,
+                "publisher": game.publisher_id,
+                "link": game.link,
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertWithinQueryBudget(
+            reverse("game:game-delete", kwargs={"pk": game.pk}), method="post"
+        )
+        genre = self.games[0].genre
+        self.assertWithinQueryBudget(
+            reverse("game:genre-update", kwargs={"pk": genre.pk}),
+            method="post",
+            data={"name": "Renamed genre", "description": genre.description},
+        )
+        self.assertWithinQueryBudget(
+            reverse("game:genre-create"),
+            method="post",
+            data={"name": "New genre", "description": "New genre"},
+        )
+        for name, obj in (
+            ("genre-delete", self.games[0].genre),
+            ("publisher-delete", self.games[1].publisher),
+        ):
+            with self.subTest(route=name):
+                self.assertWithinQueryBudget(
+                    reverse(f"game:{name}", kwargs={"pk": obj.pk}), method="post"
+                )
@@ -0,0 +1,133 @@
+from io import StringIO
+
+import numpy as np
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import (
+    Game,
+    GameFactors,
+    Genre,
+    Player,
+    PlayerFactors,
+    PlayerRecommendation,
+    Publisher,
+    Rating,
+)
+from game.recommendations import top_games, train_recommendations
+
+
+class RecommendationsTestCase(TestCase):
+    def setUp(self):
+        genre = Genre.objects.create(name="Action", description="Action games")
+        publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.games = {
+            title: Game.objects.create(
+                title=title,
+                description=title,
+                release_year=2020,
+                genre=genre,
+                publisher=publisher,
+                image=f"{title}.jpg",
+                link=f"https://example.com/{title}",
+            )
+            for title in ("Shooter", "Brawler", "Racer", "Blocks", "Tiles", "Cards")
+        }
+        self.players = [
+            Player.objects.create(username=f"player{number}") for number in range(6)
+        ]
+        # Two taste groups; the last player of each has only seen two games.
+        for player in self.players[:3]:
+            for title in ("Shooter", "Brawler", "Racer"):
+                Rating.objects.create(player=player, game=self.games[title], score=9)
+        for player in self.players[3:]:
+            player.completed_games.add(self.games["Blocks"], self.games["Tiles"])
+            player.wishlist_games.add(self.games["Cards"])
+        Rating.objects.filter(player=self.players[2], game=self.games["Racer"]).delete()
+        self.players[5].wishlist_games.remove(self.games["Cards"])
+
+    def recommended(self, player):
+        return list(
+            PlayerRecommendation.objects.filter(player=player)
+            .order_by("rank")
+            .values_list("game__title", flat=True)
+        )
+
+    def test_recommends_what_similar_players_liked(self):
+        train_recommendations(factors=4, iterations=15, top_n=1, full=True)
+
+        self.assertEqual(self.recommended(self.players[2]), ["Racer"])
+        self.assertEqual(self.recommended(self.players[5]), ["Cards"])
+
+    def test_excludes_games_the_player_already_has(self):
+        train_recommendations(factors=4, iterations=5, top_n=10, full=True)
+
+        recommended = self.recommended(self.players[0])
+        self.assertEqual(len(recommended), 3)
+        self.assertNotIn("Shooter", recommended)
+
+    def test_activity_marks_player_stale(self):
+        train_recommendations(factors=4, iterations=5, full=True)
+        self.assertFalse(PlayerFactors.objects.filter(stale=True).exists())
+
+        Rating.objects.create(player=self.players[0], game=self.games["Cards"], score=3)
+        self.games["Blocks"].wishlisted_by.add(self.players[1])
+
+        self.assertEqual(
+            set(PlayerFactors.objects.filter(stale=True).values_list("player_id", flat=True)),
+            {self.players[0].pk, self.players[1].pk},
+        )
+
+    def test_incremental_run_only_refreshes_stale_players(self):
+        train_recommendations(factors=4, iterations=5, top_n=10, full=True)
+        factors = dict(GameFactors.objects.values_list("game_id", "factors"))
+
+        self.players[2].completed_games.add(self.games["Racer"])
+        refreshed = train_recommendations(factors=4, top_n=10)
+
+        self.assertEqual(refreshed, 1)
+        self.assertNotIn("Racer", self.recommended(self.players[2]))
+        self.assertEqual(dict(GameFactors.objects.values_list("game_id", "factors")), factors)
+        self.assertFalse(PlayerFactors.objects.filter(stale=True).exists())
+
+    def test_changed_dimensions_trigger_full_run(self):
+        train_recommendations(factors=4, iterations=2, full=True)
+
+        refreshed = train_recommendations(factors=8, iterations=2)
+
+        self.assertEqual(refreshed, 6)
+        self.assertEqual(len(GameFactors.objects.first().factors), 8 * 4)
+
+    def test_scoring_games_in_chunks_matches_scoring_them_at_once(self):
+        rng = np.random.default_rng(0)
+        players, games = rng.random((5, 4)), rng.random((23, 4))
+        rows, cols = np.array([0, 0, 3]), np.array([2, 17, 9])
+
+        chunked = top_games(players, games, rows, cols, 4, chunk_size=5)
+        at_once = top_games(players, games, rows, cols, 4, chunk_size=100)
+
+        np.testing.assert_array_equal(chunked[0], at_once[0])
+        np.testing.assert_allclose(chunked[1], at_once[1])
+        self.assertNotIn(17, chunked[0][0])
+
+    def test_command_reports_refreshed_players(self):
+        out = StringIO()
+
+        call_command("train_recommendations", full=True, factors=4, stdout=out)
+
+        self.assertIn("Refreshed recommendations of 6 players", out.getvalue())
+
+    def test_personal_page_shows_recommendations(self):
+        train_recommendations(factors=4, iterations=15, top_n=1, full=True)
+        self.client.force_login(self.players[2])
+
+        response = self.client.get(reverse("game:personal-page"))
+
+        self.assertContains(response, "Recommended for you")
+        self.assertEqual(
+            [entry.game.title for entry in response.context["recommendations"]],
+            ["Racer"],
+        )
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from game import reference_data
+from game.forms import GameCreateForm
+from game.models import Genre, Platform, Publisher
+
+
+class ReferenceDataTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        Publisher.objects.create(
+            name="Publisher 1", description="First", country="USA", capitalization=1
+        )
+        Publisher.objects.create(
+            name="Publisher 2", description="Second", country="Japan", capitalization=1
+        )
+        Publisher.objects.create(
+            name="Publisher 3", description="Third", country="USA", capitalization=1
+        )
+        Platform.objects.create(name="PC")
+        reference_data.clear()
+
+    def test_lists_are_served_from_cache(self):
+        reference_data.get_genres()
+        reference_data.get_publishers()
+
+        with self.assertNumQueries(0):
+            genres = reference_data.get_genres()
+            publishers = reference_data.get_publishers()
+
+        self.assertEqual([genre.name for genre in genres], ["Action"])
+        self.assertEqual(len(publishers), 3)
+
+    def test_publisher_countries_are_distinct_and_sorted(self):
+        self.assertEqual(reference_data.get_publisher_countries(), ("Japan", "USA"))
+
+    def test_save_invalidates_cache(self):
+        reference_data.get_genres()
+
+        Genre.objects.create(name="Puzzle", description="Puzzle games")
+
+        names = {genre.name for genre in reference_data.get_genres()}
+        self.assertEqual(names, {"Action", "Puzzle"})
+
+    def test_delete_invalidates_cache(self):
+        reference_data.get_platforms()
+
+        Platform.objects.all().delete()
+
+        self.assertEqual(reference_data.get_platforms(), ())
+
+    def test_game_form_choices_use_cache(self):
+        reference_data.get_genres()
+        reference_data.get_publishers()
+        reference_data.get_platforms()
+
+        form = GameCreateForm()
+        with self.assertNumQueries(0):
+            genre_choices = list(form.fields["genre"].choices)
+            platform_choices = list(form.fields["platform"].choices)
+
+        self.assertEqual(genre_choices[1][0].value, self.genre.pk)
+        self.assertEqual(len(platform_choices), 1)
+
+    def test_game_form_still_validates_against_database(self):
+        form = GameCreateForm(data={"genre": 0})
+
+        form.is_valid()
+
+        self.assertIn("genre", form.errors)
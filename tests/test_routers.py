@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from game.models import Game, Genre, Player
+from game_hub.routers import ReplicaRouter, replica_reads
+
+
+@override_settings(REPLICA_DATABASES=["replica1", "replica2"])
+class ReplicaRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_use_primary_outside_requests(self):
+        self.assertIsNone(self.router.db_for_read(Game))
+
+    def test_reads_use_a_replica_when_enabled(self):
+        with replica_reads():
+            self.assertIn(self.router.db_for_read(Game), settings.REPLICA_DATABASES)
+
+    def test_reads_use_primary_when_disabled(self):
+        with replica_reads(enabled=False):
+            self.assertIsNone(self.router.db_for_read(Game))
+
+    def test_reads_after_a_write_use_primary(self):
+        with replica_reads() as state:
+            self.assertEqual(self.router.db_for_write(Game), "default")
+            self.assertTrue(state.wrote)
+            self.assertIsNone(self.router.db_for_read(Game))
+
+    def test_migrations_skip_replicas(self):
+        self.assertTrue(self.router.allow_migrate("default", "game"))
+        self.assertFalse(self.router.allow_migrate("replica1", "game"))
+
+
+class ReplicaRoutingMiddlewareTestCase(TestCase):
+    def setUp(self):
+        Genre.objects.create(name="Action", description="Action games")
+        self.user = Player.objects.create(username="player")
+        self.client.force_login(self.user)
+
+    def test_read_only_request_is_not_pinned(self):
+        response = self.client.get(reverse("game:genre-list"))
+
+        self.assertNotIn(settings.REPLICA_PIN_COOKIE, response.cookies)
+
+    def test_write_pins_client_to_primary(self):
+        response = self.client.post(
+            reverse("game:genre-create"),
+            {"name": "Puzzle", "description": "Puzzle games"},
+        )
+
+        cookie = response.cookies[settings.REPLICA_PIN_COOKIE]
+        self.assertEqual(cookie["max-age"], settings.REPLICA_PIN_SECONDS)
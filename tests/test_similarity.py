@@ -0,0 +1,93 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import Game, Genre, Platform, Player, Publisher, Rating, SimilarGame
+from game.similarity import compute_similar_games
+
+
+class SimilarGamesTestCase(TestCase):
+    def setUp(self):
+        self.action = Genre.objects.create(name="Action", description="Action games")
+        self.puzzle = Genre.objects.create(name="Puzzle", description="Puzzle games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.platform = Platform.objects.create(name="PC")
+        self.games = {}
+        for title, genre in (
+            ("Shooter", self.action),
+            ("Brawler", self.action),
+            ("Blocks", self.puzzle),
+            ("Tiles", self.puzzle),
+        ):
+            self.games[title] = Game.objects.create(
+                title=title,
+                description=title,
+                release_year=2020,
+                genre=genre,
+                publisher=self.publisher,
+                image=f"{title}.jpg",
+                link=f"https://example.com/{title}",
+            )
+            self.games[title].platform.add(self.platform)
+        self.players = [
+            Player.objects.create(username=f"player{number}") for number in range(4)
+        ]
+        # Action fans rate both action games highly, puzzle fans the others.
+        for player in self.players[:2]:
+            for title in ("Shooter", "Brawler"):
+                Rating.objects.create(player=player, game=self.games[title], score=9)
+            player.completed_games.add(self.games["Shooter"], self.games["Brawler"])
+        for player in self.players[2:]:
+            for title in ("Blocks", "Tiles"):
+                Rating.objects.create(player=player, game=self.games[title], score=8)
+            player.wishlist_games.add(self.games["Blocks"], self.games["Tiles"])
+
+    def neighbours(self, title):
+        return list(
+            SimilarGame.objects.filter(game=self.games[title])
+            .order_by("rank")
+            .values_list("similar__title", flat=True)
+        )
+
+    def test_closest_game_shares_players_and_genre(self):
+        compute_similar_games(top_k=2, dimensions=64)
+
+        self.assertEqual(self.neighbours("Shooter")[0], "Brawler")
+        self.assertEqual(self.neighbours("Tiles")[0], "Blocks")
+
+    def test_stores_top_k_ranked_neighbours(self):
+        created = compute_similar_games(top_k=2, dimensions=64)
+
+        self.assertEqual(created, 8)
+        entries = list(SimilarGame.objects.filter(game=self.games["Blocks"]))
+        self.assertEqual([entry.rank for entry in entries], [1, 2])
+        self.assertGreaterEqual(entries[0].score, entries[1].score)
+        self.assertNotIn("Blocks", self.neighbours("Blocks"))
+
+    def test_recompute_replaces_previous_results(self):
+        compute_similar_games(top_k=3, dimensions=64)
+        compute_similar_games(top_k=1, dimensions=64)
+
+        self.assertEqual(SimilarGame.objects.count(), 4)
+
+    def test_command_reports_stored_rows(self):
+        out = StringIO()
+
+        call_command("compute_similar_games", top_k=2, stdout=out)
+
+        self.assertIn("Stored 8 similar games", out.getvalue())
+
+    def test_detail_view_lists_similar_games(self):
+        compute_similar_games(top_k=2, dimensions=64)
+        self.client.force_login(self.players[0])
+
+        response = self.client.get(
+            reverse("game:game-detail", kwargs={"pk": self.games["Shooter"].pk})
+        )
+
+        similar = response.context["similar_games"]
+        self.assertEqual(similar[0].similar, self.games["Brawler"])
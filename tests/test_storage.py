@@ -0,0 +1,77 @@
+import importlib
+import tempfile
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, override_settings
+from django.views.static import serve
+from storages.backends.s3 import S3StaticStorage
+
+from game_hub import urls
+from game_hub.storage import MemoizedFileSystemStorage, MemoizedS3StaticStorage
+
+
+class MemoizedStorageTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = MemoizedFileSystemStorage(location=directory.name)
+
+    def test_urls_are_built_once_per_name(self):
+        with mock.patch.object(
+            FileSystemStorage, "url", autospec=True, return_value="/media/a.jpg"
+        ) as url:
+            self.storage.url("a.jpg")
+            self.storage.url("a.jpg")
+
+        url.assert_called_once()
+
+    def test_saving_or_deleting_a_file_forgets_its_url(self):
+        self.storage.url("a.jpg")
+        with mock.patch.object(FileSystemStorage, "url", autospec=True, return_value="new") as url:
+            self.storage.save("a.jpg", ContentFile(b"image"))
+            self.assertEqual(self.storage.url("a.jpg"), "new")
+            self.storage.delete("a.jpg")
+            self.storage.url("a.jpg")
+
+        self.assertEqual(url.call_count, 2)
+
+    def test_media_url_changes_clear_memoized_urls(self):
+        with override_settings(MEDIA_URL="/old/"):
+            self.assertEqual(self.storage.url("a.jpg"), "/old/a.jpg")
+        with override_settings(MEDIA_URL="/new/"):
+            self.assertEqual(self.storage.url("a.jpg"), "/new/a.jpg")
+
+    def test_signed_s3_urls_are_not_memoized(self):
+        storage = MemoizedS3StaticStorage(
+            bucket_name="bucket", custom_domain="cdn.example.com", querystring_auth=True
+        )
+
+        with mock.patch.object(
+            S3StaticStorage, "url", autospec=True, return_value="signed"
+        ) as url:
+            storage.url("a.jpg")
+            storage.url("a.jpg")
+
+        self.assertEqual(url.call_count, 2)
+        self.assertEqual(
+            MemoizedS3StaticStorage(bucket_name="bucket", custom_domain="cdn.example.com").url("a b.jpg"),
+            "https://cdn.example.com/a%20b.jpg",
+        )
+
+
+class LocalMediaRouteTestCase(SimpleTestCase):
+    def serves_media(self, **settings):
+        self.addCleanup(importlib.reload, urls)
+        with override_settings(STORAGE_BACKEND="local", **settings):
+            importlib.reload(urls)
+        return any(
+            getattr(pattern, "callback", None) is serve for pattern in urls.urlpatterns
+        )
+
+    def test_media_is_left_to_the_front_end_server_by_default(self):
+        self.assertFalse(self.serves_media(SERVE_MEDIA=False))
+
+    def test_media_can_be_served_by_django_when_opted_in(self):
+        self.assertTrue(self.serves_media(SERVE_MEDIA=True))
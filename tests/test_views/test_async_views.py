@@ -0,0 +1,226 @@
+import importlib
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import clear_url_caches, resolve, reverse
+from django.utils.asyncio import async_unsafe
+
+from game import reference_data, urls
+from game_hub import urls as root_urls
+
+from game.async_views import (
+    AsyncGameDetailView,
+    AsyncGameListView,
+    AsyncIndexView,
+    AsyncPersonalPageView,
+)
+from game.models import Game, Genre, Player, Publisher, Rating
+
+
+class CatalogMixin:
+    def setUp(self):
+        self.player = Player.objects.create(username="player")
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.publisher = Publisher.objects.create(
+            name="Publisher", description="Publisher", country="USA", capitalization=1
+        )
+        self.games = [
+            Game.objects.create(
+                title=f"Game {number}",
+                description=f"Description {number}",
+                release_year=2020,
+                genre=self.genre,
+                publisher=self.publisher,
+                image="game.jpg",
+                link=f"https://example.com/{number}",
+            )
+            for number in range(8)
+        ]
+
+
+class AsyncViewsTestCase(CatalogMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = AsyncRequestFactory()
+
+    def request(self, path, user=None, method="get", data=None):
+        request = getattr(self.factory, method)(path, data or {})
+        user = user or AnonymousUser()
+
+        async def auser():
+            return user
+
+        request.user = user
+        request.auser = auser
+        return request
+
+    async def call(self, view_class, request, **kwargs):
+        return await view_class.as_view()(request, **kwargs)
+
+    async def test_index_reads_counters(self):
+        response = await self.call(AsyncIndexView, self.request("/"))
+
+        self.assertEqual(response.context_data["num_games"], 8)
+        self.assertEqual(response.context_data["num_players"], 1)
+
+    async def test_game_list_paginates_and_filters(self):
+        response = await self.call(
+            AsyncGameListView, self.request("/games/", data={"page": 2})
+        )
+
+        context = response.context_data
+        self.assertEqual(
+            [game.title for game in context["game_list"]], ["Game 6", "Game 7"]
+        )
+        self.assertTrue(context["is_paginated"])
+        self.assertEqual(context["paginator"].count, 8)
+        self.assertEqual([genre.name for genre in context["genres"]], ["Action"])
+
+    async def test_game_list_invalid_page_is_404(self):
+        with self.assertRaises(Http404):
+            await self.call(
+                AsyncGameListView, self.request("/games/", data={"page": 9})
+            )
+
+    async def test_game_detail_requires_login(self):
+        game = self.games[0]
+        response = await self.call(
+            AsyncGameDetailView, self.request(f"/games/{game.pk}/"), pk=game.pk
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response.url)
+
+    async def test_game_detail_includes_player_state(self):
+        game = self.games[0]
+        await Rating.objects.acreate(player=self.player, game=game, score=7)
+        await self.player.wishlist_games.aadd(game)
+
+        response = await self.call(
+            AsyncGameDetailView,
+            self.request(f"/games/{game.pk}/", self.player),
+            pk=game.pk,
+        )
+
+        context = response.context_data
+        self.assertEqual(context["user_rating"].score, 7)
+        self.assertTrue(context["in_wishlist"])
+        self.assertFalse(context["in_completed"])
+        self.assertEqual(context["user_votes_count"], 1)
+
+    async def test_game_detail_revalidates_with_etag(self):
+        game = self.games[0]
+        path = f"/games/{game.pk}/"
+        response = await self.call(
+            AsyncGameDetailView, self.request(path, self.player), pk=game.pk
+        )
+        request = self.request(path, self.player)
+        request.META["HTTP_IF_NONE_MATCH"] = response["ETag"]
+
+        revalidated = await self.call(AsyncGameDetailView, request, pk=game.pk)
+
+        self.assertEqual(revalidated.status_code, 304)
+
+    async def test_game_detail_post_saves_rating(self):
+        game = self.games[0]
+
+        response = await self.call(
+            AsyncGameDetailView,
+            self.request(f"/games/{game.pk}/", self.player, "post", {"score": 9}),
+            pk=game.pk,
+        )
+
+        self.assertEqual(response.status_code, 302)
+        rating = await Rating.objects.aget(player=self.player, game=game)
+        self.assertEqual(rating.score, 9)
+
+    async def test_personal_page_paginates_both_lists(self):
+        await self.player.wishlist_games.aadd(*self.games)
+        await self.player.completed_games.aadd(self.games[0])
+
+        response = await self.call(
+            AsyncPersonalPageView,
+            self.request("/personal_page/", self.player, data={"wishlist_page": 2}),
+        )
+
+        context = response.context_data
+        self.assertEqual(len(context["wishlist_games"].object_list), 3)
+        self.assertEqual(len(context["completed_games"].object_list), 1)
+        self.assertTrue(context["is_wishlist_paginated"])
+        self.assertFalse(context["is_completed_paginated"])
+
+
+def reload_urls():
+    # The root URLconf holds on to the included patterns.
+    importlib.reload(urls)
+    importlib.reload(root_urls)
+    clear_url_caches()
+
+
+@override_settings(ASYNC_VIEWS=True)
+class AsyncRoutesTestCase(CatalogMixin, TestCase):
+    # Requests go through the ASGI handler and the full middleware stack,
+    # so anything touching the database in the event loop fails here.
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        reload_urls()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        reload_urls()
+
+    def test_routes_use_the_async_views(self):
+        self.assertIs(resolve(reverse("game:index")).func.view_class, AsyncIndexView)
+
+    async def test_index_renders_counts(self):
+        response = await self.async_client.get(reverse("game:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "8+")
+
+    async def test_game_list_renders_filtered_page(self):
+        response = await self.async_client.get(
+            reverse("game:game-list"), {"genre": self.genre.pk, "page": 2}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Game 6")
+        self.assertNotContains(response, "Game 0")
+
+    async def test_game_list_loads_reference_data_off_the_event_loop(self):
+        # Another worker may change reference data mid-request, so any read
+        # of it can reach the database.
+        unsafe_get = async_unsafe("reference data")(reference_data.get)
+        with mock.patch.object(reference_data, "get", unsafe_get):
+            response = await self.async_client.get(
+                reverse("game:game-list"), {"genre": self.genre.pk}
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+    async def test_game_detail_renders_player_state(self):
+        game = self.games[0]
+        await self.player.wishlist_games.aadd(game)
+        await self.async_client.aforce_login(self.player)
+
+        response = await self.async_client.get(
+            reverse("game:game-detail", args=[game.pk])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, game.title)
+        self.assertContains(response, "Remove from wishlist")
+
+    async def test_personal_page_renders_wishlist(self):
+        await self.player.wishlist_games.aadd(self.games[0])
+        await self.async_client.aforce_login(self.player)
+
+        response = await self.async_client.get(reverse("game:personal-page"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Game 0")
+        self.assertNotContains(response, "No games in wishlist")
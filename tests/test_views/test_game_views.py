@@ -1,11 +1,14 @@
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import (
     Client,
     RequestFactory,
     TestCase,
+    override_settings,
 )
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from game.models import (
@@ -16,6 +19,7 @@ from game.models import (
     Publisher,
     Rating,
 )
+from game.pagination import encode_cursor
 
 
 class GameListViewTestCase(TestCase):
@@ -81,6 +85,148 @@ class GameListViewTestCase(TestCase):
         self.assertIn(self.genre3, genres_in_context)
 
 
+@override_settings(GAME_LIST_PAGINATION="cursor")
+class GameListCursorPaginationTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(name="Action", description="Action games")
+        self.other_genre = Genre.objects.create(name="RPG", description="RPG games")
+        self.publisher = Publisher.objects.create(
+            name="Epic Games",
+            description="Epic Games Publisher",
+            country="USA",
+            capitalization=Decimal("10.00"),
+        )
+        for i in range(14):
+            Game.objects.create(
+                title=f"Test Game {i + 10}",
+                description=f"Description for Test Game {i + 10}",
+                release_year=2023,
+                genre=self.genre if i % 2 else self.other_genre,
+                publisher=self.publisher,
+                link=f"https://www.testgame{i + 10}.com",
+                image="image.jpg",
+            )
+        self.url = reverse("game:game-list")
+
+    def titles(self, response):
+        return [game.title for game in response.context["object_list"]]
+
+    def test_pages_follow_title_order_without_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            first = self.client.get(self.url)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries.captured_queries)
+        )
+        self.assertEqual(self.titles(first), [f"Test Game {i}" for i in range(10, 16)])
+        self.assertFalse(first.context["page_obj"].has_previous())
+
+        page_obj = first.context["page_obj"]
+        second = self.client.get(self.url, {"cursor": page_obj.next_cursor})
+        self.assertEqual(self.titles(second), [f"Test Game {i}" for i in range(16, 22)])
+
+        third = self.client.get(
+            self.url, {"cursor": second.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(self.titles(third), ["Test Game 22", "Test Game 23"])
+        self.assertFalse(third.context["page_obj"].has_next())
+
+        back = self.client.get(
+            self.url, {"cursor": third.context["page_obj"].previous_cursor}
+        )
+        self.assertEqual(self.titles(back), self.titles(second))
+
+    def test_cursor_pages_respect_filters(self):
+        response = self.client.get(self.url, {"genre": self.genre.pk})
+        self.assertEqual(
+            self.titles(response), [f"Test Game {i}" for i in range(11, 23, 2)]
+        )
+        response = self.client.get(
+            self.url,
+            {
+                "genre": self.genre.pk,
+                "cursor": response.context["page_obj"].next_cursor,
+            },
+        )
+        self.assertEqual(self.titles(response), ["Test Game 23"])
+        self.assertContains(response, "cursor=")
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.titles(response)[0], "Test Game 10")
+
+    def test_tampered_cursor_values_fall_back_to_first_page(self):
+        for values in (["next", "A", "abc"], ["prev", None, None]):
+            with self.subTest(values=values):
+                response = self.client.get(
+                    self.url, {"cursor": encode_cursor(values[0], values[1:])}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.titles(response)[0], "Test Game 10")
+
+    def test_searches_keep_rank_order_with_page_numbers(self):
+        response = self.client.get(self.url, {"title": "game"})
+
+        self.assertFalse(getattr(response.context["page_obj"], "is_cursor", False))
+        self.assertEqual(response.context["paginator"].count, 14)
+
+
+class GameSearchTestCase(TestCase):
+    def setUp(self):
+        self.genre = Genre.objects.create(
+            name="Roguelike", description="Roguelike games"
+        )
+        self.publisher = Publisher.objects.create(
+            name="Supergiant",
+            description="Supergiant Games",
+            country="USA",
+            capitalization=Decimal("1.00"),
+        )
+        self.hades = Game.objects.create(
+            title="Hades",
+            description="Battle out of hell with the Olympians",
+            release_year=2020,
+            genre=self.genre,
+            publisher=self.publisher,
+            link="https://www.hades.com",
+            image="image.jpg",
+        )
+        self.bastion = Game.objects.create(
+            title="Bastion",
+            description="An action role-playing game about Hades",
+            release_year=2011,
+            genre=Genre.objects.create(name="RPG", description="RPG games"),
+            publisher=self.publisher,
+            link="https://www.bastion.com",
+            image="image.jpg",
+        )
+
+    def search(self, query):
+        response = self.client.get(reverse("game:game-list"), {"title": query})
+        return [game.title for game in response.context["object_list"]]
+
+    def test_search_matches_description_and_ranks_title_first(self):
+        self.assertEqual(self.search("hades"), ["Hades", "Bastion"])
+
+    def test_search_matches_prefixes(self):
+        self.assertEqual(self.search("basti"), ["Bastion"])
+
+    def test_search_matches_genre_and_publisher_names(self):
+        self.assertEqual(self.search("roguelike"), ["Hades"])
+        self.assertEqual(self.search("supergiant"), ["Bastion", "Hades"])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        self.hades.title = "Hades II"
+        self.hades.description = "Sequel"
+        self.hades.save()
+        self.assertEqual(self.search("sequel"), ["Hades II"])
+        self.genre.name = "Action roguelike"
+        self.genre.save()
+        self.assertCountEqual(self.search("action"), ["Bastion", "Hades II"])
+        self.hades.delete()
+        self.assertEqual(self.search("sequel"), [])
+
+
 class GameCreateViewTestCase(TestCase):
     def setUp(self):
         self.client = Client()
@@ -202,3 +348,29 @@ class GameDetailViewTestCase(TestCase):
             reverse("game:game-detail", kwargs={"pk": self.game.pk})
         )
         self.assertEqual(response.context["user_votes_count"], 2)
+
+    def test_wishlist_and_completed_status_are_booleans(self):
+        self.user.wishlist_games.add(self.game)
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("game:game-detail", kwargs={"pk": self.game.pk})
+        )
+        self.assertIs(response.context["in_wishlist"], True)
+        self.assertIs(response.context["in_completed"], False)
+        self.assertContains(response, "Remove from wishlist")
+        self.assertContains(response, "Add to completed")
+
+    def test_toggle_wishlist_status(self):
+        self.client.force_login(self.user)
+        url = reverse("game:update-wishlist-status", kwargs={"game_id": self.game.pk})
+        self.client.post(url)
+        self.assertTrue(self.user.wishlist_games.filter(pk=self.game.pk).exists())
+        self.client.post(url)
+        self.assertFalse(self.user.wishlist_games.filter(pk=self.game.pk).exists())
+
+    def test_toggle_status_for_missing_game_returns_404(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("game:update-completed-status", kwargs={"game_id": 999})
+        )
+        self.assertEqual(response.status_code, 404)
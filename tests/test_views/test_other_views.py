@@ -141,3 +141,31 @@ class RandomGameViewTestCase(TestCase):
                 reverse("game:game-detail", kwargs={"pk": self.game2.pk})
             )
         )
+
+    def test_random_game_filtered_by_platform(self):
+        url = self.random_game_url + f"?platform={self.platform2.pk}"
+        for _ in range(5):
+            response = self.client.get(url)
+            self.assertRedirects(
+                response,
+                reverse("game:game-detail", kwargs={"pk": self.game2.pk}),
+                fetch_redirect_response=False,
+            )
+
+    def test_random_game_filter_without_matches_redirects_to_list(self):
+        genre = Genre.objects.create(name="Empty", description="No games")
+        response = self.client.get(self.random_game_url + f"?genre={genre.pk}")
+        self.assertRedirects(
+            response, reverse("game:game-list"), fetch_redirect_response=False
+        )
+
+    def test_deleted_game_is_not_picked(self):
+        self.client.get(self.random_game_url)
+        self.game1.delete()
+        for _ in range(5):
+            response = self.client.get(self.random_game_url)
+            self.assertTrue(
+                response["Location"].endswith(
+                    reverse("game:game-detail", kwargs={"pk": self.game2.pk})
+                )
+            )
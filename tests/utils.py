@@ -0,0 +1,23 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from game.query_budget import get_query_budget
+
+
+class QueryBudgetTestMixin:
+    def assertWithinQueryBudget(self, url, method="get", data=None):
+        budget = get_query_budget(resolve(url).func, method.upper())
+        self.assertIsNotNone(
+            budget, f"{method.upper()} {url} declares no query budget"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data or {})
+        self.assertLessEqual(
+            len(queries),
+            budget,
+            f"{method.upper()} {url} ran {len(queries)} queries, "
+            f"budget is {budget}:\n"
+            + "\n".join(query["sql"] for query in queries.captured_queries),
+        )
+        return response